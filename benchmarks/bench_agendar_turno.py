@@ -0,0 +1,64 @@
+"""
+Benchmark de Clinica.agendar_turno
+
+Mide el costo de agendar un turno a medida que crece la cantidad de turnos
+ya registrados en la clínica. Con la agenda por médico (búsqueda binaria de
+superposiciones) el costo por turno debería crecer solo en forma logarítmica
+entre 1k y 1M turnos existentes.
+
+Uso:
+    python -m benchmarks.bench_agendar_turno [escala ...]
+"""
+import sys
+import os
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modelos import Clinica, Paciente, Medico, Especialidad
+
+ESCALAS_POR_DEFECTO = [1_000, 10_000, 100_000, 1_000_000]
+MUESTRAS = 1_000
+UN_MINUTO = timedelta(minutes=1)
+DIAS_TODOS = ["lunes", "martes", "miércoles", "jueves", "viernes", "sábado", "domingo"]
+
+
+def crear_clinica(cantidad_turnos: int) -> Clinica:
+    """Crea una clínica con un paciente, un médico y la cantidad de turnos indicada"""
+    clinica = Clinica()
+    clinica.agregar_paciente(Paciente("Paciente Benchmark", "10000000", "01/01/1990"))
+    clinica.agregar_medico(
+        Medico("Dr. Benchmark", "1000", [Especialidad("Clínica Médica", DIAS_TODOS)])
+    )
+
+    inicio = datetime(2025, 1, 1, 0, 0)
+    for i in range(cantidad_turnos):
+        clinica.agendar_turno(
+            "10000000", "1000", "Clínica Médica", inicio + timedelta(minutes=i), UN_MINUTO
+        )
+    return clinica
+
+
+def medir(cantidad_turnos: int) -> float:
+    """Devuelve los microsegundos promedio por turno agendado"""
+    clinica = crear_clinica(cantidad_turnos)
+    inicio = datetime(2025, 1, 1) + timedelta(minutes=cantidad_turnos)
+
+    t0 = time.perf_counter()
+    for i in range(MUESTRAS):
+        clinica.agendar_turno(
+            "10000000", "1000", "Clínica Médica", inicio + timedelta(minutes=i), UN_MINUTO
+        )
+    return (time.perf_counter() - t0) / MUESTRAS * 1e6
+
+
+def main() -> None:
+    escalas = [int(arg) for arg in sys.argv[1:]] or ESCALAS_POR_DEFECTO
+    print(f"{'turnos existentes':>18} | {'µs por turno':>12}")
+    for escala in escalas:
+        print(f"{escala:>18} | {medir(escala):>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
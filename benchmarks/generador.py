@@ -0,0 +1,143 @@
+"""
+Generador determinístico de datos sintéticos para los benchmarks
+
+Con la misma semilla produce siempre los mismos pacientes, médicos, turnos y
+recetas. Los turnos generados son todos válidos: cada médico atiende la
+especialidad ese día, no se repite (matrícula, fecha y hora) y un paciente
+nunca tiene dos turnos a la misma hora.
+"""
+import random
+import sys
+import os
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, Optional, Set, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modelos import Paciente, Medico, Especialidad
+from modelos.especialidad import DIAS_SEMANA
+
+NOMBRES = [
+    "Juan", "María", "José", "Ana", "Luis", "Lucía", "Carlos", "Sofía", "Jorge", "Valentina",
+    "Pedro", "Camila", "Miguel", "Martina", "Diego", "Florencia", "Martín", "Julieta",
+    "Pablo", "Agustina", "Nicolás", "Micaela", "Federico", "Paula", "Tomás", "Carolina",
+]
+APELLIDOS = [
+    "González", "Rodríguez", "Gómez", "Fernández", "López", "Díaz", "Martínez", "Pérez",
+    "García", "Sánchez", "Romero", "Sosa", "Álvarez", "Torres", "Ruiz", "Ramírez",
+    "Flores", "Acosta", "Benítez", "Medina", "Suárez", "Herrera", "Aguirre", "Pereyra",
+    "Gutiérrez", "Giménez", "Molina", "Silva", "Castro", "Rojas", "Ortiz", "Núñez",
+]
+# Especialidades con un peso aproximado de cuántos médicos las atienden
+ESPECIALIDADES = [
+    ("Clínica Médica", 8), ("Pediatría", 6), ("Ginecología", 4), ("Cardiología", 3),
+    ("Traumatología", 3), ("Dermatología", 2), ("Oftalmología", 2), ("Neurología", 1),
+    ("Psiquiatría", 1), ("Endocrinología", 1), ("Otorrinolaringología", 1), ("Urología", 1),
+]
+MEDICAMENTOS = [
+    "Paracetamol", "Ibuprofeno", "Amoxicilina", "Omeprazol", "Enalapril", "Losartán",
+    "Metformina", "Atorvastatina", "Levotiroxina", "Salbutamol", "Diclofenac",
+    "Loratadina", "Clonazepam", "Sertralina", "Amlodipina", "Ácido Fólico",
+]
+DIAS_HABILES = DIAS_SEMANA[:5]
+
+# Primer lunes del calendario de turnos y grilla de horarios de cada día
+FECHA_INICIO = date(2026, 1, 5)
+HORA_INICIO = time(8, 0)
+MINUTOS_POR_TURNO = 30
+TURNOS_POR_DIA = 20
+
+
+class DatosSinteticos:
+    """Entidades y operaciones generadas para una escala"""
+    __slots__ = ('pacientes', 'medicos', 'turnos', 'recetas')
+
+    def __init__(self):
+        self.pacientes: List[Paciente] = []
+        self.medicos: List[Medico] = []
+        # (dni, matrícula, especialidad, fecha y hora) listos para agendar_turno
+        self.turnos: List[Tuple[str, str, str, datetime]] = []
+        # (dni, matrícula, medicamentos) listos para emitir_receta
+        self.recetas: List[Tuple[str, str, List[str]]] = []
+
+
+def generar_datos(pacientes: int, medicos: int, turnos: int, recetas: int,
+                  semilla: int = 42) -> DatosSinteticos:
+    """Genera los datos sintéticos de una escala a partir de la semilla"""
+    if medicos < 1 and (turnos or recetas):
+        raise ValueError("Se necesita al menos un médico para generar turnos o recetas")
+    if pacientes < 1 and (turnos or recetas):
+        raise ValueError("Se necesita al menos un paciente para generar turnos o recetas")
+
+    azar = random.Random(semilla)
+    datos = DatosSinteticos()
+
+    for i in range(pacientes):
+        nombre = f"{azar.choice(NOMBRES)} {azar.choice(APELLIDOS)} {azar.choice(APELLIDOS)}"
+        nacimiento = date(1930, 1, 1) + timedelta(days=azar.randrange(365 * 90))
+        datos.pacientes.append(
+            Paciente(nombre, str(10_000_000 + i), nacimiento.strftime("%d/%m/%Y"))
+        )
+
+    tipos = [tipo for tipo, _ in ESPECIALIDADES]
+    pesos = [peso for _, peso in ESPECIALIDADES]
+    for i in range(medicos):
+        especialidades = []
+        for tipo in dict.fromkeys(azar.choices(tipos, pesos, k=azar.choice((1, 1, 2)))):
+            dias = sorted(azar.sample(DIAS_HABILES, azar.randint(2, 3)), key=DIAS_SEMANA.index)
+            especialidades.append(Especialidad(tipo, dias))
+        nombre = f"Dr. {azar.choice(NOMBRES)} {azar.choice(APELLIDOS)}"
+        datos.medicos.append(Medico(nombre, str(100_000 + i), especialidades))
+
+    datos.turnos = _generar_turnos(azar, datos, turnos)
+
+    for _ in range(recetas):
+        paciente = azar.choice(datos.pacientes)
+        medico = azar.choice(datos.medicos)
+        medicamentos = azar.sample(MEDICAMENTOS, azar.randint(1, 3))
+        datos.recetas.append((paciente.obtener_dni(), medico.obtener_matricula(), medicamentos))
+    return datos
+
+
+def _generar_turnos(azar: random.Random, datos: DatosSinteticos,
+                    cantidad: int) -> List[Tuple[str, str, str, datetime]]:
+    """Reparte los turnos entre médicos avanzando un cursor por la agenda de cada uno"""
+    # Por médico: (día relativo a FECHA_INICIO, número de turno en el día)
+    cursores: Dict[str, Tuple[int, int]] = {}
+    ocupados: Set[Tuple[str, datetime]] = set()
+    dnis = [p.obtener_dni() for p in datos.pacientes]
+    turnos = []
+
+    for _ in range(cantidad):
+        medico = azar.choice(datos.medicos)
+        matricula = medico.obtener_matricula()
+        dia, numero = cursores.get(matricula, (0, 0))
+        especialidad = None
+        while especialidad is None:
+            if numero == TURNOS_POR_DIA:
+                dia, numero = dia + 1, 0
+            especialidad = _especialidad_del_dia(medico, FECHA_INICIO + timedelta(days=dia))
+            if especialidad is None:
+                dia, numero = dia + 1, 0
+        cursores[matricula] = (dia, numero + 1)
+
+        fecha_hora = (datetime.combine(FECHA_INICIO + timedelta(days=dia), HORA_INICIO)
+                      + timedelta(minutes=MINUTOS_POR_TURNO * numero))
+        dni = azar.choice(dnis)
+        for _ in range(len(dnis)):
+            if (dni, fecha_hora) not in ocupados:
+                break
+            dni = azar.choice(dnis)
+        else:
+            continue
+        ocupados.add((dni, fecha_hora))
+        turnos.append((dni, matricula, especialidad, fecha_hora))
+    return turnos
+
+
+def _especialidad_del_dia(medico: Medico, dia: date) -> Optional[str]:
+    """Primera especialidad que el médico atiende en el día, o None"""
+    for especialidad in medico.obtener_especialidades():
+        if especialidad.verificar_numero_dia(dia.weekday()):
+            return especialidad.obtener_especialidad()
+    return None
@@ -0,0 +1,76 @@
+"""
+Reporte de memoria por entidad
+
+Usa tracemalloc para medir cuántos bytes ocupa en promedio cada instancia de
+las clases del modelo (sin contar los objetos que referencia y que se
+comparten, como el paciente y el médico de un turno).
+
+Resultados de referencia (CPython 3.11, 100k instancias):
+
+    Paciente          56
+    Medico           336   (incluye la lista de especialidades y el
+                            diccionario de máscaras por especialidad)
+    Especialidad     112
+    Turno             80
+    Receta           120
+    HistoriaClinica   72   (vacía: turnos, recetas y textos memorizados
+                            se crean con el primer uso)
+
+Uso:
+    python -m benchmarks.memoria_entidades [cantidad]
+"""
+import sys
+import os
+import tracemalloc
+from datetime import datetime
+from typing import Callable, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modelos import Paciente, Medico, Especialidad, Turno, Receta, HistoriaClinica
+
+CANTIDAD_POR_DEFECTO = 100_000
+
+
+def medir(fabrica: Callable[[int], object], cantidad: int) -> float:
+    """Devuelve los bytes promedio retenidos por cada objeto creado por la fábrica"""
+    # Los argumentos se construyen antes de medir para no contarlos
+    tracemalloc.start()
+    inicio, _ = tracemalloc.get_traced_memory()
+    objetos: List[object] = [fabrica(i) for i in range(cantidad)]
+    fin, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Descontar la lista que retiene los objetos
+    neto = fin - inicio - sys.getsizeof(objetos)
+    del objetos
+    return neto / cantidad
+
+
+def main() -> None:
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else CANTIDAD_POR_DEFECTO
+
+    nombre, dni, fecha_nac = "Juan Pérez", "12345678", "01/01/1990"
+    dias = ["lunes", "miércoles"]
+    especialidad = Especialidad("Pediatría", dias)
+    paciente = Paciente(nombre, dni, fecha_nac)
+    medico = Medico("Dr. García", "54321", [especialidad])
+    fecha_hora = datetime(2025, 12, 8, 14, 30)
+    medicamentos = ["Paracetamol", "Ibuprofeno"]
+
+    fabricas = {
+        "Paciente":        lambda i: Paciente(nombre, dni, fecha_nac),
+        "Medico":          lambda i: Medico("Dr. García", "54321", [especialidad]),
+        "Especialidad":    lambda i: Especialidad("Pediatría", dias),
+        "Turno":           lambda i: Turno(paciente, medico, fecha_hora, "Pediatría"),
+        "Receta":          lambda i: Receta(paciente, medico, medicamentos, fecha_hora),
+        "HistoriaClinica": lambda i: HistoriaClinica(paciente),
+    }
+
+    print(f"{'entidad':>16} | {'bytes por instancia':>19}")
+    for entidad, fabrica in fabricas.items():
+        print(f"{entidad:>16} | {medir(fabrica, cantidad):>19.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+"""
+Suite de benchmarks de la Clinica
+
+Genera datos sintéticos determinísticos (ver benchmarks.generador) para
+varias escalas y mide:
+- alta de pacientes y médicos (arranque de una clínica en memoria)
+- agendar_turno, emitir_receta
+- obtener_historia_clinica_por_dni (con y sin renderizar el texto)
+- listados paginados y búsqueda por nombre
+- carga completa de la clínica desde SQLite y desde el journal
+
+Los resultados se guardan en JSON para compararlos con una corrida anterior;
+con --comparar el proceso termina con código 1 si alguna operación empeoró
+más que la tolerancia.
+
+Uso:
+    python -m benchmarks.suite [--escalas chica mediana] [--salida resultados.json]
+                               [--comparar base.json] [--tolerancia 0.25]
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modelos import Clinica
+from persistencia import AlmacenSQLite, AlmacenJournal
+from benchmarks.generador import DatosSinteticos, generar_datos
+
+# Escala -> (pacientes, médicos, turnos, recetas)
+ESCALAS: Dict[str, tuple] = {
+    "chica":   (1_000,    50,    5_000,   2_000),
+    "mediana": (10_000,   200,   50_000,  20_000),
+    "grande":  (100_000,  1_000, 500_000, 200_000),
+}
+ESCALAS_POR_DEFECTO = ["chica", "mediana"]
+# Cantidad de consultas de lectura que se cronometran por escala
+CONSULTAS = 1_000
+TAMANIO_PAGINA = 50
+# Porcentaje de turnos que se cancelan al final de cada escala
+PORCENTAJE_CANCELADOS = 15
+SEMILLA = 42
+
+
+class Resultado:
+    """Tiempo total de una operación repetida `operaciones` veces en una escala"""
+    __slots__ = ('escala', 'operacion', 'operaciones', 'segundos')
+
+    def __init__(self, escala: str, operacion: str, operaciones: int, segundos: float):
+        self.escala = escala
+        self.operacion = operacion
+        self.operaciones = operaciones
+        self.segundos = segundos
+
+    def microsegundos_por_operacion(self) -> float:
+        return self.segundos / max(self.operaciones, 1) * 1e6
+
+    def a_dict(self) -> Dict[str, Any]:
+        return {
+            "escala": self.escala,
+            "operacion": self.operacion,
+            "operaciones": self.operaciones,
+            "segundos": round(self.segundos, 6),
+            "us_por_operacion": round(self.microsegundos_por_operacion(), 3),
+        }
+
+
+def cronometrar(funcion: Callable[[], Any]) -> float:
+    """Devuelve los segundos que tarda la función, sin recolecciones de basura en el medio"""
+    gc.collect()
+    gc.disable()
+    try:
+        inicio = time.perf_counter()
+        funcion()
+        return time.perf_counter() - inicio
+    finally:
+        gc.enable()
+
+
+def poblar(clinica: Clinica, datos: DatosSinteticos) -> None:
+    """Registra pacientes y médicos de los datos en la clínica"""
+    for paciente in datos.pacientes:
+        clinica.agregar_paciente(paciente)
+    for medico in datos.medicos:
+        clinica.agregar_medico(medico)
+
+
+def agendar(clinica: Clinica, datos: DatosSinteticos) -> None:
+    for dni, matricula, especialidad, fecha_hora in datos.turnos:
+        clinica.agendar_turno(dni, matricula, especialidad, fecha_hora)
+
+
+def emitir(clinica: Clinica, datos: DatosSinteticos) -> None:
+    for dni, matricula, medicamentos in datos.recetas:
+        clinica.emitir_receta(dni, matricula, medicamentos)
+
+
+def medir_escala(escala: str, pacientes: int, medicos: int, turnos: int, recetas: int,
+                 semilla: int = SEMILLA, persistencia: bool = True) -> List[Resultado]:
+    """Corre todas las mediciones de una escala y devuelve sus resultados"""
+    resultados: List[Resultado] = []
+
+    def registrar(operacion: str, operaciones: int, funcion: Callable[[], Any]) -> None:
+        resultados.append(Resultado(escala, operacion, operaciones, cronometrar(funcion)))
+
+    # Cada escritura usa entidades nuevas: los médicos guardan observadores de la clínica
+    datos = generar_datos(pacientes, medicos, turnos, recetas, semilla)
+    clinica = Clinica()
+    registrar("alta_pacientes_y_medicos", pacientes + medicos, lambda: poblar(clinica, datos))
+    registrar("agendar_turno", len(datos.turnos), lambda: agendar(clinica, datos))
+    registrar("emitir_receta", len(datos.recetas), lambda: emitir(clinica, datos))
+
+    azar = random.Random(semilla)
+    dnis = [azar.choice(datos.pacientes).obtener_dni() for _ in range(CONSULTAS)]
+    offsets = [azar.randrange(max(pacientes - TAMANIO_PAGINA, 1)) for _ in range(CONSULTAS)]
+    textos = [azar.choice(datos.pacientes).obtener_nombre().split()[1][:4] for _ in range(CONSULTAS)]
+
+    registrar("obtener_historia_clinica_por_dni", CONSULTAS,
+              lambda: [clinica.obtener_historia_clinica_por_dni(dni) for dni in dnis])
+    registrar("historia_clinica_texto", CONSULTAS,
+              lambda: [str(clinica.obtener_historia_clinica_por_dni(dni)) for dni in dnis])
+    registrar("obtener_pacientes_pagina", CONSULTAS,
+              lambda: [list(clinica.obtener_pacientes(o, TAMANIO_PAGINA)) for o in offsets])
+    registrar("obtener_turnos_pagina", CONSULTAS,
+              lambda: [list(clinica.obtener_turnos(o, TAMANIO_PAGINA)) for o in offsets])
+    registrar("buscar_pacientes", CONSULTAS,
+              lambda: [clinica.buscar_pacientes(texto, 20) for texto in textos])
+
+    # Alrededor del 15% de los turnos se cancela
+    ids = [turno.obtener_id() for turno in clinica.obtener_turnos()]
+    cancelados = azar.sample(ids, len(ids) * PORCENTAJE_CANCELADOS // 100)
+    registrar("cancelar_turno", len(cancelados),
+              lambda: [clinica.cancelar_turno(id_turno) for id_turno in cancelados])
+    del clinica, datos
+
+    if persistencia:
+        total = pacientes + medicos + turnos + recetas
+        with tempfile.TemporaryDirectory() as directorio:
+            for nombre, abrir in (
+                ("carga_sqlite", lambda: AlmacenSQLite(os.path.join(directorio, "clinica.db"))),
+                ("carga_journal", lambda: AlmacenJournal(os.path.join(directorio, "journal"))),
+            ):
+                guardar_en_almacen(abrir(), generar_datos(pacientes, medicos, turnos, recetas, semilla))
+                almacen = abrir()
+                registrar(nombre, total, lambda: Clinica(almacen))
+                almacen.cerrar()
+    return resultados
+
+
+def guardar_en_almacen(almacen, datos: DatosSinteticos) -> None:
+    """Persiste los datos en el almacén en una sola transacción y lo cierra"""
+    clinica = Clinica(almacen)
+    with almacen.transaccion():
+        poblar(clinica, datos)
+        agendar(clinica, datos)
+        emitir(clinica, datos)
+    almacen.cerrar()
+
+
+def informe(resultados: List[Resultado], semilla: int) -> Dict[str, Any]:
+    """Arma el documento JSON de una corrida"""
+    return {
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "semilla": semilla,
+        "resultados": [r.a_dict() for r in resultados],
+    }
+
+
+def comparar(actual: Dict[str, Any], base: Dict[str, Any], tolerancia: float) -> List[str]:
+    """Imprime la relación actual/base por operación y devuelve las que empeoraron"""
+    anteriores = {
+        (r["escala"], r["operacion"]): r["us_por_operacion"] for r in base["resultados"]
+    }
+    regresiones = []
+    print(f"\n{'escala':>8} | {'operación':<34} | {'base µs':>10} | {'actual µs':>10} | {'relación':>8}")
+    for r in actual["resultados"]:
+        clave = (r["escala"], r["operacion"])
+        if clave not in anteriores or anteriores[clave] == 0:
+            continue
+        relacion = r["us_por_operacion"] / anteriores[clave]
+        marca = ""
+        if relacion > 1 + tolerancia:
+            marca = "  <- regresión"
+            regresiones.append(f"{clave[0]}/{clave[1]}")
+        print(f"{clave[0]:>8} | {clave[1]:<34} | {anteriores[clave]:>10.2f} | "
+              f"{r['us_por_operacion']:>10.2f} | {relacion:>8.2f}{marca}")
+    return regresiones
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks reproducibles de la Clinica")
+    parser.add_argument("--escalas", nargs="+", choices=list(ESCALAS), default=ESCALAS_POR_DEFECTO)
+    parser.add_argument("--semilla", type=int, default=SEMILLA)
+    parser.add_argument("--salida", metavar="ARCHIVO", default="resultados_benchmark.json",
+                        help="archivo JSON donde guardar los resultados")
+    parser.add_argument("--comparar", metavar="ARCHIVO",
+                        help="resultados de una corrida anterior contra los cuales comparar")
+    parser.add_argument("--tolerancia", type=float, default=0.25,
+                        help="empeoramiento relativo admitido antes de marcar una regresión")
+    parser.add_argument("--sin-persistencia", action="store_true",
+                        help="omitir las mediciones de carga desde SQLite y el journal")
+    args = parser.parse_args(argv)
+
+    resultados: List[Resultado] = []
+    print(f"{'escala':>8} | {'operación':<34} | {'operaciones':>11} | {'µs por op':>10}")
+    for escala in args.escalas:
+        for resultado in medir_escala(escala, *ESCALAS[escala], semilla=args.semilla,
+                                      persistencia=not args.sin_persistencia):
+            resultados.append(resultado)
+            print(f"{escala:>8} | {resultado.operacion:<34} | {resultado.operaciones:>11} | "
+                  f"{resultado.microsegundos_por_operacion():>10.2f}")
+
+    documento = informe(resultados, args.semilla)
+    with open(args.salida, "w", encoding="utf-8") as archivo:
+        json.dump(documento, archivo, ensure_ascii=False, indent=2)
+    print(f"\nResultados guardados en {args.salida}")
+
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as archivo:
+            regresiones = comparar(documento, json.load(archivo), args.tolerancia)
+        if regresiones:
+            print(f"\nRegresiones: {', '.join(regresiones)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
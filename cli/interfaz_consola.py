@@ -1,5 +1,7 @@
 # cli/interfaz_consola.py
-from datetime import datetime
+import sys
+from contextlib import nullcontext
+from datetime import datetime, timedelta
 from modelos.clinica      import Clinica
 from modelos.paciente     import Paciente
 from modelos.medico       import Medico
@@ -8,14 +10,15 @@ from excepciones.excepciones_clinica import (
     PacienteNoEncontradoException,
     MedicoNoDisponibleException,
     TurnoOcupadoException,
+    TurnoNoEncontradoException,
     RecetaInvalidaException,
 )
 
 class CLI:
     """Interfaz de línea de comandos"""
 
-    def __init__(self) -> None:
-        self.clinica = Clinica()
+    def __init__(self, clinica: Clinica | None = None) -> None:
+        self.clinica = clinica if clinica is not None else Clinica()
 
     # ---------------------- MENÚ ----------------------
     def mostrar_menu(self) -> None:
@@ -30,6 +33,9 @@ class CLI:
             "7) Ver todos los turnos",
             "8) Ver todos los pacientes",
             "9) Ver todos los médicos",
+            "10) Cancelar turno",
+            "11) Reprogramar turno",
+            "12) Anotar en lista de espera",
             "0) Salir",
             sep="\n",
         )
@@ -40,7 +46,7 @@ class CLI:
             opcion = input("\nSeleccione una opción: ").strip()
 
             if not opcion.isdigit():
-                print("\nDebe ingresar un número (0-9). Intente nuevamente.")
+                print("\nDebe ingresar un número (0-12). Intente nuevamente.")
                 continue
 
             match opcion:
@@ -54,6 +60,11 @@ class CLI:
                 case "7":  self.ver_todos_turnos()
                 case "8":  self.ver_todos_pacientes()
                 case "9":  self.ver_todos_medicos()
+                case "10": self.cancelar_turno()
+                case "11": self.reprogramar_turno()
+                case "12": self.agregar_a_lista_espera()
+                # Opción oculta para diagnóstico: no figura en el menú
+                case "99": self.ver_metricas()
                 case _:    print("\nOpción inválida. Intente nuevamente.")
 
     # ------------------ PACIENTES ------------------
@@ -110,13 +121,15 @@ class CLI:
 
             fecha_str = input("Fecha del turno (dd/mm/aaaa): ").strip()
             hora_str  = input("Horario del turno (hora:minutos): ").strip()
+            duracion_str = input("Duración en minutos (Enter = 30): ").strip()
 
             fecha_hora = datetime.strptime(f"{fecha_str} {hora_str}", "%d/%m/%Y %H:%M")
-            self.clinica.agendar_turno(dni, matricula, especialidad, fecha_hora)
-            print("\nTurno agendado exitosamente")
+            duracion = timedelta(minutes=int(duracion_str)) if duracion_str else None
+            turno = self.clinica.agendar_turno(dni, matricula, especialidad, fecha_hora, duracion)
+            print(f"\nTurno agendado exitosamente (id {turno.obtener_id()})")
 
         except ValueError:
-            print("\nFormato incorrecto. Use dd/mm/aaaa y hora:minutos")
+            print("\nFormato incorrecto. Use dd/mm/aaaa, hora:minutos y una duración positiva")
         except (
             PacienteNoEncontradoException,
             MedicoNoDisponibleException,
@@ -124,6 +137,56 @@ class CLI:
         ) as e:
             print(f"\nError al agendar turno: {e}")
 
+    def cancelar_turno(self) -> None:
+        print("\n--- Cancelar Turno ---")
+        try:
+            id_turno = int(input("Id del turno: ").strip())
+            turno = self.clinica.cancelar_turno(id_turno)
+            print(f"\nTurno cancelado: {turno}")
+        except ValueError:
+            print("\nEl id del turno debe ser un número")
+        except TurnoNoEncontradoException as e:
+            print(f"\nError al cancelar turno: {e}")
+
+    def reprogramar_turno(self) -> None:
+        print("\n--- Reprogramar Turno ---")
+        try:
+            id_turno = int(input("Id del turno: ").strip())
+            fecha_str = input("Nueva fecha (dd/mm/aaaa): ").strip()
+            hora_str  = input("Nuevo horario (hora:minutos): ").strip()
+            duracion_str = input("Duración en minutos (Enter = la actual): ").strip()
+
+            fecha_hora = datetime.strptime(f"{fecha_str} {hora_str}", "%d/%m/%Y %H:%M")
+            duracion = timedelta(minutes=int(duracion_str)) if duracion_str else None
+            turno = self.clinica.reprogramar_turno(id_turno, fecha_hora, duracion)
+            print(f"\nTurno reprogramado: {turno}")
+
+        except ValueError:
+            print("\nFormato incorrecto. Use un id numérico, dd/mm/aaaa, hora:minutos y una duración positiva")
+        except (
+            TurnoNoEncontradoException,
+            MedicoNoDisponibleException,
+            TurnoOcupadoException,
+        ) as e:
+            print(f"\nError al reprogramar turno: {e}")
+
+    def agregar_a_lista_espera(self) -> None:
+        print("\n--- Anotar en Lista de Espera ---")
+        try:
+            dni          = input("DNI del paciente: ").strip()
+            especialidad = input("Especialidad: ").strip()
+            matricula    = input("Matrícula del médico (Enter = cualquiera): ").strip() or None
+            prioridad_str = input("Prioridad (Enter = 0; mayor número, más urgente): ").strip()
+
+            prioridad = int(prioridad_str) if prioridad_str else 0
+            solicitud = self.clinica.agregar_a_lista_espera(dni, especialidad, matricula, prioridad)
+            print(f"\nPaciente anotado en la lista de espera (solicitud {solicitud.obtener_id()})")
+
+        except ValueError:
+            print("\nLa prioridad debe ser un número entero")
+        except (PacienteNoEncontradoException, MedicoNoDisponibleException) as e:
+            print(f"\nError al anotar en la lista de espera: {e}")
+
     # ------------ ESPECIALIDAD A MÉDICO -------------
     def agregar_especialidad(self) -> None:
         print("\n--- Agregar Especialidad a Médico ---")
@@ -176,7 +239,11 @@ class CLI:
         try:
             dni = input("DNI del paciente: ").strip()
             historia = self.clinica.obtener_historia_clinica_por_dni(dni)
-            print(f"\n{historia}")
+            print()
+            metricas = self.clinica.obtener_metricas()
+            with metricas.medir("historia.escribir") if metricas else nullcontext():
+                historia.escribir(sys.stdout)
+            print()
         except PacienteNoEncontradoException as e:
             print(f"\nError: {e}")
 
@@ -184,8 +251,8 @@ class CLI:
         print("\n--- Todos los Turnos ---")
         turnos = self.clinica.obtener_turnos()
         if turnos:
-            for i, t in enumerate(turnos, 1):
-                print(f"{i}. {t}")
+            for t in turnos:
+                print(f"{t.obtener_id()}. {t}")
         else:
             print("No hay turnos agendados")
 
@@ -205,4 +272,15 @@ class CLI:
             for i, m in enumerate(medicos, 1):
                 print(f"{i}. {m}")
         else:
-            print("No hay médicos registrados")
\ No newline at end of file
+            print("No hay médicos registrados")
+
+    # ------------------ DIAGNÓSTICO ------------------
+    def ver_metricas(self) -> None:
+        """Muestra las métricas de la clínica; si estaban deshabilitadas, las habilita"""
+        print("\n--- Métricas ---")
+        metricas = self.clinica.obtener_metricas()
+        if metricas is None:
+            self.clinica.habilitar_metricas()
+            print("Métricas habilitadas. Vuelva a elegir la opción para ver los resultados.")
+        else:
+            print(metricas)
@@ -2,6 +2,7 @@ from .excepciones_clinica import (
     PacienteNoEncontradoException,
     MedicoNoDisponibleException,
     TurnoOcupadoException,
+    TurnoNoEncontradoException,
     RecetaInvalidaException
 )
 
@@ -9,5 +10,6 @@ __all__ = [
     'PacienteNoEncontradoException',
     'MedicoNoDisponibleException',
     'TurnoOcupadoException',
+    'TurnoNoEncontradoException',
     'RecetaInvalidaException'
 ]
\ No newline at end of file
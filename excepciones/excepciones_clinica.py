@@ -14,6 +14,10 @@ class TurnoOcupadoException(Exception):
     """Se lanza cuando se intenta agendar un turno en un horario ya ocupado"""
     pass
 
+class TurnoNoEncontradoException(Exception):
+    """Se lanza cuando no existe un turno con el id indicado"""
+    pass
+
 class RecetaInvalidaException(Exception):
     """Se lanza cuando se intenta emitir una receta inválida"""
     pass
\ No newline at end of file
@@ -4,6 +4,8 @@ Sistema de Gestión para Clínica Médica
 Punto de entrada principal del programa
 """
 
+import argparse
+import asyncio
 import sys
 import os
 
@@ -11,15 +13,136 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from cli.interfaz_consola import CLI
+from modelos.clinica import Clinica
+from persistencia import AlmacenSQLite, AlmacenJournal, importar_pacientes, importar_medicos
+from servicio import ServidorClinica, ClinicaParticionada, ejecutar_lote
+
+async def servir(clinica: Clinica, direccion: str | None, ruta_unix: str | None) -> None:
+    """Atiende comandos JSON por red hasta que se interrumpa el proceso"""
+    servidor = ServidorClinica(clinica)
+    if ruta_unix:
+        await servidor.iniciar_unix(ruta_unix)
+        print(f"Escuchando en {ruta_unix}")
+    else:
+        host, _, puerto = direccion.rpartition(":")
+        puerto = await servidor.iniciar_tcp(host or "127.0.0.1", int(puerto))
+        print(f"Escuchando en {host or '127.0.0.1'}:{puerto}")
+    await servidor.servir_para_siempre()
+
+def lote(clinica: Clinica | ClinicaParticionada, ruta: str, detener_en_error: bool) -> int:
+    """Ejecuta un archivo de comandos JSON y devuelve el código de salida del proceso"""
+    entrada = sys.stdin if ruta == "-" else open(ruta, encoding="utf-8")
+    try:
+        ejecutados, errores = ejecutar_lote(clinica, entrada, sys.stdout, detener_en_error)
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+    print(f"{ejecutados} comandos ejecutados, {errores} con error", file=sys.stderr)
+    return 1 if errores else 0
 
 def main():
     """Función principal que ejecuta el sistema"""
-    print("=== Sistema de Gestión de Clínica Médica ===")
-    print("Bienvenido al sistema de gestión")
-    
-    # Crear y ejecutar la interfaz de consola
-    interfaz = CLI()
-    interfaz.ejecutar()
+    parser = argparse.ArgumentParser(description="Sistema de Gestión de Clínica Médica")
+    persistencia = parser.add_mutually_exclusive_group()
+    persistencia.add_argument(
+        "--db",
+        metavar="ARCHIVO",
+        help="archivo SQLite donde persistir la clínica (por defecto, solo en memoria)",
+    )
+    persistencia.add_argument(
+        "--journal",
+        metavar="DIRECTORIO",
+        help="carpeta del registro de operaciones e instantáneas de la clínica",
+    )
+    servicio = parser.add_mutually_exclusive_group()
+    servicio.add_argument(
+        "--servir",
+        metavar="[HOST:]PUERTO",
+        help="en lugar del menú, atender comandos JSON por TCP (ej: 127.0.0.1:8765)",
+    )
+    servicio.add_argument(
+        "--unix",
+        metavar="RUTA",
+        help="en lugar del menú, atender comandos JSON en un socket Unix",
+    )
+    servicio.add_argument(
+        "--lote",
+        metavar="ARCHIVO",
+        help="en lugar del menú, ejecutar los comandos JSON (uno por línea) del archivo; '-' lee de stdin",
+    )
+    parser.add_argument(
+        "--detener-en-error",
+        action="store_true",
+        help="con --lote, detenerse en el primer comando que falle",
+    )
+    parser.add_argument(
+        "--particiones",
+        metavar="N",
+        type=int,
+        help="con --lote, repartir la clínica por matrícula entre N procesos (sin persistencia)",
+    )
+    parser.add_argument(
+        "--importar-pacientes",
+        metavar="ARCHIVO",
+        help="importar pacientes desde un CSV o JSONL y salir (los rechazos van a ARCHIVO.rechazos)",
+    )
+    parser.add_argument(
+        "--importar-medicos",
+        metavar="ARCHIVO",
+        help="importar médicos con sus especialidades desde un CSV o JSONL y salir",
+    )
+    parser.add_argument(
+        "--metricas",
+        action="store_true",
+        help="medir llamadas, errores y latencias desde el arranque",
+    )
+    args = parser.parse_args()
+
+    importar = args.importar_pacientes or args.importar_medicos
+    if importar and (args.servir or args.unix or args.lote):
+        parser.error("la importación no se puede combinar con --servir, --unix ni --lote")
+    if args.particiones is not None:
+        if not args.lote:
+            parser.error("--particiones solo se puede usar con --lote")
+        if args.db or args.journal or args.metricas:
+            parser.error("--particiones no se puede combinar con --db, --journal ni --metricas")
+        if args.particiones < 1:
+            parser.error("--particiones debe ser mayor que cero")
+
+    if not args.lote:
+        # En modo por lotes stdout lleva solo las respuestas JSON
+        print("=== Sistema de Gestión de Clínica Médica ===")
+        print("Bienvenido al sistema de gestión")
+
+    almacen = None
+    if args.db:
+        almacen = AlmacenSQLite(args.db)
+    elif args.journal:
+        almacen = AlmacenJournal(args.journal)
+    try:
+        if args.servir or args.unix:
+            asyncio.run(servir(Clinica(almacen, metricas=args.metricas), args.servir, args.unix))
+        elif importar:
+            clinica = Clinica(almacen, metricas=args.metricas)
+            # Primero los médicos, por si el archivo de pacientes es el más largo
+            for ruta, importador in ((args.importar_medicos, importar_medicos),
+                                     (args.importar_pacientes, importar_pacientes)):
+                if ruta:
+                    print(f"{ruta}: {importador(clinica, ruta)}")
+        elif args.lote and args.particiones:
+            with ClinicaParticionada(args.particiones) as clinica:
+                return lote(clinica, args.lote, args.detener_en_error)
+        elif args.lote:
+            return lote(Clinica(almacen, metricas=args.metricas), args.lote, args.detener_en_error)
+        else:
+            # Crear y ejecutar la interfaz de consola
+            interfaz = CLI(Clinica(almacen, metricas=args.metricas))
+            interfaz.ejecutar()
+    except KeyboardInterrupt:
+        print("\n¡Hasta luego!")
+    finally:
+        if almacen is not None:
+            almacen.cerrar()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
@@ -4,6 +4,13 @@ from .especialidad import Especialidad
 from .turno import Turno
 from .receta import Receta
 from .historia_clinica import HistoriaClinica
+from .agenda import Agenda
+from .vista import VistaSecuencia
+from .lista_vigentes import ListaVigentes
+from .catalogo_medicamentos import CatalogoMedicamentos
+from .indice_nombres import IndiceNombres
+from .metricas import Metricas
+from .lista_espera import ListaEspera, SolicitudEspera
 from .clinica import Clinica
 
 __all__ = [
@@ -13,5 +20,13 @@ __all__ = [
     'Turno',
     'Receta',
     'HistoriaClinica',
+    'Agenda',
+    'VistaSecuencia',
+    'ListaVigentes',
+    'CatalogoMedicamentos',
+    'IndiceNombres',
+    'Metricas',
+    'ListaEspera',
+    'SolicitudEspera',
     'Clinica'
 ]
\ No newline at end of file
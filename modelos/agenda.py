@@ -0,0 +1,106 @@
+"""
+Clase Agenda - Representa los turnos de un médico (o de un paciente)
+ordenados por fecha y hora
+"""
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import List, Optional, Tuple
+from .turno import Turno
+
+class Agenda:
+    # Atributos fijos: evita el __dict__ por instancia
+    __slots__ = ('__fechas', '__turnos')
+
+    def __init__(self):
+        """
+        Constructor de la clase Agenda
+
+        Mantiene dos listas paralelas ordenadas por fecha y hora: las fechas
+        (usadas como claves de búsqueda binaria) y los turnos correspondientes.
+        Como la Clinica no admite turnos superpuestos de un mismo médico ni de
+        un mismo paciente, los intervalos [inicio, fin) quedan disjuntos y sus
+        fines también ordenados, lo que permite detectar superposiciones y huecos con búsqueda binaria.
+        """
+        self.__fechas: List[datetime] = []
+        self.__turnos: List[Turno] = []
+
+    def agregar_turno(self, turno: Turno):
+        """Inserta un turno manteniendo el orden cronológico"""
+        if not isinstance(turno, Turno):
+            raise TypeError("Se esperaba un objeto de tipo Turno")
+
+        fecha_hora = turno.obtener_fecha_hora()
+        posicion = bisect_right(self.__fechas, fecha_hora)
+        self.__fechas.insert(posicion, fecha_hora)
+        self.__turnos.insert(posicion, turno)
+
+    def quitar_turno(self, turno: Turno):
+        """Quita el turno (el mismo objeto) ubicándolo por búsqueda binaria"""
+        fecha_hora = turno.obtener_fecha_hora()
+        posicion = bisect_left(self.__fechas, fecha_hora)
+        while posicion < len(self.__fechas) and self.__fechas[posicion] == fecha_hora:
+            if self.__turnos[posicion] is turno:
+                del self.__fechas[posicion]
+                del self.__turnos[posicion]
+                return
+            posicion += 1
+        raise ValueError("El turno no está en la agenda")
+
+    def obtener_turnos_entre(self, desde: Optional[datetime] = None,
+                             hasta: Optional[datetime] = None,
+                             limite: Optional[int] = None) -> List[Turno]:
+        """
+        Devuelve los turnos con fecha y hora en el intervalo [desde, hasta)
+
+        Args:
+            desde: Inicio del intervalo (inclusive). None indica sin límite inferior
+            hasta: Fin del intervalo (exclusivo). None indica sin límite superior
+            limite: Cantidad máxima de turnos a devolver (los primeros). None = todos
+        """
+        inicio = 0 if desde is None else bisect_left(self.__fechas, desde)
+        fin = len(self.__fechas) if hasta is None else bisect_left(self.__fechas, hasta)
+        if limite is not None:
+            fin = min(fin, inicio + max(limite, 0))
+        return self.__turnos[inicio:fin]
+
+    def obtener_superposicion(self, inicio: datetime, fin: datetime,
+                              ignorar: Optional[Turno] = None) -> Optional[Turno]:
+        """
+        Devuelve un turno que se superpone con [inicio, fin), o None, en O(log n)
+
+        Args:
+            ignorar: Turno que no cuenta como superposición (ej: el que se reprograma)
+        """
+        # El último turno que empieza antes de `fin` es el que termina más tarde
+        posicion = bisect_left(self.__fechas, fin)
+        if posicion and self.__turnos[posicion - 1] is ignorar:
+            # Como los intervalos son disjuntos, el candidato pasa a ser el anterior
+            posicion -= 1
+        if posicion and self.__turnos[posicion - 1].obtener_fin() > inicio:
+            return self.__turnos[posicion - 1]
+        return None
+
+    def obtener_huecos(self, desde: datetime, hasta: datetime) -> List[Tuple[datetime, datetime]]:
+        """
+        Devuelve los intervalos libres (inicio, fin) dentro de [desde, hasta),
+        en orden, en O(log n + k) siendo k la cantidad de turnos del intervalo.
+        """
+        huecos = []
+        libre_desde = desde
+        posicion = bisect_right(self.__fechas, desde)
+        if posicion:
+            # El turno anterior puede seguir en curso al comienzo del intervalo
+            posicion -= 1
+        while posicion < len(self.__turnos) and self.__fechas[posicion] < hasta:
+            turno = self.__turnos[posicion]
+            if self.__fechas[posicion] > libre_desde:
+                huecos.append((libre_desde, self.__fechas[posicion]))
+            libre_desde = max(libre_desde, turno.obtener_fin())
+            posicion += 1
+        if libre_desde < hasta:
+            huecos.append((libre_desde, hasta))
+        return huecos
+
+    def __len__(self) -> int:
+        """Devuelve la cantidad de turnos en la agenda"""
+        return len(self.__turnos)
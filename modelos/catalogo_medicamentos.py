@@ -0,0 +1,86 @@
+"""
+Clase CatalogoMedicamentos - Catálogo normalizado de medicamentos con un índice
+cronológico de las recetas que incluyen cada uno
+"""
+import sys
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Dict, List, Optional
+from .receta import Receta
+from .normalizacion import normalizar_texto
+
+class CatalogoMedicamentos:
+    # Atributos fijos: evita el __dict__ por instancia
+    __slots__ = ('__nombres', '__fechas', '__recetas')
+    
+    def __init__(self):
+        """
+        Constructor de la clase CatalogoMedicamentos
+        
+        Cada medicamento se identifica por su nombre normalizado (sin tildes,
+        mayúsculas ni espacios extra) y se guarda una única cadena canónica,
+        la primera grafía registrada. Por cada medicamento se mantienen dos
+        listas paralelas ordenadas por fecha: fechas y recetas.
+        """
+        self.__nombres: Dict[str, str] = {}
+        self.__fechas: Dict[str, List[datetime]] = {}
+        self.__recetas: Dict[str, List[Receta]] = {}
+    
+    def registrar(self, nombre: str) -> str:
+        """Devuelve el nombre canónico del medicamento, registrándolo si es nuevo"""
+        clave = normalizar_texto(nombre)
+        if not clave:
+            raise ValueError("El nombre del medicamento no puede estar vacío")
+        canonico = self.__nombres.get(clave)
+        if canonico is None:
+            canonico = sys.intern(nombre.strip())
+            self.__nombres[clave] = canonico
+        return canonico
+    
+    def obtener_nombre_canonico(self, nombre: str) -> Optional[str]:
+        """Devuelve el nombre canónico o None si el medicamento no está en el catálogo"""
+        return self.__nombres.get(normalizar_texto(nombre))
+    
+    def indexar_receta(self, receta: Receta):
+        """Agrega la receta al índice de cada uno de sus medicamentos"""
+        if not isinstance(receta, Receta):
+            raise TypeError("Se esperaba un objeto de tipo Receta")
+        
+        fecha = receta.obtener_fecha()
+        claves = {normalizar_texto(nombre): nombre for nombre in receta.obtener_medicamentos()}
+        for clave, nombre in claves.items():
+            self.__nombres.setdefault(clave, sys.intern(nombre))
+            fechas = self.__fechas.setdefault(clave, [])
+            recetas = self.__recetas.setdefault(clave, [])
+            # Las recetas suelen llegar en orden: agregar al final es O(1)
+            if not fechas or fechas[-1] <= fecha:
+                fechas.append(fecha)
+                recetas.append(receta)
+            else:
+                posicion = bisect_right(fechas, fecha)
+                fechas.insert(posicion, fecha)
+                recetas.insert(posicion, receta)
+    
+    def obtener_recetas(self, nombre: str, desde: Optional[datetime] = None,
+                        hasta: Optional[datetime] = None) -> List[Receta]:
+        """
+        Devuelve las recetas que incluyen el medicamento con fecha en
+        [desde, hasta), ordenadas por fecha, en O(log n + k).
+        """
+        clave = normalizar_texto(nombre)
+        fechas = self.__fechas.get(clave)
+        if not fechas:
+            return []
+        inicio = 0 if desde is None else bisect_left(fechas, desde)
+        fin = len(fechas) if hasta is None else bisect_left(fechas, hasta)
+        return self.__recetas[clave][inicio:fin]
+    
+    def nombres(self) -> List[str]:
+        """Devuelve los nombres canónicos registrados, en orden alfabético"""
+        return sorted(self.__nombres.values(), key=normalizar_texto)
+    
+    def __contains__(self, nombre: str) -> bool:
+        return normalizar_texto(nombre) in self.__nombres
+    
+    def __len__(self) -> int:
+        return len(self.__nombres)
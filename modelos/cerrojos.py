@@ -0,0 +1,50 @@
+"""
+Clases CerrojosPorClave y SinCerrojos - Sincronización de grano fino para la Clinica
+"""
+import threading
+from contextlib import nullcontext
+from typing import ContextManager, Dict, Hashable, List, Optional
+
+class CerrojosPorClave:
+    # Atributos fijos: evita el __dict__ por instancia
+    __slots__ = ('__cerrojos', '__franjas', '__guardia')
+
+    def __init__(self, franjas: Optional[int] = None):
+        """
+        Constructor de la clase CerrojosPorClave
+
+        Args:
+            franjas: Si es None, cada clave tiene su propio cerrojo (creado al
+                     primer uso). Si es un número, las claves se reparten por
+                     hash entre esa cantidad fija de cerrojos, lo que acota la
+                     memoria cuando hay millones de claves (ej: DNIs).
+        """
+        if franjas is not None and franjas < 1:
+            raise ValueError("La cantidad de franjas debe ser mayor que cero")
+
+        self.__franjas: Optional[List[threading.RLock]] = (
+            [threading.RLock() for _ in range(franjas)] if franjas else None
+        )
+        self.__cerrojos: Dict[Hashable, threading.RLock] = {}
+        self.__guardia = threading.Lock()
+
+    def bloquear(self, clave: Hashable) -> ContextManager:
+        """Devuelve el cerrojo (reentrante) asociado a la clave, para usar con `with`"""
+        if self.__franjas is not None:
+            return self.__franjas[hash(clave) % len(self.__franjas)]
+
+        cerrojo = self.__cerrojos.get(clave)
+        if cerrojo is None:
+            with self.__guardia:
+                cerrojo = self.__cerrojos.setdefault(clave, threading.RLock())
+        return cerrojo
+
+
+class SinCerrojos:
+    """Reemplazo sin costo de CerrojosPorClave para el modo de un solo hilo"""
+    __slots__ = ()
+
+    _NULO = nullcontext()
+
+    def bloquear(self, clave: Hashable) -> ContextManager:
+        return self._NULO
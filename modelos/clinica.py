@@ -1,15 +1,30 @@
 """
 Clase Clinica - Clase principal que representa el sistema de gestión
 """
-from typing import Dict, List, Optional
-from datetime import datetime
+import heapq
+import inspect
+import threading
+from contextlib import nullcontext
+from itertools import islice
+from typing import (
+    Any, Callable, ContextManager, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple,
+)
+from datetime import datetime, time, timedelta
 
 from .paciente          import Paciente
 from .medico            import Medico
 from .turno             import Turno
 from .receta            import Receta
 from .historia_clinica  import HistoriaClinica
-from .especialidad      import Especialidad
+from .especialidad      import Especialidad, DIAS_SEMANA, numero_dia
+from .agenda            import Agenda
+from .cerrojos          import CerrojosPorClave, SinCerrojos
+from .vista             import VistaSecuencia
+from .lista_vigentes    import ListaVigentes
+from .catalogo_medicamentos import CatalogoMedicamentos
+from .indice_nombres    import IndiceNombres
+from .metricas          import Metricas
+from .lista_espera      import ListaEspera, SolicitudEspera
 
 # ------------------------------------------------------------
 # Excepciones
@@ -19,6 +34,7 @@ try:
         PacienteNoEncontradoException,
         MedicoNoDisponibleException,
         TurnoOcupadoException,
+        TurnoNoEncontradoException,
         RecetaInvalidaException,
     )
 except ImportError:  # ejecución fuera del paquete
@@ -28,17 +44,111 @@ except ImportError:  # ejecución fuera del paquete
         PacienteNoEncontradoException,
         MedicoNoDisponibleException,
         TurnoOcupadoException,
+        TurnoNoEncontradoException,
         RecetaInvalidaException,
     )
 
 
 class Clinica:
-    def __init__(self) -> None:
-        """Constructor de la clase Clinica"""
+    # Horario de atención usado para ofrecer turnos libres
+    HORA_INICIO_ATENCION = time(8, 0)
+    HORA_FIN_ATENCION    = time(18, 0)
+    # Horizonte por defecto de la búsqueda de turnos libres
+    DIAS_BUSQUEDA_POR_DEFECTO = 60
+    # Cantidad de cerrojos entre los que se reparten los DNIs en modo concurrente
+    FRANJAS_CERROJOS_PACIENTES = 1024
+
+    # Pasos internos que también se miden, para separar validación, registro y E/S
+    OPERACIONES_INTERNAS_MEDIDAS = ("_verificar_turno", "_registrar_turno",
+                                    "_cargar_recetas_diferidas")
+    # Métodos del almacén que se miden con el prefijo "almacen."
+    OPERACIONES_ALMACEN_MEDIDAS = ("guardar_paciente", "guardar_medico", "guardar_especialidad",
+                                   "guardar_turno", "eliminar_turno", "reemplazar_turno",
+                                   "guardar_receta")
+
+    def __init__(self, almacen=None, concurrente: bool = False, metricas: bool = False,
+                 reloj: Optional[Callable[[], datetime]] = None) -> None:
+        """
+        Constructor de la clase Clinica
+
+        Args:
+            almacen: Almacén persistente opcional (ver paquete persistencia).
+                     Si se indica, la clínica se reconstruye a partir de él y
+                     cada operación exitosa queda registrada en el almacén.
+            concurrente: Si es True, la clínica puede usarse desde varios hilos.
+                     Los turnos se serializan por matrícula y las escrituras
+                     en historias clínicas por DNI, así que operaciones sobre
+                     médicos y pacientes distintos avanzan en paralelo. Los
+                     listados y las vistas de las historias clínicas son
+                     entonces copias tomadas con el cerrojo que corresponde, no
+                     vistas en vivo.
+            metricas: Si es True, se miden llamadas, errores y latencias desde
+                     el arranque (ver habilitar_metricas).
+            reloj: Función que devuelve la fecha y hora actual (por defecto,
+                     datetime.now). Define qué horarios ya pasaron.
+        """
+        self.__concurrente = concurrente
+        if concurrente:
+            self.__cerrojos_medicos = CerrojosPorClave()
+            self.__cerrojos_pacientes = CerrojosPorClave(self.FRANJAS_CERROJOS_PACIENTES)
+            # Protege el registro de médicos y el índice de especialidades
+            self.__cerrojo_registro: ContextManager = threading.RLock()
+            # Protege el catálogo de medicamentos y su índice de recetas
+            self.__cerrojo_recetas: ContextManager = threading.RLock()
+            # Protege los índices de búsqueda por nombre
+            self.__cerrojo_busqueda: ContextManager = threading.RLock()
+            # Protege el índice de turnos por id y su listado
+            self.__cerrojo_turnos: ContextManager = threading.RLock()
+            # Protege la lista de espera; se toma antes que los de matrícula y DNI
+            self.__cerrojo_espera: ContextManager = threading.RLock()
+        else:
+            self.__cerrojos_medicos = self.__cerrojos_pacientes = SinCerrojos()
+            self.__cerrojo_registro = nullcontext()
+            self.__cerrojo_recetas = nullcontext()
+            self.__cerrojo_busqueda = nullcontext()
+            self.__cerrojo_turnos = nullcontext()
+            self.__cerrojo_espera = nullcontext()
+
         self.__pacientes: Dict[str, Paciente] = {}
         self.__medicos: Dict[str, Medico] = {}
-        self.__turnos: List[Turno] = []
+        # Pacientes y médicos en orden de alta, para listarlos sin copiar
+        self.__lista_pacientes: List[Paciente] = []
+        self.__lista_medicos: List[Medico] = []
+        # Índices de búsqueda por nombre (prefijos y errores de tipeo, sin tildes)
+        self.__indice_pacientes = IndiceNombres()
+        self.__indice_medicos = IndiceNombres()
+        # Turnos vigentes por id, en orden de alta: cancelar o reprogramar es O(1)
+        self.__turnos: Dict[int, Turno] = {}
+        # Listado de los turnos para obtener_turnos: cancelar deja una marca y
+        # reprogramar reemplaza el turno en su lugar, sin reconstruir el listado
+        self.__lista_turnos = ListaVigentes()
+        self.__proximo_id_turno = 1
         self.__historias_clinicas: Dict[str, HistoriaClinica] = {}
+        # Agenda ordenada cronológicamente de cada médico, por matrícula; detecta
+        # superposiciones y huecos libres en O(log n)
+        self.__agendas: Dict[str, Agenda] = {}
+        # Agenda de cada paciente, por DNI, para detectar que no tenga dos turnos
+        # a la vez; se crea con su primer turno
+        self.__agendas_pacientes: Dict[str, Agenda] = {}
+        # Índice invertido: especialidad -> [matrículas que la atienden, por día 0..6]
+        self.__medicos_por_especialidad: Dict[str, List[Set[str]]] = {}
+        # Medicamentos normalizados y recetas de cada uno ordenadas por fecha
+        self.__catalogo = CatalogoMedicamentos()
+        # Pacientes esperando un horario que se libere, por prioridad
+        self.__lista_espera = ListaEspera()
+        # DNIs cuyas recetas siguen en el almacén y aún no se leyeron
+        self.__recetas_diferidas: Set[str] = set()
+        self.__almacen = None
+        self.__metricas: Optional[Metricas] = None
+        self.__reloj = reloj if reloj is not None else datetime.now
+
+        if metricas:
+            self.habilitar_metricas()
+        if almacen is not None:
+            self._cargar_desde_almacen(almacen)
+            self.__almacen = almacen
+            if self.__metricas is not None:
+                self.__metricas.instrumentar(almacen, self.OPERACIONES_ALMACEN_MEDIDAS, "almacen.")
 
     # ============================================================
     # REGISTRO DE PACIENTES Y MÉDICOS
@@ -49,11 +159,22 @@ class Clinica:
             raise TypeError("Se esperaba un objeto de tipo Paciente")
 
         dni = paciente.obtener_dni()
-        if dni in self.__pacientes:
-            raise ValueError(f"Ya existe un paciente con DNI {dni}")
+        with self.__cerrojos_pacientes.bloquear(dni):
+            if dni in self.__pacientes:
+                raise ValueError(f"Ya existe un paciente con DNI {dni}")
+
+            if self.__almacen is not None:
+                self.__almacen.guardar_paciente(paciente)
 
-        self.__pacientes[dni] = paciente
-        self.__historias_clinicas[dni] = HistoriaClinica(paciente)
+            # La historia se crea antes de publicar al paciente para que otro
+            # hilo nunca vea un DNI registrado sin historia clínica
+            self.__historias_clinicas[dni] = HistoriaClinica(
+                paciente, self.__cerrojos_pacientes.bloquear(dni) if self.__concurrente else None
+            )
+            self.__lista_pacientes.append(paciente)
+            with self.__cerrojo_busqueda:
+                self.__indice_pacientes.agregar(paciente.obtener_nombre(), paciente)
+            self.__pacientes[dni] = paciente
 
     def agregar_medico(self, medico: Medico) -> None:
         """Registra un médico"""
@@ -61,10 +182,38 @@ class Clinica:
             raise TypeError("Se esperaba un objeto de tipo Medico")
 
         matricula = medico.obtener_matricula()
-        if matricula in self.__medicos:
-            raise ValueError(f"Ya existe un médico con matrícula {matricula}")
+        with self.__cerrojo_registro:
+            if matricula in self.__medicos:
+                raise ValueError(f"Ya existe un médico con matrícula {matricula}")
 
-        self.__medicos[matricula] = medico
+            if self.__almacen is not None:
+                self.__almacen.guardar_medico(medico)
+
+            self.__agendas[matricula] = Agenda()
+            for especialidad in medico.obtener_especialidades():
+                self._indexar_especialidad(matricula, especialidad)
+            medico.agregar_observador(self._al_agregar_especialidad)
+            self.__lista_medicos.append(medico)
+            with self.__cerrojo_busqueda:
+                self.__indice_medicos.agregar(medico.obtener_nombre(), medico)
+            self.__medicos[matricula] = medico
+
+    def _al_agregar_especialidad(self, medico: Medico, especialidad: Especialidad) -> None:
+        """Se invoca cuando un médico registrado incorpora una especialidad"""
+        with self.__cerrojo_registro:
+            if self.__almacen is not None:
+                self.__almacen.guardar_especialidad(medico.obtener_matricula(), especialidad)
+            self._indexar_especialidad(medico.obtener_matricula(), especialidad)
+
+    def _indexar_especialidad(self, matricula: str, especialidad: Especialidad) -> None:
+        """Agrega la matrícula al índice especialidad -> día -> matrículas"""
+        por_dia = self.__medicos_por_especialidad.setdefault(
+            especialidad.obtener_especialidad(), [set() for _ in DIAS_SEMANA]
+        )
+        mascara = especialidad.obtener_mascara()
+        for numero, matriculas in enumerate(por_dia):
+            if mascara >> numero & 1:
+                matriculas.add(matricula)
 
     # ============================================================
     # TURNOS
@@ -75,41 +224,366 @@ class Clinica:
         matricula: str,
         especialidad: str,
         fecha_hora: datetime,
-    ) -> None:
-        """Agenda un turno si se cumplen todas las condiciones"""
+        duracion: Optional[timedelta] = None,
+    ) -> Turno:
+        """
+        Agenda un turno si se cumplen todas las condiciones y lo devuelve;
+        su id sirve para cancelarlo o reprogramarlo. El turno ocupa
+        [fecha_hora, fecha_hora + duracion) y se rechaza si se superpone,
+        aunque sea en parte, con otro turno del médico o del paciente.
+        """
+        turno, error = self._intentar_agendar(dni, matricula, especialidad, fecha_hora, duracion)
+        if error is not None:
+            raise error
+        return turno
+
+    def agendar_turnos_lote(
+        self,
+        solicitudes: Iterable[Tuple[Any, ...]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Agenda un lote de turnos en una sola pasada.
+
+        Cada solicitud es una tupla (dni, matricula, especialidad, fecha_hora)
+        o (dni, matricula, especialidad, fecha_hora, duracion).
+        Las solicitudes aceptadas se registran a medida que se procesan, por lo
+        que los conflictos dentro del mismo lote se detectan igual que contra
+        los turnos existentes. No se lanza ninguna excepción por solicitud
+        rechazada: se devuelve, en el mismo orden, un resultado por cada una
+        con las claves:
+            • ok         True si el turno quedó agendado.
+            • id_turno   Id del turno agendado (None si no ok).
+            • excepcion  Tipo de la excepción que lo rechazó (None si ok).
+            • mensaje    Descripción del error ("" si ok).
+        """
+        resultados: List[Dict[str, Any]] = []
+        with self.transaccion():
+            for solicitud in solicitudes:
+                turno = None
+                try:
+                    dni, matricula, especialidad, fecha_hora, *resto = solicitud
+                    if len(resto) > 1:
+                        raise ValueError
+                except (TypeError, ValueError):
+                    error: Optional[Exception] = ValueError(
+                        "Cada solicitud debe ser (dni, matricula, especialidad, fecha_hora[, duracion])"
+                    )
+                else:
+                    try:
+                        turno, error = self._intentar_agendar(
+                            dni, matricula, especialidad, fecha_hora, *resto
+                        )
+                    except (TypeError, ValueError) as e:
+                        error = e
+
+                if error is None:
+                    resultados.append({"ok": True, "id_turno": turno.obtener_id(),
+                                       "excepcion": None, "mensaje": ""})
+                else:
+                    resultados.append({"ok": False, "id_turno": None,
+                                       "excepcion": type(error), "mensaje": str(error)})
+        return resultados
+
+    def _intentar_agendar(
+        self,
+        dni: str,
+        matricula: str,
+        especialidad: str,
+        fecha_hora: datetime,
+        duracion: Optional[timedelta] = None,
+    ) -> Tuple[Optional[Turno], Optional[Exception]]:
+        """
+        Valida y registra el turno de forma atómica respecto de otros turnos
+        del mismo médico y del mismo paciente. Devuelve (turno, None) si se
+        agendó o (None, excepción de rechazo).
+        """
+        if duracion is None:
+            duracion = Turno.DURACION_POR_DEFECTO
+        # Orden de adquisición: matrícula y luego DNI (nunca al revés)
+        with self.__cerrojos_medicos.bloquear(matricula), self.__cerrojos_pacientes.bloquear(dni):
+            error = self._verificar_turno(dni, matricula, especialidad, fecha_hora, duracion)
+            if error is not None:
+                return None, error
+            return self._registrar_turno(dni, matricula, especialidad, fecha_hora, duracion), None
+
+    def _verificar_turno(
+        self,
+        dni: str,
+        matricula: str,
+        especialidad: str,
+        fecha_hora: datetime,
+        duracion: timedelta,
+        ignorar: Optional[Turno] = None,
+    ) -> Optional[Exception]:
+        """
+        Aplica las reglas de agendamiento y devuelve la excepción que
+        correspondería lanzar, o None si el turno es válido. El turno
+        `ignorar` (el que se reprograma) no cuenta como superposición.
+        """
+        if not isinstance(fecha_hora, datetime):
+            return TypeError("Se esperaba un objeto de tipo datetime")
+        if not isinstance(duracion, timedelta) or duracion <= timedelta(0):
+            return ValueError("La duración debe ser un timedelta positivo")
 
         # Validar existencia de paciente y médico
         if not self.validar_existencia_paciente(dni):
-            raise PacienteNoEncontradoException(
+            return PacienteNoEncontradoException(
                 f"No existe un paciente con DNI {dni}"
             )
 
         if not self.validar_existencia_medico(matricula):
-            raise MedicoNoDisponibleException(
+            return MedicoNoDisponibleException(
                 f"No existe un médico con matrícula {matricula}"
             )
 
-        paciente = self.__pacientes[dni]
-        medico   = self.__medicos[matricula]
+        medico = self.__medicos[matricula]
 
-        # Turno duplicado
-        if not self.validar_turno_no_duplicado(matricula, fecha_hora):
-            raise TurnoOcupadoException(
-                "Ya existe un turno para ese médico en esa fecha y hora"
+        # Turno duplicado o superpuesto con otro del médico
+        fin = fecha_hora + duracion
+        existente = self.__agendas[matricula].obtener_superposicion(fecha_hora, fin, ignorar)
+        if existente is not None:
+            if existente.obtener_fecha_hora() == fecha_hora:
+                return TurnoOcupadoException(
+                    "Ya existe un turno para ese médico en esa fecha y hora"
+                )
+            return TurnoOcupadoException(
+                f"El turno se superpone con otro del médico de "
+                f"{existente.obtener_fecha_hora():%H:%M} a {existente.obtener_fin():%H:%M}"
             )
 
-        dia_semana = self.obtener_dia_semana_en_espanol(fecha_hora)
+        # El paciente no puede tener dos turnos a la vez, aunque sean con médicos distintos
+        agenda_paciente = self.__agendas_pacientes.get(dni)
+        existente = (agenda_paciente.obtener_superposicion(fecha_hora, fin, ignorar)
+                     if agenda_paciente else None)
+        if existente is not None:
+            return TurnoOcupadoException(
+                f"El paciente ya tiene un turno de {existente.obtener_fecha_hora():%H:%M} a "
+                f"{existente.obtener_fin():%H:%M} con {existente.obtener_medico().obtener_nombre()}"
+            )
 
         # Especialidad y día
-        if not self.validar_especialidad_en_dia(medico, especialidad, dia_semana):
-            raise MedicoNoDisponibleException(
+        if not medico.atiende(especialidad, fecha_hora.weekday()):
+            dia_semana = self.obtener_dia_semana_en_espanol(fecha_hora)
+            return MedicoNoDisponibleException(
                 f"El médico no atiende la especialidad {especialidad} los días {dia_semana}"
             )
 
-        # Crear y registrar el turno
-        turno = Turno(paciente, medico, fecha_hora, especialidad)
-        self.__turnos.append(turno)
-        self.__historias_clinicas[dni].agregar_turno(turno)
+        return None
+
+    def _registrar_turno(
+        self,
+        dni: str,
+        matricula: str,
+        especialidad: str,
+        fecha_hora: datetime,
+        duracion: Optional[timedelta] = None,
+        id_turno: Optional[int] = None,
+    ) -> Turno:
+        """
+        Crea el turno y lo registra en todos los índices (sin validar reglas).
+        Si no se indica id_turno (turno nuevo), se le asigna el siguiente.
+        En modo concurrente, quien llama debe tener el cerrojo de la matrícula.
+        """
+        with self.__cerrojo_turnos:
+            if id_turno is None:
+                id_turno = self.__proximo_id_turno
+            self.__proximo_id_turno = max(self.__proximo_id_turno, id_turno + 1)
+        turno = Turno(self.__pacientes[dni], self.__medicos[matricula], fecha_hora, especialidad,
+                      duracion, id_turno)
+        if self.__almacen is not None:
+            self.__almacen.guardar_turno(turno)
+        self._indexar_turno(turno)
+        return turno
+
+    def _indexar_turno(self, turno: Turno) -> None:
+        """Agrega el turno al índice por id, a las agendas y a la historia clínica"""
+        dni = turno.obtener_paciente().obtener_dni()
+        with self.__cerrojo_turnos:
+            self.__turnos[turno.obtener_id()] = turno
+            self.__lista_turnos.agregar(turno.obtener_id(), turno)
+        self.__agendas[turno.obtener_medico().obtener_matricula()].agregar_turno(turno)
+        # Orden de adquisición: matrícula y luego DNI (nunca al revés)
+        with self.__cerrojos_pacientes.bloquear(dni):
+            agenda_paciente = self.__agendas_pacientes.get(dni)
+            if agenda_paciente is None:
+                agenda_paciente = self.__agendas_pacientes[dni] = Agenda()
+            agenda_paciente.agregar_turno(turno)
+            self.__historias_clinicas[dni].agregar_turno(turno)
+
+    def _desindexar_turno(self, turno: Turno) -> None:
+        """Quita el turno de todos los índices; inversa de _indexar_turno"""
+        dni = turno.obtener_paciente().obtener_dni()
+        with self.__cerrojo_turnos:
+            del self.__turnos[turno.obtener_id()]
+            self.__lista_turnos.quitar(turno.obtener_id())
+        self.__agendas[turno.obtener_medico().obtener_matricula()].quitar_turno(turno)
+        with self.__cerrojos_pacientes.bloquear(dni):
+            self.__agendas_pacientes[dni].quitar_turno(turno)
+            self.__historias_clinicas[dni].quitar_turno(turno)
+
+    def _reubicar_turno(self, anterior: Turno, turno: Turno) -> None:
+        """Reemplaza el turno reprogramado en todos los índices, conservando su lugar en los listados"""
+        dni = turno.obtener_paciente().obtener_dni()
+        with self.__cerrojo_turnos:
+            self.__turnos[turno.obtener_id()] = turno
+            self.__lista_turnos.reemplazar(turno.obtener_id(), turno)
+        agenda = self.__agendas[turno.obtener_medico().obtener_matricula()]
+        agenda.quitar_turno(anterior)
+        agenda.agregar_turno(turno)
+        with self.__cerrojos_pacientes.bloquear(dni):
+            self.__agendas_pacientes[dni].quitar_turno(anterior)
+            self.__agendas_pacientes[dni].agregar_turno(turno)
+            self.__historias_clinicas[dni].reemplazar_turno(anterior, turno)
+
+    def cancelar_turno(self, id_turno: int) -> Turno:
+        """
+        Cancela el turno y lo devuelve. El horario queda libre de inmediato
+        para las consultas de disponibilidad y se ofrece a la lista de espera.
+        """
+        matricula, dni = self._claves_turno(id_turno)
+        with self.__cerrojos_medicos.bloquear(matricula), self.__cerrojos_pacientes.bloquear(dni):
+            # Releer con los cerrojos tomados: otro hilo pudo cancelarlo o reprogramarlo
+            turno = self._turno_vigente(id_turno)
+            if self.__almacen is not None:
+                self.__almacen.eliminar_turno(id_turno)
+            self._desindexar_turno(turno)
+        # Fuera de los cerrojos: ocupar el horario toma los de otro paciente
+        self._ofrecer_a_lista_espera(matricula, turno.obtener_fecha_hora())
+        return turno
+
+    def reprogramar_turno(
+        self,
+        id_turno: int,
+        fecha_hora: datetime,
+        duracion: Optional[timedelta] = None,
+    ) -> Turno:
+        """
+        Mueve el turno a otra fecha y hora con el mismo médico, conservando
+        su id, y devuelve el turno nuevo. Se aplican las mismas reglas que al
+        agendar; si el nuevo horario no es válido, el turno queda como estaba.
+
+        Args:
+            id_turno: Id del turno a reprogramar
+            fecha_hora: Nueva fecha y hora
+            duracion: Nueva duración (None conserva la actual)
+        """
+        matricula, dni = self._claves_turno(id_turno)
+        with self.__cerrojos_medicos.bloquear(matricula), self.__cerrojos_pacientes.bloquear(dni):
+            anterior = self._turno_vigente(id_turno)
+            if duracion is None:
+                duracion = anterior.obtener_duracion()
+            especialidad = anterior.obtener_especialidad()
+            error = self._verificar_turno(dni, matricula, especialidad, fecha_hora, duracion, anterior)
+            if error is not None:
+                raise error
+
+            turno = Turno(anterior.obtener_paciente(), anterior.obtener_medico(), fecha_hora,
+                          especialidad, duracion, id_turno)
+            if self.__almacen is not None:
+                self.__almacen.reemplazar_turno(turno)
+            self._reubicar_turno(anterior, turno)
+        self._ofrecer_a_lista_espera(matricula, anterior.obtener_fecha_hora())
+        return turno
+
+    def _claves_turno(self, id_turno: int) -> Tuple[str, str]:
+        """Devuelve (matrícula, DNI) del turno; no cambian al reprogramarlo"""
+        turno = self._turno_vigente(id_turno)
+        return turno.obtener_medico().obtener_matricula(), turno.obtener_paciente().obtener_dni()
+
+    def _turno_vigente(self, id_turno: int) -> Turno:
+        turno = self.__turnos.get(id_turno)
+        if turno is None:
+            raise TurnoNoEncontradoException(f"No existe un turno con id {id_turno}")
+        return turno
+
+    # ============================================================
+    # LISTA DE ESPERA
+    # ============================================================
+    def agregar_a_lista_espera(
+        self,
+        dni: str,
+        especialidad: str,
+        matricula: Optional[str] = None,
+        prioridad: int = 0,
+        duracion: Optional[timedelta] = None,
+        desde: Optional[datetime] = None,
+        hasta: Optional[datetime] = None,
+    ) -> SolicitudEspera:
+        """
+        Anota al paciente para que reciba automáticamente el primer horario
+        que se libere (por cancelación o reprogramación) y le sirva.
+
+        Args:
+            dni: DNI del paciente
+            especialidad: Especialidad del turno buscado
+            matricula: Médico pedido, o None si sirve cualquiera de la especialidad
+            prioridad: Mayor número, mayor prioridad; a igual prioridad, por orden de llegada
+            duracion: Duración del turno buscado (por defecto, 30 minutos)
+            desde, hasta: Franja en la que debe empezar el turno (None = sin límite)
+        """
+        if dni not in self.__pacientes:
+            raise PacienteNoEncontradoException(f"No existe un paciente con DNI {dni}")
+        if matricula is None:
+            if not self._matriculas_por_especialidad(especialidad):
+                raise MedicoNoDisponibleException(
+                    f"Ningún médico atiende la especialidad {especialidad}"
+                )
+        elif matricula not in self.__medicos:
+            raise MedicoNoDisponibleException(f"No existe un médico con matrícula {matricula}")
+        elif not any(e.obtener_especialidad() == especialidad
+                     for e in self.__medicos[matricula].obtener_especialidades()):
+            raise MedicoNoDisponibleException(
+                f"El médico no atiende la especialidad {especialidad}"
+            )
+        with self.__cerrojo_espera:
+            return self.__lista_espera.agregar(dni, especialidad, matricula, prioridad,
+                                               duracion, desde, hasta)
+
+    def retirar_de_lista_espera(self, id_solicitud: int) -> SolicitudEspera:
+        """Retira una solicitud pendiente de la lista de espera"""
+        with self.__cerrojo_espera:
+            return self.__lista_espera.retirar(id_solicitud)
+
+    def obtener_lista_espera(self) -> List[SolicitudEspera]:
+        """Devuelve las solicitudes pendientes en orden de llegada"""
+        with self.__cerrojo_espera:
+            return self.__lista_espera.obtener_pendientes()
+
+    def ocupar_horario_libre(self, matricula: str, fecha_hora: datetime) -> Optional[Turno]:
+        """
+        Ofrece el horario del médico a la lista de espera: agenda (con
+        agendar_turno) a la solicitud más prioritaria que pueda tomarlo,
+        entre las que piden a ese médico o a cualquiera de una especialidad
+        que atiende ese día. Devuelve el turno agendado, o None (también si
+        el horario ya pasó).
+        """
+        medico = self.obtener_medico_por_matricula(matricula)
+        if fecha_hora < self.__reloj():
+            return None
+        claves = []
+        for especialidad in medico.obtener_especialidades():
+            tipo = especialidad.obtener_especialidad()
+            if medico.atiende(tipo, fecha_hora.weekday()):
+                claves += [(tipo, matricula), (tipo, None)]
+
+        def intentar(solicitud: SolicitudEspera) -> Optional[Turno]:
+            if not solicitud.admite(fecha_hora):
+                return None
+            try:
+                return self.agendar_turno(solicitud.obtener_dni(), matricula,
+                                          solicitud.obtener_especialidad(), fecha_hora,
+                                          solicitud.obtener_duracion())
+            except (TurnoOcupadoException, MedicoNoDisponibleException):
+                return None
+
+        with self.__cerrojo_espera:
+            solicitud = self.__lista_espera.asignar_mejor(claves, intentar)
+        return solicitud.obtener_turno() if solicitud is not None else None
+
+    def _ofrecer_a_lista_espera(self, matricula: str, fecha_hora: datetime) -> None:
+        # Sin nadie esperando no hay nada que hacer (lectura sin cerrojo, O(1))
+        if len(self.__lista_espera):
+            self.ocupar_horario_libre(matricula, fecha_hora)
 
     # ============================================================
     # RECETAS
@@ -148,18 +622,220 @@ class Clinica:
         paciente = self.__pacientes[dni]
         medico   = self.__medicos[matricula]
 
-        # 3) Crear y registrar la receta
-        receta = Receta(paciente, medico, medicamentos)
+        # 3) Crear y registrar la receta con los nombres canónicos del catálogo
+        with self.__cerrojo_recetas:
+            nombres = [
+                self.__catalogo.registrar(med) for med in medicamentos if med and med.strip()
+            ]
+        receta = Receta(paciente, medico, nombres or medicamentos)
+        with self.__cerrojos_pacientes.bloquear(dni):
+            # Las recetas anteriores se leen primero: una receta nueva siempre
+            # va a memoria, y la carga de todas las diferidas no puede perderla
+            if dni in self.__recetas_diferidas:
+                self._cargar_recetas_diferidas(dni)
+            if self.__almacen is not None:
+                self.__almacen.guardar_receta(receta)
+            self._agregar_receta_a_historia(dni, receta)
+
+    def _agregar_receta_a_historia(self, dni: str, receta: Receta) -> None:
+        """Agrega la receta a la historia del paciente y al índice por medicamento"""
         self.__historias_clinicas[dni].agregar_receta(receta)
+        with self.__cerrojo_recetas:
+            self.__catalogo.indexar_receta(receta)
+
+    def obtener_recetas_por_medicamento(
+        self,
+        medicamento: str,
+        desde: Optional[datetime] = None,
+        hasta: Optional[datetime] = None,
+    ) -> List[Receta]:
+        """
+        Devuelve las recetas que incluyen el medicamento (sin distinguir
+        mayúsculas ni tildes) con fecha en [desde, hasta), ordenadas por fecha.
+        """
+        self._cargar_todas_las_recetas_diferidas()
+        with self.__cerrojo_recetas:
+            return self.__catalogo.obtener_recetas(medicamento, desde, hasta)
+
+    def obtener_pacientes_por_medicamento(
+        self,
+        medicamento: str,
+        desde: Optional[datetime] = None,
+        hasta: Optional[datetime] = None,
+    ) -> List[Paciente]:
+        """Devuelve, sin repetir, los pacientes a quienes se recetó el medicamento"""
+        pacientes: Dict[str, Paciente] = {}
+        for receta in self.obtener_recetas_por_medicamento(medicamento, desde, hasta):
+            paciente = receta.obtener_paciente()
+            pacientes.setdefault(paciente.obtener_dni(), paciente)
+        return list(pacientes.values())
+
+    def obtener_medicamentos(self) -> List[str]:
+        """Devuelve los nombres canónicos del catálogo de medicamentos"""
+        self._cargar_todas_las_recetas_diferidas()
+        with self.__cerrojo_recetas:
+            return self.__catalogo.nombres()
+
+    # ============================================================
+    # BÚSQUEDA DE TURNOS DISPONIBLES
+    # ============================================================
+    def buscar_proximo_turno(
+        self,
+        especialidad: str,
+        desde: datetime,
+        duracion: timedelta,
+        n: int = 5,
+        hasta: Optional[datetime] = None,
+    ) -> List[Tuple[datetime, str]]:
+        """
+        Devuelve hasta n horarios libres (fecha_hora, matricula), en orden
+        cronológico, entre todos los médicos que atienden la especialidad.
+        """
+        return list(islice(
+            self.iterar_turnos_disponibles(especialidad, desde, duracion, hasta), n
+        ))
+
+    def iterar_turnos_disponibles(
+        self,
+        especialidad: str,
+        desde: datetime,
+        duracion: timedelta,
+        hasta: Optional[datetime] = None,
+    ) -> Iterator[Tuple[datetime, str]]:
+        """
+        Genera de forma perezosa los horarios libres (fecha_hora, matricula)
+        en orden cronológico dentro de [desde, hasta).
+
+        Los horarios se ofrecen cada `duracion` desde HORA_INICIO_ATENCION
+        hasta HORA_FIN_ATENCION, solo los días en que el médico atiende la
+        especialidad. Cada médico aporta un flujo ordenado y los flujos se
+        combinan con un heap (heapq.merge).
+        """
+        if not isinstance(desde, datetime):
+            raise TypeError("Se esperaba un objeto de tipo datetime")
+        if not isinstance(duracion, timedelta) or duracion <= timedelta(0):
+            raise ValueError("La duración debe ser un timedelta positivo")
+        if hasta is None:
+            hasta = desde + timedelta(days=self.DIAS_BUSQUEDA_POR_DEFECTO)
+
+        flujos = [
+            self._horarios_libres(self.__medicos[matricula], especialidad, desde, hasta, duracion)
+            for matricula in sorted(self._matriculas_por_especialidad(especialidad))
+        ]
+        return heapq.merge(*flujos)
+
+    def _horarios_libres(
+        self,
+        medico: Medico,
+        especialidad: str,
+        desde: datetime,
+        hasta: datetime,
+        duracion: timedelta,
+    ) -> Iterator[Tuple[datetime, str]]:
+        """Genera en orden los horarios libres de un médico para la especialidad"""
+        matricula = medico.obtener_matricula()
+        mascara = medico.obtener_mascara_especialidad(especialidad)
+        agenda = self.__agendas[matricula]
+
+        dia = desde.date()
+        while True:
+            inicio_jornada = datetime.combine(dia, self.HORA_INICIO_ATENCION, desde.tzinfo)
+            if inicio_jornada >= hasta:
+                return
+            if mascara >> dia.weekday() & 1:
+                fin_jornada = datetime.combine(dia, self.HORA_FIN_ATENCION, desde.tzinfo)
+                with self.__cerrojos_medicos.bloquear(matricula):
+                    huecos = agenda.obtener_huecos(inicio_jornada, fin_jornada)
+                for inicio_hueco, fin_hueco in huecos:
+                    # Primer horario de la grilla de la jornada dentro del hueco
+                    inicio = inicio_jornada - (inicio_jornada - inicio_hueco) // duracion * duracion
+                    while inicio + duracion <= fin_hueco and inicio < hasta:
+                        if inicio >= desde:
+                            yield (inicio, matricula)
+                        inicio += duracion
+            dia += timedelta(days=1)
 
     # ============================================================
     # OBTENCIÓN DE INFORMACIÓN
     # ============================================================
-    def obtener_pacientes(self) -> List[Paciente]:
-        return list(self.__pacientes.values())
+    # Los listados devuelven una vista de solo lectura (O(1), sin copiar) o,
+    # si se pide una página con offset/limite, una lista con esos elementos.
+    def obtener_pacientes(
+        self, offset: int = 0, limite: Optional[int] = None
+    ) -> Sequence[Paciente]:
+        return self._listar(self.__lista_pacientes, offset, limite)
+
+    def obtener_medicos(
+        self, offset: int = 0, limite: Optional[int] = None
+    ) -> Sequence[Medico]:
+        return self._listar(self.__lista_medicos, offset, limite)
+
+    def _listar(self, lista: Sequence[Any], offset: int, limite: Optional[int],
+                cerrojo: ContextManager = nullcontext()) -> Sequence[Any]:
+        """
+        Devuelve la página pedida como lista nueva o, sin offset ni límite, el
+        listado completo como vista de solo lectura. En un solo hilo la vista
+        refleja los cambios posteriores sin copiar. En modo concurrente es una
+        copia tomada con el cerrojo del listado, para que otros hilos no la
+        modifiquen mientras se recorre. Las listas de pacientes y médicos solo
+        crecen, y copiarlas de una vez con un slice es atómico.
+        """
+        if self.__concurrente:
+            with cerrojo:
+                if offset == 0 and limite is None:
+                    return VistaSecuencia(lista[:])
+                return VistaSecuencia(lista).pagina(offset, limite)
+        vista = VistaSecuencia(lista)
+        if offset == 0 and limite is None:
+            return vista
+        return vista.pagina(offset, limite)
+
+    def buscar_pacientes(self, texto: str, limite: int = 20) -> List[Paciente]:
+        """
+        Busca pacientes por nombre, en orden de alta. Cada palabra del texto
+        puede ser el comienzo de una palabra del nombre ("per ju" encuentra a
+        "Juan Pérez") y se toleran tildes, mayúsculas y un error de tipeo.
+        """
+        with self.__cerrojo_busqueda:
+            return self.__indice_pacientes.buscar(texto, limite)
+
+    def buscar_medicos(self, texto: str, limite: int = 20) -> List[Medico]:
+        """Busca médicos por nombre con las mismas reglas que buscar_pacientes"""
+        with self.__cerrojo_busqueda:
+            return self.__indice_medicos.buscar(texto, limite)
 
-    def obtener_medicos(self) -> List[Medico]:
-        return list(self.__medicos.values())
+    def obtener_medicos_por_especialidad(
+        self,
+        especialidad: str,
+        dia_semana: Optional[str] = None,
+    ) -> List[Medico]:
+        """
+        Devuelve los médicos que atienden la especialidad, opcionalmente
+        solo los que la atienden el día indicado (ej: "martes").
+        """
+        if dia_semana is None:
+            matriculas = self._matriculas_por_especialidad(especialidad)
+        else:
+            numero = numero_dia(dia_semana)
+            if numero is None:
+                raise ValueError(f"Día inválido: {dia_semana}")
+            with self.__cerrojo_registro:
+                por_dia = self.__medicos_por_especialidad.get(especialidad)
+                matriculas = set(por_dia[numero]) if por_dia else set()
+        return [self.__medicos[m] for m in sorted(matriculas)]
+
+    def _matriculas_por_especialidad(self, especialidad: str) -> Set[str]:
+        """Devuelve las matrículas que atienden la especialidad algún día"""
+        with self.__cerrojo_registro:
+            por_dia = self.__medicos_por_especialidad.get(especialidad)
+            return set().union(*por_dia) if por_dia else set()
+
+    def obtener_paciente_por_dni(self, dni: str) -> Paciente:
+        if dni not in self.__pacientes:
+            raise PacienteNoEncontradoException(
+                f"No existe un paciente con DNI {dni}"
+            )
+        return self.__pacientes[dni]
 
     def obtener_medico_por_matricula(self, matricula: str) -> Medico:
         if matricula not in self.__medicos:
@@ -168,14 +844,81 @@ class Clinica:
             )
         return self.__medicos[matricula]
 
-    def obtener_turnos(self) -> List[Turno]:
-        return self.__turnos.copy()
+    def obtener_turnos(
+        self, offset: int = 0, limite: Optional[int] = None
+    ) -> Sequence[Turno]:
+        # En un solo hilo la vista refleja los turnos agendados, cancelados y
+        # reprogramados después (ver _listar)
+        return self._listar(self.__lista_turnos, offset, limite, self.__cerrojo_turnos)
+
+    def obtener_turno(self, id_turno: int) -> Turno:
+        """Devuelve el turno vigente con ese id"""
+        return self._turno_vigente(id_turno)
+
+    def obtener_agenda(
+        self,
+        matricula: str,
+        desde: Optional[datetime] = None,
+        hasta: Optional[datetime] = None,
+    ) -> List[Turno]:
+        """
+        Devuelve los turnos del médico en el intervalo [desde, hasta),
+        ordenados por fecha y hora, en O(log n + k).
+        """
+        if matricula not in self.__agendas:
+            raise MedicoNoDisponibleException(
+                f"No existe un médico con matrícula {matricula}"
+            )
+        with self.__cerrojos_medicos.bloquear(matricula):
+            return self.__agendas[matricula].obtener_turnos_entre(desde, hasta)
+
+    def obtener_proximos_turnos(
+        self,
+        dni: str,
+        desde: Optional[datetime] = None,
+        hasta: Optional[datetime] = None,
+        limite: Optional[int] = None,
+    ) -> List[Turno]:
+        """
+        Devuelve los turnos del paciente en [desde, hasta) en orden
+        cronológico, en O(log n + k). Por defecto, desde ahora y sin límite.
+        """
+        if dni not in self.__pacientes:
+            raise PacienteNoEncontradoException(f"No existe un paciente con DNI {dni}")
+        if desde is None:
+            desde = self.__reloj()
+        with self.__cerrojos_pacientes.bloquear(dni):
+            agenda = self.__agendas_pacientes.get(dni)
+            return agenda.obtener_turnos_entre(desde, hasta, limite) if agenda else []
+
+    def obtener_huecos_libres(
+        self,
+        matricula: str,
+        desde: datetime,
+        hasta: datetime,
+    ) -> List[Tuple[datetime, datetime]]:
+        """
+        Devuelve los intervalos (inicio, fin) sin turnos del médico dentro de
+        [desde, hasta), en orden y en O(log n + k).
+        """
+        if matricula not in self.__agendas:
+            raise MedicoNoDisponibleException(
+                f"No existe un médico con matrícula {matricula}"
+            )
+        if not isinstance(desde, datetime) or not isinstance(hasta, datetime):
+            raise TypeError("Se esperaba un objeto de tipo datetime")
+        with self.__cerrojos_medicos.bloquear(matricula):
+            return self.__agendas[matricula].obtener_huecos(desde, hasta)
 
     def obtener_historia_clinica_por_dni(self, dni: str) -> HistoriaClinica:
         if dni not in self.__pacientes:
             raise PacienteNoEncontradoException(
                 f"No existe un paciente con DNI {dni}"
             )
+        if dni in self.__recetas_diferidas:
+            with self.__cerrojos_pacientes.bloquear(dni):
+                if dni in self.__recetas_diferidas:
+                    self._cargar_recetas_diferidas(dni)
         return self.__historias_clinicas[dni]
 
     # ============================================================
@@ -191,30 +934,18 @@ class Clinica:
         self,
         matricula: str,
         fecha_hora: datetime,
+        duracion: Optional[timedelta] = None,
     ) -> bool:
-        for turno in self.__turnos:
-            if (
-                turno.obtener_medico().obtener_matricula() == matricula
-                and turno.obtener_fecha_hora() == fecha_hora
-            ):
-                return False
-        return True
+        agenda = self.__agendas.get(matricula)
+        if agenda is None:
+            return True
+        fin = fecha_hora + (duracion or Turno.DURACION_POR_DEFECTO)
+        return agenda.obtener_superposicion(fecha_hora, fin) is None
 
     # Día de la semana en español
     def obtener_dia_semana_en_espanol(self, fecha_hora: datetime) -> str:
-        dias_ingles_espanol = {
-            "Monday":    "lunes",
-            "Tuesday":   "martes",
-            "Wednesday": "miércoles",
-            "Thursday":  "jueves",
-            "Friday":    "viernes",
-            "Saturday":  "sábado",
-            "Sunday":    "domingo",
-        }
-        return dias_ingles_espanol.get(
-            fecha_hora.strftime("%A"),
-            fecha_hora.strftime("%A").lower(),
-        )
+        # weekday() no depende del locale, a diferencia de strftime('%A')
+        return DIAS_SEMANA[fecha_hora.weekday()]
 
     # Comprueba que el médico atienda la especialidad solicitada ese día
     def validar_especialidad_en_dia(
@@ -223,10 +954,139 @@ class Clinica:
         especialidad_solicitada: str,
         dia_semana: str,
     ) -> bool:
-        for esp in medico.obtener_especialidades():
-            if (
-                esp.obtener_especialidad() == especialidad_solicitada
-                and esp.verificar_dia(dia_semana)
-            ):
-                return True
-        return False
\ No newline at end of file
+        numero = numero_dia(dia_semana)
+        return numero is not None and medico.atiende(especialidad_solicitada, numero)
+
+    # ============================================================
+    # MÉTRICAS
+    # ============================================================
+    @classmethod
+    def _operaciones_medidas(cls) -> List[str]:
+        """Métodos públicos (salvo los generadores y los de métricas) y los pasos internos medidos"""
+        publicas = [
+            nombre for nombre, valor in vars(cls).items()
+            if not nombre.startswith("_") and inspect.isfunction(valor)
+            and not inspect.isgeneratorfunction(valor) and "metricas" not in nombre
+        ]
+        return publicas + list(cls.OPERACIONES_INTERNAS_MEDIDAS)
+
+    def habilitar_metricas(self) -> Metricas:
+        """
+        Empieza a medir cada llamada a los métodos de la clínica y a las
+        escrituras del almacén. Mientras están deshabilitadas no hay ningún
+        costo: los métodos medidos se instalan solo en esta instancia.
+        """
+        if self.__metricas is None:
+            metricas = Metricas()
+            metricas.instrumentar(self, self._operaciones_medidas())
+            if self.__almacen is not None:
+                metricas.instrumentar(self.__almacen, self.OPERACIONES_ALMACEN_MEDIDAS, "almacen.")
+            self.__metricas = metricas
+        return self.__metricas
+
+    def deshabilitar_metricas(self) -> None:
+        """Deja de medir y descarta lo registrado"""
+        if self.__metricas is not None:
+            Metricas.desinstrumentar(self, self._operaciones_medidas())
+            if self.__almacen is not None:
+                Metricas.desinstrumentar(self.__almacen, self.OPERACIONES_ALMACEN_MEDIDAS)
+            self.__metricas = None
+
+    def obtener_metricas(self) -> Optional[Metricas]:
+        """Devuelve las métricas en curso, o None si están deshabilitadas"""
+        return self.__metricas
+
+    # ============================================================
+    # PERSISTENCIA
+    # ============================================================
+    def transaccion(self) -> ContextManager:
+        """
+        Agrupa las escrituras al almacén (si existe) del bloque en una sola
+        transacción, para registrar muchas operaciones con un único commit.
+        Cada operación se aplica igual que fuera del bloque: la que falla no
+        deshace a las anteriores.
+        """
+        if self.__almacen is None:
+            return nullcontext()
+        return self.__almacen.transaccion()
+
+    def _cargar_desde_almacen(self, almacen) -> None:
+        """Reconstruye el estado aplicando en orden los registros del almacén"""
+        for registro in almacen.cargar():
+            tipo = registro[0]
+            if tipo == "paciente":
+                self.agregar_paciente(registro[1])
+            elif tipo == "medico":
+                self.agregar_medico(registro[1])
+            elif tipo == "especialidad":
+                self.__medicos[registro[1]].agregar_especialidad(registro[2])
+            elif tipo == "turno":
+                # Los turnos del almacén ya fueron validados al agendarse
+                self._registrar_turno(*registro[1:])
+            elif tipo == "cancelacion":
+                self._desindexar_turno(self.__turnos[registro[1]])
+            elif tipo == "reprogramacion":
+                id_turno, fecha_hora, duracion = registro[1:]
+                anterior = self.__turnos[id_turno]
+                self._reubicar_turno(anterior, Turno(
+                    anterior.obtener_paciente(), anterior.obtener_medico(), fecha_hora,
+                    anterior.obtener_especialidad(), duracion, id_turno,
+                ))
+            elif tipo == "ids_turno":
+                self.__proximo_id_turno = max(self.__proximo_id_turno, registro[1])
+            elif tipo == "receta":
+                dni, matricula, medicamentos, fecha = registro[1:]
+                self._agregar_receta_a_historia(
+                    dni,
+                    Receta(self.__pacientes[dni], self.__medicos[matricula], medicamentos, fecha),
+                )
+            else:
+                raise ValueError(f"Registro desconocido en el almacén: {tipo}")
+
+        if almacen.RECETAS_DIFERIDAS:
+            self.__recetas_diferidas = set(self.__pacientes)
+
+    def _cargar_recetas_diferidas(self, dni: str) -> None:
+        """Lee del almacén las recetas de un paciente y las agrega a su historia"""
+        for matricula, medicamentos, fecha in self.__almacen.cargar_recetas(dni):
+            self._agregar_receta_a_historia(
+                dni,
+                Receta(self.__pacientes[dni], self.__medicos[matricula], medicamentos, fecha),
+            )
+        self.__recetas_diferidas.discard(dni)
+
+    def _cargar_todas_las_recetas_diferidas(self) -> None:
+        """
+        Lee del almacén, en un único recorrido, las recetas aún diferidas de
+        todos los pacientes. Lo necesitan las consultas por medicamento, que
+        abarcan a toda la clínica; se paga una única vez.
+        """
+        if not self.__recetas_diferidas:
+            return
+        # Sin cerrojos de pacientes durante la lectura: el almacén toma el suyo
+        leidas: List[Receta] = []
+        por_dni: Dict[str, List[Receta]] = {}
+        for dni, matricula, medicamentos, fecha in self.__almacen.cargar_todas_las_recetas():
+            if dni in self.__recetas_diferidas:
+                receta = Receta(self.__pacientes[dni], self.__medicos[matricula], medicamentos, fecha)
+                leidas.append(receta)
+                por_dni.setdefault(dni, []).append(receta)
+
+        cargados: Set[str] = set()
+        for dni, recetas in por_dni.items():
+            with self.__cerrojos_pacientes.bloquear(dni):
+                # Otro hilo pudo leerlas mientras tanto (consulta o emitir_receta)
+                if dni in self.__recetas_diferidas:
+                    historia = self.__historias_clinicas[dni]
+                    for receta in recetas:
+                        historia.agregar_receta(receta)
+                    self.__recetas_diferidas.discard(dni)
+                    cargados.add(dni)
+        # En orden de emisión, para que el catálogo agregue cada receta al final
+        with self.__cerrojo_recetas:
+            for receta in leidas:
+                if receta.obtener_paciente().obtener_dni() in cargados:
+                    self.__catalogo.indexar_receta(receta)
+        # Los que siguen diferidos no tenían recetas en el almacén: las que se
+        # emitan después se agregan en memoria (ver emitir_receta)
+        self.__recetas_diferidas.clear()
@@ -1,9 +1,28 @@
 """
 Clase Especialidad - Representa una especialidad médica con sus días de atención
 """
-from typing import List
+from typing import List, Optional
+
+# Nombres canónicos indexados por datetime.weekday() (0 = lunes)
+DIAS_SEMANA = ("lunes", "martes", "miércoles", "jueves", "viernes", "sábado", "domingo")
+
+# Grafías aceptadas -> número de día (acepta 'miercoles' y 'sabado' sin tilde)
+_NUMERO_DIA = {dia: numero for numero, dia in enumerate(DIAS_SEMANA)}
+_NUMERO_DIA.update({"miercoles": 2, "sabado": 5})
+
+# Grafías aceptadas -> la misma cadena, para compartir un único objeto por día
+_DIAS_VALIDOS = {dia: dia for dia in _NUMERO_DIA}
+
+
+def numero_dia(dia: str) -> Optional[int]:
+    """Devuelve el número de día (0 = lunes) o None si el nombre no es válido"""
+    return _NUMERO_DIA.get(dia.lower())
+
 
 class Especialidad:
+    # Atributos fijos: evita el __dict__ por instancia
+    __slots__ = ('__tipo', '__dias', '__mascara')
+    
     def __init__(self, tipo: str, dias: List[str]):
         """
         Constructor de la clase Especialidad
@@ -18,30 +37,40 @@ class Especialidad:
         if not dias:
             raise ValueError("La lista de días no puede estar vacía")
         
-        # Validar días de la semana
-        dias_validos = ['lunes', 'martes', 'miércoles', 'miercoles', 'jueves', 'viernes', 'sábado', 'sabado', 'domingo']
-        dias_lower = [dia.lower() for dia in dias]
-        
-        for dia in dias_lower:
-            if dia not in dias_validos:
-                raise ValueError(f"Día inválido: {dia}")
+        # Validar días de la semana y construir la máscara (bit n = día n)
+        dias_lower = []
+        mascara = 0
+        for dia in dias:
+            dia_lower = dia.lower()
+            if dia_lower not in _DIAS_VALIDOS:
+                raise ValueError(f"Día inválido: {dia_lower}")
+            dias_lower.append(_DIAS_VALIDOS[dia_lower])
+            mascara |= 1 << _NUMERO_DIA[dia_lower]
         
         self.__tipo = tipo.strip()
-        self.__dias = dias_lower
+        self.__dias = tuple(dias_lower)
+        self.__mascara = mascara
     
     def obtener_especialidad(self) -> str:
         """Devuelve el nombre de la especialidad"""
         return self.__tipo
     
+    def obtener_dias(self) -> List[str]:
+        """Devuelve una copia de la lista de días de atención"""
+        return list(self.__dias)
+    
+    def obtener_mascara(self) -> int:
+        """Devuelve la máscara de días de atención (bit n encendido = día n, 0 = lunes)"""
+        return self.__mascara
+    
     def verificar_dia(self, dia: str) -> bool:
         """Verifica si la especialidad está disponible en el día proporcionado"""
-        # Normalizar 'miércoles' con y sin tilde
-        dia_normalizado = dia.lower()
-        if dia_normalizado == 'miércoles':
-            return 'miércoles' in self.__dias or 'miercoles' in self.__dias
-        elif dia_normalizado == 'miercoles':
-            return 'miércoles' in self.__dias or 'miercoles' in self.__dias
-        return dia_normalizado in self.__dias
+        numero = numero_dia(dia)
+        return numero is not None and self.verificar_numero_dia(numero)
+    
+    def verificar_numero_dia(self, numero: int) -> bool:
+        """Verifica la disponibilidad según datetime.weekday() (0 = lunes)"""
+        return bool(self.__mascara >> numero & 1)
     
     def __str__(self) -> str:
         """Devuelve una cadena legible con el nombre y días de atención"""
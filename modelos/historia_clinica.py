@@ -1,57 +1,247 @@
 """
 Clase HistoriaClinica - Representa la historia clínica de un paciente
 """
-from typing import List
+from contextlib import nullcontext
+from itertools import chain
+from typing import ContextManager, Dict, List, Optional, Set, TextIO
 from .paciente import Paciente
+from .medico import Medico
 from .turno import Turno
 from .receta import Receta
+from .vista import VistaSecuencia
+from .lista_vigentes import ListaVigentes
+
+# Cerrojo de las historias que se usan desde un solo hilo
+_SIN_CERROJO = nullcontext()
+# Separador entre las entradas de la historia en su texto
+_SEPARADOR = ",\n    "
+
+class _Textos:
+    """Textos ya renderizados de los turnos y recetas de una historia clínica"""
+    __slots__ = ('turnos', 'recetas', 'versiones', 'texto_turnos', 'texto_recetas', 'texto')
+
+    def __init__(self):
+        # Texto de cada turno (por el mismo objeto Turno) y de cada receta
+        self.turnos = ListaVigentes()
+        self.recetas: List[str] = []
+        # Médico -> versión de su texto con la que se renderizaron sus entradas
+        self.versiones: Dict[Medico, int] = {}
+        # Entradas ya unidas y texto completo; None si hay que volver a armarlos
+        self.texto_turnos: Optional[str] = ""
+        self.texto_recetas: Optional[str] = ""
+        self.texto: Optional[str] = None
 
 class HistoriaClinica:
-    def __init__(self, paciente: Paciente):
+    # Atributos fijos: evita el __dict__ por instancia
+    __slots__ = ('__paciente', '__turnos', '__recetas', '__textos', '__cerrojo')
+    
+    def __init__(self, paciente: Paciente, cerrojo: Optional[ContextManager] = None):
         """
         Constructor de la clase HistoriaClinica
         
         Args:
             paciente: Paciente al que pertenece la historia clínica
+            cerrojo: Cerrojo con el que el dueño de la historia (la Clinica en
+                     modo concurrente) serializa sus modificaciones; las lecturas
+                     lo toman también. None si la historia se usa desde un solo hilo.
         """
         if not isinstance(paciente, Paciente):
             raise TypeError("Se esperaba un objeto de tipo Paciente")
         
         self.__paciente = paciente
-        self.__turnos = []
-        self.__recetas = []
+        # Turnos por el mismo objeto Turno: cancelar o reprogramar no desplaza
+        # a los demás y cuesta O(log n). Turnos y recetas se crean con la
+        # primera entrada (o la primera vista): muchas historias quedan vacías
+        self.__turnos: Optional[ListaVigentes] = None
+        self.__recetas: Optional[List[Receta]] = None
+        # Textos memorizados (None hasta el primer __str__): al agregar entradas
+        # se extienden, y si cambia el texto de un médico se regeneran solo
+        # las entradas de ese médico
+        self.__textos: Optional[_Textos] = None
+        self.__cerrojo = cerrojo if cerrojo is not None else _SIN_CERROJO
     
     def agregar_turno(self, turno: Turno):
         """Agrega un nuevo turno a la historia clínica"""
         if not isinstance(turno, Turno):
             raise TypeError("Se esperaba un objeto de tipo Turno")
         
-        self.__turnos.append(turno)
+        self._turnos().agregar(turno, turno)
+        textos = self.__textos
+        if textos is not None:
+            parte = self._renderizar(turno)
+            textos.turnos.agregar(turno, parte)
+            if textos.texto_turnos is not None:
+                textos.texto_turnos = f"{textos.texto_turnos}{_SEPARADOR}{parte}" if textos.texto_turnos else parte
+            textos.texto = None
     
+    def quitar_turno(self, turno: Turno):
+        """Quita un turno cancelado o reprogramado (el mismo objeto) de la historia clínica"""
+        try:
+            self._turnos().quitar(turno)
+        except KeyError:
+            raise ValueError("El turno no está en la historia clínica") from None
+        textos = self.__textos
+        if textos is not None:
+            textos.turnos.quitar(turno)
+            textos.texto_turnos = textos.texto = None
+
+    def reemplazar_turno(self, anterior: Turno, turno: Turno):
+        """Reemplaza un turno reprogramado (el mismo objeto) por el nuevo, en su lugar"""
+        if not isinstance(turno, Turno):
+            raise TypeError("Se esperaba un objeto de tipo Turno")
+
+        try:
+            self._turnos().reemplazar(anterior, turno, turno)
+        except KeyError:
+            raise ValueError("El turno no está en la historia clínica") from None
+        textos = self.__textos
+        if textos is not None:
+            textos.turnos.reemplazar(anterior, self._renderizar(turno), turno)
+            textos.texto_turnos = textos.texto = None
+
     def agregar_receta(self, receta: Receta):
         """Agrega una nueva receta a la historia clínica"""
         if not isinstance(receta, Receta):
             raise TypeError("Se esperaba un objeto de tipo Receta")
         
-        self.__recetas.append(receta)
+        self._recetas().append(receta)
+        textos = self.__textos
+        if textos is not None:
+            parte = self._renderizar(receta)
+            textos.recetas.append(parte)
+            if textos.texto_recetas is not None:
+                textos.texto_recetas = f"{textos.texto_recetas}{_SEPARADOR}{parte}" if textos.texto_recetas else parte
+            textos.texto = None
+    
+    def _turnos(self) -> ListaVigentes:
+        if self.__turnos is None:
+            self.__turnos = ListaVigentes()
+        return self.__turnos
+    
+    def _recetas(self) -> List[Receta]:
+        if self.__recetas is None:
+            self.__recetas = []
+        return self.__recetas
+    
+    def obtener_turnos(self) -> VistaSecuencia:
+        """
+        Devuelve una vista de solo lectura de los turnos del paciente. Sin
+        cerrojo la vista refleja los cambios posteriores; con cerrojo es una
+        copia tomada con el cerrojo, que otros hilos no modifican.
+        """
+        if self.__cerrojo is _SIN_CERROJO:
+            return VistaSecuencia(self._turnos())
+        with self.__cerrojo:
+            return VistaSecuencia(list(self.__turnos or ()))
+    
+    def obtener_recetas(self) -> VistaSecuencia:
+        """Devuelve una vista de solo lectura de las recetas del paciente, como obtener_turnos"""
+        if self.__cerrojo is _SIN_CERROJO:
+            return VistaSecuencia(self._recetas())
+        with self.__cerrojo:
+            return VistaSecuencia(list(self.__recetas or ()))
+    
+    def _renderizar(self, entrada) -> str:
+        """Renderiza un turno o receta y anota la versión del texto de su médico"""
+        medico = entrada.obtener_medico()
+        # La versión se lee antes del texto: si cambia en el medio, la entrada
+        # queda anotada con la versión vieja y se vuelve a renderizar
+        version = medico.obtener_version_texto()
+        parte = str(entrada)
+        # Si el médico ya tenía entradas con otra versión, se conserva esa para
+        # que la próxima lectura las detecte como desactualizadas
+        self.__textos.versiones.setdefault(medico, version)
+        return parte
+    
+    def _medicos_desactualizados(self) -> Set[Medico]:
+        """Médicos cuyo texto cambió desde que se renderizaron sus entradas"""
+        return {medico for medico, version in self.__textos.versiones.items()
+                if medico.obtener_version_texto() != version}
+    
+    def _actualizar_textos(self) -> _Textos:
+        """Renderiza las entradas que faltan o cuyo médico cambió y devuelve los textos"""
+        textos = self.__textos
+        if textos is None:
+            textos = self.__textos = _Textos()
+            for turno in self.__turnos or ():
+                textos.turnos.agregar(turno, self._renderizar(turno))
+            textos.recetas = [self._renderizar(receta) for receta in self.__recetas or ()]
+            textos.texto_turnos = textos.texto_recetas = None
+            return textos
+        
+        desactualizados = self._medicos_desactualizados()
+        if desactualizados:
+            for medico in desactualizados:
+                del textos.versiones[medico]
+            # Solo se regeneran las entradas de esos médicos
+            for turno in self.__turnos or ():
+                if turno.obtener_medico() in desactualizados:
+                    textos.turnos.reemplazar(turno, self._renderizar(turno))
+            for numero, receta in enumerate(self.__recetas or ()):
+                if receta.obtener_medico() in desactualizados:
+                    textos.recetas[numero] = self._renderizar(receta)
+            textos.texto_turnos = textos.texto_recetas = textos.texto = None
+        return textos
     
-    def obtener_turnos(self) -> List[Turno]:
-        """Devuelve una copia de la lista de turnos del paciente"""
-        return self.__turnos.copy()
+    def escribir(self, salida: TextIO, offset: int = 0, limite: Optional[int] = None):
+        """
+        Escribe la historia clínica en un objeto tipo archivo, entrada por
+        entrada, sin construir el texto completo en memoria. Si la historia
+        tiene cerrojo, se escribe con el cerrojo tomado.
+        
+        Args:
+            salida: Destino con método write (ej: sys.stdout o un archivo abierto)
+            offset: Cantidad de entradas (turnos y luego recetas) a omitir
+            limite: Cantidad máxima de entradas a escribir (None = todas)
+        """
+        if offset < 0 or (limite is not None and limite < 0):
+            raise ValueError("El offset y el límite no pueden ser negativos")
+        with self.__cerrojo:
+            self._escribir(salida, offset, limite)
     
-    def obtener_recetas(self) -> List[Receta]:
-        """Devuelve una copia de la lista de recetas del paciente"""
-        return self.__recetas.copy()
+    def _escribir(self, salida: TextIO, offset: int, limite: Optional[int]):
+        total = len(self.__turnos or ()) + len(self.__recetas or ())
+        fin = total if limite is None else min(total, offset + limite)
+        
+        salida.write(f"HistoriaClinica(Paciente({self.__paciente}),\n")
+        if offset >= fin:
+            salida.write("  []\n)")
+            return
+        
+        # Usar los textos memorizados si están al día; si no, renderizar al vuelo
+        if self.__textos is not None and not self._medicos_desactualizados():
+            turnos, recetas = self.__textos.turnos, self.__textos.recetas
+        else:
+            turnos, recetas = self.__turnos or (), self.__recetas or ()
+        
+        salida.write("  [\n    ")
+        cantidad_turnos = len(turnos)
+        # Por slices: ubicar el comienzo cuesta O(log n) aunque haya turnos cancelados
+        entradas = chain(turnos[offset:fin],
+                         recetas[max(offset - cantidad_turnos, 0):max(fin - cantidad_turnos, 0)])
+        for numero, entrada in enumerate(entradas):
+            if numero:
+                salida.write(_SEPARADOR)
+            salida.write(str(entrada))
+        salida.write("\n  ]\n)")
     
     def __str__(self) -> str:
         """Devuelve una representación textual de la historia clínica"""
-        elementos = []
-        elementos.extend(self.__turnos)
-        elementos.extend(self.__recetas)
-        
-        if elementos:
-            elementos_str = ",\n    ".join([str(elem) for elem in elementos])
-            return (f"HistoriaClinica(Paciente({self.__paciente}),\n"
-                   f"  [\n    {elementos_str}\n  ]\n)")
-        else:
-            return f"HistoriaClinica(Paciente({self.__paciente}),\n  []\n)"
\ No newline at end of file
+        with self.__cerrojo:
+            textos = self._actualizar_textos()
+            if textos.texto is None:
+                if textos.texto_turnos is None:
+                    textos.texto_turnos = _SEPARADOR.join(textos.turnos)
+                if textos.texto_recetas is None:
+                    textos.texto_recetas = _SEPARADOR.join(textos.recetas)
+                # Las dos mitades ya están unidas: armar el texto es concatenarlas
+                if textos.texto_turnos and textos.texto_recetas:
+                    elementos_str = f"{textos.texto_turnos}{_SEPARADOR}{textos.texto_recetas}"
+                else:
+                    elementos_str = textos.texto_turnos or textos.texto_recetas
+                if elementos_str:
+                    textos.texto = (f"HistoriaClinica(Paciente({self.__paciente}),\n"
+                                    f"  [\n    {elementos_str}\n  ]\n)")
+                else:
+                    textos.texto = f"HistoriaClinica(Paciente({self.__paciente}),\n  []\n)"
+            return textos.texto
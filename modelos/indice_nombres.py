@@ -0,0 +1,141 @@
+"""
+Clase IndiceNombres - Índice de búsqueda por prefijo y aproximada sobre nombres
+"""
+import re
+import sys
+from bisect import bisect_left
+from heapq import merge
+from typing import Any, Dict, Iterable, List, Set, Tuple
+from .normalizacion import normalizar_texto
+
+_PALABRA = re.compile(r"\w+")
+
+class IndiceNombres:
+    # Atributos fijos: evita el __dict__ por instancia
+    __slots__ = ('__elementos', '__palabras_elemento', '__posiciones', '__palabras',
+                 '__palabras_nuevas', '__variantes')
+
+    # Largo mínimo de un término para intentar coincidencias aproximadas
+    LARGO_MINIMO_APROXIMADO = 3
+
+    def __init__(self):
+        """
+        Constructor de la clase IndiceNombres
+
+        Cada elemento recibe una posición según su orden de alta. Los nombres
+        se normalizan (sin tildes ni mayúsculas) y se dividen en palabras:
+        - palabra -> posiciones de los elementos que la contienen (ascendentes)
+        - lista ordenada de palabras distintas, para resolver prefijos con bisect;
+          las palabras nuevas se acumulan aparte y se ordenan recién en la
+          siguiente búsqueda, así una carga masiva no reordena en cada alta
+        - variante con una letra borrada -> palabras que la generan, para
+          encontrar palabras a una edición de distancia (errores de tipeo)
+        """
+        self.__elementos: List[Any] = []
+        self.__palabras_elemento: List[Tuple[str, ...]] = []
+        self.__posiciones: Dict[str, List[int]] = {}
+        self.__palabras: List[str] = []
+        self.__palabras_nuevas: List[str] = []
+        self.__variantes: Dict[str, Set[str]] = {}
+
+    def agregar(self, nombre: str, elemento: Any):
+        """Indexa el elemento bajo las palabras de su nombre"""
+        posicion = len(self.__elementos)
+        palabras = tuple(dict.fromkeys(sys.intern(p) for p in _dividir(nombre)))
+        self.__elementos.append(elemento)
+        self.__palabras_elemento.append(palabras)
+
+        for palabra in palabras:
+            posiciones = self.__posiciones.get(palabra)
+            if posiciones is None:
+                posiciones = self.__posiciones[palabra] = []
+                self.__palabras_nuevas.append(palabra)
+                for variante in _variantes(palabra):
+                    self.__variantes.setdefault(variante, set()).add(palabra)
+            posiciones.append(posicion)
+
+    def buscar(self, texto: str, limite: int = 20) -> List[Any]:
+        """
+        Devuelve hasta `limite` elementos, en orden de alta, cuyo nombre
+        contiene para cada palabra del texto una palabra que empieza con ella
+        (o, si ninguna empieza con ella, una a una edición de distancia).
+        """
+        if limite < 0:
+            raise ValueError("El límite no puede ser negativo")
+
+        terminos = list(dict.fromkeys(_dividir(texto)))
+        if not terminos or limite == 0:
+            return []
+
+        if self.__palabras_nuevas:
+            # Timsort aprovecha que la lista existente ya está ordenada
+            self.__palabras.extend(self.__palabras_nuevas)
+            self.__palabras.sort()
+            self.__palabras_nuevas.clear()
+
+        coincidencias = [self._palabras_coincidentes(termino) for termino in terminos]
+        if not all(coincidencias):
+            return []
+
+        # Recorrer las posiciones del término más selectivo y filtrar por los demás
+        coincidencias.sort(key=lambda palabras: sum(len(self.__posiciones[p]) for p in palabras))
+        guia, restantes = coincidencias[0], coincidencias[1:]
+
+        resultado: List[Any] = []
+        anterior = -1
+        for posicion in merge(*(self.__posiciones[p] for p in guia)):
+            if posicion == anterior:
+                continue
+            anterior = posicion
+            palabras = self.__palabras_elemento[posicion]
+            if all(any(p in aceptadas for p in palabras) for aceptadas in restantes):
+                resultado.append(self.__elementos[posicion])
+                if len(resultado) == limite:
+                    break
+        return resultado
+
+    def _palabras_coincidentes(self, termino: str) -> Set[str]:
+        """Palabras indexadas que empiezan con el término o, si no hay, a una edición de él"""
+        inicio = bisect_left(self.__palabras, termino)
+        fin = bisect_left(self.__palabras, termino + "\U0010ffff", inicio)
+        if inicio < fin:
+            return set(self.__palabras[inicio:fin])
+
+        if len(termino) < self.LARGO_MINIMO_APROXIMADO:
+            return set()
+        candidatas: Set[str] = set()
+        for variante in _variantes(termino):
+            candidatas.update(self.__variantes.get(variante, ()))
+        return {palabra for palabra in candidatas if _a_una_edicion(termino, palabra)}
+
+    def __len__(self) -> int:
+        """Devuelve la cantidad de elementos indexados"""
+        return len(self.__elementos)
+
+
+def _dividir(texto: str) -> List[str]:
+    """Normaliza el texto y lo divide en palabras, descartando la puntuación"""
+    return _PALABRA.findall(normalizar_texto(texto))
+
+def _variantes(palabra: str) -> Iterable[str]:
+    """La palabra y todas las que resultan de borrarle una letra"""
+    yield palabra
+    for i in range(len(palabra)):
+        yield palabra[:i] + palabra[i + 1:]
+
+def _a_una_edicion(a: str, b: str) -> bool:
+    """Indica si a y b difieren en a lo sumo una inserción, borrado, reemplazo o transposición"""
+    if abs(len(a) - len(b)) > 1:
+        return False
+    # Saltear el prefijo y el sufijo comunes y comparar lo que queda
+    inicio = 0
+    while inicio < len(a) and inicio < len(b) and a[inicio] == b[inicio]:
+        inicio += 1
+    fin_a, fin_b = len(a), len(b)
+    while fin_a > inicio and fin_b > inicio and a[fin_a - 1] == b[fin_b - 1]:
+        fin_a -= 1
+        fin_b -= 1
+    resto_a, resto_b = a[inicio:fin_a], b[inicio:fin_b]
+    if len(resto_a) <= 1 and len(resto_b) <= 1:
+        return True
+    return len(resto_a) == len(resto_b) == 2 and resto_a == resto_b[::-1]
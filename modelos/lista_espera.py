@@ -0,0 +1,213 @@
+"""
+Clases SolicitudEspera y ListaEspera - Lista de espera con prioridad para
+ocupar los horarios que se liberan
+"""
+import heapq
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from .turno import Turno
+
+# Clave de cada cola: (especialidad, matrícula) o (especialidad, None) para
+# los pacientes que aceptan a cualquier médico de la especialidad
+ClaveEspera = Tuple[str, Optional[str]]
+
+PENDIENTE = "pendiente"
+ASIGNADA  = "asignada"
+RETIRADA  = "retirada"
+
+
+class SolicitudEspera:
+    # Atributos fijos: evita el __dict__ por instancia
+    __slots__ = ('__id', '__dni', '__especialidad', '__matricula', '__prioridad',
+                 '__duracion', '__desde', '__hasta', '__fecha_solicitud', '__estado', '__turno')
+
+    def __init__(self, id_solicitud: int, dni: str, especialidad: str,
+                 matricula: Optional[str] = None, prioridad: int = 0,
+                 duracion: Optional[timedelta] = None, desde: Optional[datetime] = None,
+                 hasta: Optional[datetime] = None):
+        """
+        Constructor de la clase SolicitudEspera
+
+        Args:
+            id_solicitud: Identificador asignado por la lista de espera
+            dni: DNI del paciente que espera
+            especialidad: Especialidad del turno buscado
+            matricula: Médico pedido, o None si sirve cualquiera de la especialidad
+            prioridad: Mayor número, mayor prioridad; a igual prioridad, por orden de llegada
+            duracion: Duración del turno buscado (por defecto, la de Turno)
+            desde: El turno no puede empezar antes (None = sin restricción)
+            hasta: El turno debe empezar antes de este momento (None = sin restricción)
+        """
+        if not especialidad or not especialidad.strip():
+            raise ValueError("La especialidad no puede estar vacía")
+        if isinstance(prioridad, bool) or not isinstance(prioridad, int):
+            raise TypeError("La prioridad debe ser un número entero")
+        if duracion is None:
+            duracion = Turno.DURACION_POR_DEFECTO
+        if not isinstance(duracion, timedelta) or duracion <= timedelta(0):
+            raise ValueError("La duración debe ser un timedelta positivo")
+        if desde is not None and hasta is not None and desde >= hasta:
+            raise ValueError("El inicio de la franja debe ser anterior a su fin")
+
+        self.__id = id_solicitud
+        self.__dni = dni
+        self.__especialidad = especialidad.strip()
+        self.__matricula = matricula
+        self.__prioridad = prioridad
+        self.__duracion = duracion
+        self.__desde = desde
+        self.__hasta = hasta
+        self.__fecha_solicitud = datetime.now()
+        self.__estado = PENDIENTE
+        self.__turno: Optional[Turno] = None
+
+    def obtener_id(self) -> int:
+        return self.__id
+
+    def obtener_dni(self) -> str:
+        return self.__dni
+
+    def obtener_especialidad(self) -> str:
+        return self.__especialidad
+
+    def obtener_matricula(self) -> Optional[str]:
+        """Devuelve el médico pedido, o None si sirve cualquiera"""
+        return self.__matricula
+
+    def obtener_prioridad(self) -> int:
+        return self.__prioridad
+
+    def obtener_duracion(self) -> timedelta:
+        return self.__duracion
+
+    def obtener_fecha_solicitud(self) -> datetime:
+        return self.__fecha_solicitud
+
+    def obtener_estado(self) -> str:
+        """Devuelve "pendiente", "asignada" o "retirada" """
+        return self.__estado
+
+    def obtener_turno(self) -> Optional[Turno]:
+        """Devuelve el turno asignado, o None si la solicitud no fue asignada"""
+        return self.__turno
+
+    def obtener_clave(self) -> ClaveEspera:
+        return self.__especialidad, self.__matricula
+
+    def admite(self, fecha_hora: datetime) -> bool:
+        """Indica si un turno que empieza en fecha_hora cae en la franja pedida"""
+        return ((self.__desde is None or fecha_hora >= self.__desde)
+                and (self.__hasta is None or fecha_hora < self.__hasta))
+
+    def _asignar(self, turno: Turno):
+        self.__estado = ASIGNADA
+        self.__turno = turno
+
+    def _retirar(self):
+        self.__estado = RETIRADA
+
+    def __str__(self) -> str:
+        medico = self.__matricula or "cualquier médico"
+        return (f"SolicitudEspera({self.__id}, {self.__dni}, {self.__especialidad}, "
+                f"{medico}, prioridad {self.__prioridad}, {self.__estado})")
+
+
+class ListaEspera:
+    # Atributos fijos: evita el __dict__ por instancia
+    __slots__ = ('__colas', '__pendientes', '__proximo_id')
+
+    def __init__(self):
+        """
+        Constructor de la clase ListaEspera
+
+        Mantiene un montículo por clave (especialidad, matrícula o None)
+        ordenado por (-prioridad, id): el tope es la solicitud más prioritaria
+        y, entre iguales, la más antigua. Las solicitudes retiradas se
+        descartan recién cuando llegan al tope (borrado perezoso), así que
+        agregar, retirar y tomar la mejor cuestan O(log n).
+        """
+        self.__colas: Dict[ClaveEspera, List[Tuple[int, int, SolicitudEspera]]] = {}
+        self.__pendientes: Dict[int, SolicitudEspera] = {}
+        self.__proximo_id = 1
+
+    def agregar(self, dni: str, especialidad: str, matricula: Optional[str] = None,
+                prioridad: int = 0, duracion: Optional[timedelta] = None,
+                desde: Optional[datetime] = None,
+                hasta: Optional[datetime] = None) -> SolicitudEspera:
+        """Crea una solicitud pendiente y la encola; ver SolicitudEspera"""
+        solicitud = SolicitudEspera(self.__proximo_id, dni, especialidad, matricula, prioridad,
+                                    duracion, desde, hasta)
+        self.__proximo_id += 1
+        self.__pendientes[solicitud.obtener_id()] = solicitud
+        cola = self.__colas.setdefault(solicitud.obtener_clave(), [])
+        heapq.heappush(cola, (-prioridad, solicitud.obtener_id(), solicitud))
+        return solicitud
+
+    def retirar(self, id_solicitud: int) -> SolicitudEspera:
+        """Retira una solicitud pendiente de la lista"""
+        solicitud = self.__pendientes.pop(id_solicitud, None)
+        if solicitud is None:
+            raise ValueError(f"No hay una solicitud pendiente con id {id_solicitud}")
+        solicitud._retirar()
+        return solicitud
+
+    def obtener_pendiente(self, id_solicitud: int) -> Optional[SolicitudEspera]:
+        return self.__pendientes.get(id_solicitud)
+
+    def obtener_pendientes(self) -> List[SolicitudEspera]:
+        """Devuelve las solicitudes pendientes en orden de llegada"""
+        return list(self.__pendientes.values())
+
+    def asignar_mejor(
+        self,
+        claves: Iterable[ClaveEspera],
+        intentar: Callable[[SolicitudEspera], Optional[Turno]],
+    ) -> Optional[SolicitudEspera]:
+        """
+        Ofrece un horario a las solicitudes de las colas indicadas, de la más
+        prioritaria a la menos, hasta que `intentar` devuelve un turno.
+
+        Solo se recorren los topes de las colas: si la primera solicitud
+        acepta el horario, el costo es O(log n). Las que no pueden tomarlo
+        (franja, duración, otro turno a esa hora) vuelven a su cola.
+
+        Returns:
+            La solicitud asignada, o None si ninguna pudo tomar el horario
+        """
+        # Montículo con el tope de cada cola: ((-prioridad, id), clave)
+        frentes = []
+        for clave in dict.fromkeys(claves):
+            cola = self.__colas.get(clave)
+            if cola and self.__depurar(cola):
+                frentes.append((cola[0][:2], clave))
+        heapq.heapify(frentes)
+
+        rechazadas: List[Tuple[ClaveEspera, Tuple[int, int, SolicitudEspera]]] = []
+        try:
+            while frentes:
+                _, clave = heapq.heappop(frentes)
+                cola = self.__colas[clave]
+                entrada = heapq.heappop(cola)
+                solicitud = entrada[2]
+                turno = intentar(solicitud)
+                if turno is not None:
+                    del self.__pendientes[solicitud.obtener_id()]
+                    solicitud._asignar(turno)
+                    return solicitud
+                rechazadas.append((clave, entrada))
+                if self.__depurar(cola):
+                    heapq.heappush(frentes, (cola[0][:2], clave))
+            return None
+        finally:
+            for clave, entrada in rechazadas:
+                heapq.heappush(self.__colas[clave], entrada)
+
+    def __depurar(self, cola: List[Tuple[int, int, SolicitudEspera]]) -> bool:
+        """Descarta del tope las solicitudes que ya no están pendientes; indica si quedan"""
+        while cola and cola[0][2].obtener_estado() != PENDIENTE:
+            heapq.heappop(cola)
+        return bool(cola)
+
+    def __len__(self) -> int:
+        """Devuelve la cantidad de solicitudes pendientes"""
+        return len(self.__pendientes)
@@ -0,0 +1,127 @@
+"""
+Clase ListaVigentes - Elementos en orden de alta, con bajas y reemplazos
+que no desplazan a los demás
+"""
+from collections.abc import Sequence
+from typing import Any, Dict, Hashable, Iterator, List
+
+# Marca de la posición de un elemento dado de baja
+_BAJA = object()
+
+class ListaVigentes(Sequence):
+    # Atributos fijos: evita el __dict__ por instancia
+    __slots__ = ('__elementos', '__claves', '__arbol', '__posiciones', '__vigentes')
+
+    def __init__(self):
+        """
+        Constructor de la clase ListaVigentes
+
+        Cada elemento se identifica por una clave. Dar de baja un elemento deja
+        una marca en su posición en lugar de desplazar a los siguientes, y un
+        árbol de Fenwick cuenta los vigentes hasta cada posición: la baja y el
+        acceso por índice cuestan O(log n), y reemplazar un elemento O(1) sin
+        cambiarlo de lugar. Cuando las marcas superan a los vigentes se compacta
+        la lista, en O(n) amortizado entre las bajas que la provocaron.
+        """
+        self.__elementos: List[Any] = []
+        # Clave de cada posición, para compactar
+        self.__claves: List[Hashable] = []
+        # arbol[i] = vigentes en las posiciones (i - (i & -i), i], numeradas desde 1
+        self.__arbol: List[int] = [0]
+        # Clave -> posición
+        self.__posiciones: Dict[Hashable, int] = {}
+        self.__vigentes = 0
+
+    def agregar(self, clave: Hashable, elemento: Any) -> None:
+        """Agrega el elemento al final"""
+        if clave in self.__posiciones:
+            raise ValueError(f"Ya existe un elemento con clave {clave!r}")
+        self.__posiciones[clave] = len(self.__elementos)
+        self.__elementos.append(elemento)
+        self.__claves.append(clave)
+        # El nodo nuevo suma su elemento y los nodos que cubren el resto de su rango
+        indice = len(self.__elementos)
+        cantidad, paso = 1, 1
+        while paso < indice & -indice:
+            cantidad += self.__arbol[indice - paso]
+            paso <<= 1
+        self.__arbol.append(cantidad)
+        self.__vigentes += 1
+
+    def quitar(self, clave: Hashable) -> None:
+        """Da de baja el elemento con esa clave"""
+        posicion = self.__posiciones.pop(clave)
+        self.__elementos[posicion] = _BAJA
+        indice = posicion + 1
+        while indice < len(self.__arbol):
+            self.__arbol[indice] -= 1
+            indice += indice & -indice
+        self.__vigentes -= 1
+        if len(self.__elementos) > 2 * self.__vigentes:
+            self.__compactar()
+
+    def reemplazar(self, clave: Hashable, elemento: Any, nueva_clave: Hashable = None) -> None:
+        """Reemplaza el elemento con esa clave, conservando su posición (y opcionalmente cambia la clave)"""
+        posicion = self.__posiciones[clave]
+        if nueva_clave is not None and nueva_clave != clave:
+            if nueva_clave in self.__posiciones:
+                raise ValueError(f"Ya existe un elemento con clave {nueva_clave!r}")
+            del self.__posiciones[clave]
+            self.__posiciones[nueva_clave] = posicion
+            self.__claves[posicion] = nueva_clave
+        self.__elementos[posicion] = elemento
+
+    def __compactar(self) -> None:
+        """Descarta las marcas de baja; todas las posiciones quedan vigentes"""
+        vigentes = [p for p, e in enumerate(self.__elementos) if e is not _BAJA]
+        self.__elementos = [self.__elementos[p] for p in vigentes]
+        self.__claves = [self.__claves[p] for p in vigentes]
+        self.__posiciones = {clave: p for p, clave in enumerate(self.__claves)}
+        self.__arbol = [0] + [i & -i for i in range(1, len(self.__elementos) + 1)]
+
+    def __posicion(self, indice: int) -> int:
+        """Posición del elemento vigente número `indice` (desde 0), por descenso en el árbol"""
+        posicion, resto = 0, indice + 1
+        paso = 1 << (len(self.__arbol) - 1).bit_length()
+        while paso:
+            siguiente = posicion + paso
+            if siguiente < len(self.__arbol) and self.__arbol[siguiente] < resto:
+                posicion = siguiente
+                resto -= self.__arbol[siguiente]
+            paso >>= 1
+        return posicion
+
+    def __len__(self) -> int:
+        return self.__vigentes
+
+    def __getitem__(self, indice):
+        """Devuelve un elemento; con un slice devuelve una lista nueva"""
+        if isinstance(indice, slice):
+            inicio, fin, paso = indice.indices(self.__vigentes)
+            if paso != 1:
+                return [self[i] for i in range(inicio, fin, paso)]
+            resultado: List[Any] = []
+            if inicio >= fin:
+                return resultado
+            elementos = self.__elementos
+            posicion = self.__posicion(inicio)
+            while len(resultado) < fin - inicio and posicion < len(elementos):
+                if elementos[posicion] is not _BAJA:
+                    resultado.append(elementos[posicion])
+                posicion += 1
+            return resultado
+
+        if indice < 0:
+            indice += self.__vigentes
+        if not 0 <= indice < self.__vigentes:
+            raise IndexError("Índice fuera de rango")
+        return self.__elementos[self.__posicion(indice)]
+
+    def __iter__(self) -> Iterator[Any]:
+        return (e for e in self.__elementos if e is not _BAJA)
+
+    def __reversed__(self) -> Iterator[Any]:
+        return (e for e in reversed(self.__elementos) if e is not _BAJA)
+
+    def __repr__(self) -> str:
+        return f"ListaVigentes({list(self)!r})"
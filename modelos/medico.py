@@ -1,10 +1,15 @@
 """
 Clase Medico - Representa a un médico del sistema
 """
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional
 from .especialidad import Especialidad
+from .vista import VistaSecuencia
 
 class Medico:
+    # Atributos fijos: evita el __dict__ por instancia
+    __slots__ = ('__nombre', '__matricula', '__especialidades', '__mascaras', '__observadores',
+                 '__texto', '__version_texto')
+    
     def __init__(self, nombre: str, matricula: str, especialidades: List[Especialidad] = None):
         """
         Constructor de la clase Medico
@@ -23,6 +28,19 @@ class Medico:
         self.__nombre = nombre.strip()
         self.__matricula = matricula.strip()
         self.__especialidades = especialidades if especialidades is not None else []
+        # Nombre de especialidad -> máscara de días en que la atiende
+        self.__mascaras: Dict[str, int] = {}
+        for especialidad in self.__especialidades:
+            tipo = especialidad.obtener_especialidad()
+            self.__mascaras[tipo] = self.__mascaras.get(tipo, 0) | especialidad.obtener_mascara()
+        # Funciones a notificar cuando se agrega una especialidad (ej: la Clinica);
+        # la lista se crea con el primer observador
+        self.__observadores: Optional[List[Callable[['Medico', Especialidad], None]]] = None
+        # Representación textual memorizada (se invalida al agregar especialidades)
+        self.__texto: Optional[str] = None
+        # Se incrementa cada vez que cambia la representación del médico, para
+        # que quienes guardan textos ya renderizados sepan invalidarlos
+        self.__version_texto = 0
     
     def agregar_especialidad(self, especialidad: Especialidad):
         """Agrega una especialidad a la lista del médico"""
@@ -30,16 +48,40 @@ class Medico:
             raise TypeError("Se esperaba un objeto de tipo Especialidad")
         
         # Verificar que no exista ya la especialidad
-        for esp in self.__especialidades:
-            if esp.obtener_especialidad() == especialidad.obtener_especialidad():
-                raise ValueError(f"La especialidad {especialidad.obtener_especialidad()} ya existe para este médico")
+        tipo = especialidad.obtener_especialidad()
+        if tipo in self.__mascaras:
+            raise ValueError(f"La especialidad {tipo} ya existe para este médico")
         
         self.__especialidades.append(especialidad)
+        self.__mascaras[tipo] = especialidad.obtener_mascara()
+        self.__texto = None
+        # Después de cambiar el texto: quien lea la versión nueva ve el texto nuevo
+        self.__version_texto += 1
+        for observador in self.__observadores or ():
+            observador(self, especialidad)
+    
+    def agregar_observador(self, observador: Callable[['Medico', Especialidad], None]):
+        """Registra una función que se invoca con (medico, especialidad) al agregar una especialidad"""
+        if self.__observadores is None:
+            self.__observadores = []
+        self.__observadores.append(observador)
     
     def obtener_matricula(self) -> str:
         """Devuelve la matrícula del médico"""
         return self.__matricula
     
+    def obtener_nombre(self) -> str:
+        """Devuelve el nombre del médico"""
+        return self.__nombre
+    
+    def atiende(self, especialidad: str, numero_dia: int) -> bool:
+        """Indica si atiende la especialidad el día dado por datetime.weekday() (0 = lunes)"""
+        return bool(self.__mascaras.get(especialidad, 0) >> numero_dia & 1)
+    
+    def obtener_mascara_especialidad(self, especialidad: str) -> int:
+        """Devuelve la máscara de días en que atiende la especialidad (0 si no la atiende)"""
+        return self.__mascaras.get(especialidad, 0)
+    
     def obtener_especialidad_para_dia(self, dia: str) -> Optional[str]:
         """Devuelve el nombre de la especialidad disponible en el día especificado"""
         for especialidad in self.__especialidades:
@@ -47,14 +89,20 @@ class Medico:
                 return especialidad.obtener_especialidad()
         return None
     
-    def obtener_especialidades(self) -> List[Especialidad]:
-        """Devuelve la lista de especialidades del médico"""
-        return self.__especialidades.copy()
+    def obtener_especialidades(self) -> VistaSecuencia:
+        """Devuelve una vista de solo lectura de las especialidades del médico"""
+        return VistaSecuencia(self.__especialidades)
+    
+    def obtener_version_texto(self) -> int:
+        """Devuelve un contador que cambia cada vez que cambia el texto del médico"""
+        return self.__version_texto
     
     def __str__(self) -> str:
         """Devuelve una representación legible del médico"""
-        if self.__especialidades:
-            especialidades_str = ", ".join([str(esp) for esp in self.__especialidades])
-            return f"{self.__nombre}, {self.__matricula}, [{especialidades_str}]"
-        else:
-            return f"{self.__nombre}, {self.__matricula}, []"
\ No newline at end of file
+        if self.__texto is None:
+            if self.__especialidades:
+                especialidades_str = ", ".join([str(esp) for esp in self.__especialidades])
+                self.__texto = f"{self.__nombre}, {self.__matricula}, [{especialidades_str}]"
+            else:
+                self.__texto = f"{self.__nombre}, {self.__matricula}, []"
+        return self.__texto
\ No newline at end of file
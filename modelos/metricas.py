@@ -0,0 +1,151 @@
+"""
+Clase Metricas - Conteo de llamadas, errores por tipo e histogramas de latencia
+"""
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+class Metricas:
+    # Atributos fijos: evita el __dict__ por instancia
+    __slots__ = ('__llamadas', '__errores', '__histogramas', '__segundos', '__maximos',
+                 '__cerrojo')
+
+    # Los histogramas usan cubetas de ancho exponencial: la cubeta i cuenta
+    # las llamadas que tardaron menos de 2**i microsegundos (la última, el resto)
+    CUBETAS = 32
+
+    def __init__(self):
+        """
+        Constructor de la clase Metricas
+
+        Por cada operación se guardan la cantidad de llamadas, los errores por
+        tipo de excepción, el tiempo total y máximo y un histograma de latencias.
+        """
+        self.__llamadas: Dict[str, int] = {}
+        self.__errores: Dict[str, Dict[str, int]] = {}
+        self.__histogramas: Dict[str, List[int]] = {}
+        self.__segundos: Dict[str, float] = {}
+        self.__maximos: Dict[str, float] = {}
+        self.__cerrojo = threading.Lock()
+
+    def registrar(self, operacion: str, segundos: float, error: Optional[BaseException] = None):
+        """Registra una llamada a la operación, su duración y el error que lanzó (si lanzó)"""
+        cubeta = min(int(segundos * 1e6).bit_length(), self.CUBETAS - 1)
+        with self.__cerrojo:
+            histograma = self.__histogramas.get(operacion)
+            if histograma is None:
+                histograma = self.__histogramas[operacion] = [0] * self.CUBETAS
+                self.__llamadas[operacion] = 0
+                self.__segundos[operacion] = 0.0
+                self.__maximos[operacion] = 0.0
+            histograma[cubeta] += 1
+            self.__llamadas[operacion] += 1
+            self.__segundos[operacion] += segundos
+            if segundos > self.__maximos[operacion]:
+                self.__maximos[operacion] = segundos
+            if error is not None:
+                por_tipo = self.__errores.setdefault(operacion, {})
+                tipo = type(error).__name__
+                por_tipo[tipo] = por_tipo.get(tipo, 0) + 1
+
+    @contextmanager
+    def medir(self, operacion: str) -> Iterator[None]:
+        """Mide el bloque `with` como una llamada a la operación"""
+        inicio = time.perf_counter()
+        try:
+            yield
+        except BaseException as e:
+            self.registrar(operacion, time.perf_counter() - inicio, e)
+            raise
+        self.registrar(operacion, time.perf_counter() - inicio)
+
+    def envolver(self, operacion: str, funcion: Callable) -> Callable:
+        """Devuelve la función envuelta para que cada llamada se registre como la operación"""
+        registrar = self.registrar
+        reloj = time.perf_counter
+
+        @functools.wraps(funcion)
+        def medida(*args, **kwargs):
+            inicio = reloj()
+            try:
+                resultado = funcion(*args, **kwargs)
+            except BaseException as e:
+                registrar(operacion, reloj() - inicio, e)
+                raise
+            registrar(operacion, reloj() - inicio)
+            return resultado
+        return medida
+
+    def instrumentar(self, objeto: Any, nombres: Iterable[str], prefijo: str = ""):
+        """Reemplaza en la instancia cada método nombrado por su versión medida"""
+        for nombre in nombres:
+            metodo = getattr(type(objeto), nombre).__get__(objeto)
+            setattr(objeto, nombre, self.envolver(prefijo + nombre, metodo))
+
+    @staticmethod
+    def desinstrumentar(objeto: Any, nombres: Iterable[str]):
+        """Quita de la instancia los métodos medidos y vuelve a los de la clase"""
+        for nombre in nombres:
+            vars(objeto).pop(nombre, None)
+
+    def obtener_resumen(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Devuelve, por operación: llamadas, errores por tipo, tiempo total y
+        promedio, máximo y percentiles 50/95/99 aproximados (en microsegundos,
+        como límite superior de la cubeta del histograma) y el histograma.
+        """
+        with self.__cerrojo:
+            resumen = {}
+            for operacion, histograma in self.__histogramas.items():
+                llamadas = self.__llamadas[operacion]
+                resumen[operacion] = {
+                    "llamadas": llamadas,
+                    "errores": dict(self.__errores.get(operacion, {})),
+                    "total_ms": round(self.__segundos[operacion] * 1e3, 3),
+                    "promedio_us": round(self.__segundos[operacion] / llamadas * 1e6, 3),
+                    "maximo_us": round(self.__maximos[operacion] * 1e6, 3),
+                    "p50_us": _percentil(histograma, llamadas, 0.50),
+                    "p95_us": _percentil(histograma, llamadas, 0.95),
+                    "p99_us": _percentil(histograma, llamadas, 0.99),
+                    "histograma": list(histograma),
+                }
+            return resumen
+
+    def reiniciar(self):
+        """Descarta todo lo registrado hasta el momento"""
+        with self.__cerrojo:
+            self.__llamadas.clear()
+            self.__errores.clear()
+            self.__histogramas.clear()
+            self.__segundos.clear()
+            self.__maximos.clear()
+
+    def __str__(self) -> str:
+        """Devuelve una tabla legible con el resumen de cada operación"""
+        resumen = self.obtener_resumen()
+        if not resumen:
+            return "Sin llamadas registradas"
+        lineas = [f"{'operación':<36} {'llamadas':>9} {'prom µs':>9} {'p50 µs':>8} "
+                  f"{'p95 µs':>8} {'p99 µs':>8} {'máx µs':>10}  errores"]
+        for operacion in sorted(resumen):
+            datos = resumen[operacion]
+            errores = ", ".join(f"{tipo}={n}" for tipo, n in sorted(datos["errores"].items()))
+            lineas.append(
+                f"{operacion:<36} {datos['llamadas']:>9} {datos['promedio_us']:>9.1f} "
+                f"{datos['p50_us']:>8} {datos['p95_us']:>8} {datos['p99_us']:>8} "
+                f"{datos['maximo_us']:>10.1f}  {errores or '-'}"
+            )
+        return "\n".join(lineas)
+
+
+def _percentil(histograma: List[int], llamadas: int, fraccion: float) -> int:
+    """Límite superior (en µs) de la cubeta donde cae el percentil pedido"""
+    objetivo = fraccion * llamadas
+    acumulado = 0
+    for cubeta, cantidad in enumerate(histograma):
+        acumulado += cantidad
+        if acumulado >= objetivo:
+            return 1 << cubeta
+    return 1 << (len(histograma) - 1)
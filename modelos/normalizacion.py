@@ -0,0 +1,16 @@
+"""
+Funciones de normalización de texto para búsquedas e índices
+"""
+import unicodedata
+
+def normalizar_texto(texto: str) -> str:
+    """
+    Devuelve el texto en minúsculas, sin tildes ni diacríticos y con los
+    espacios internos colapsados (ej: "  Pérez  Núñez " -> "perez nunez").
+    """
+    if texto.isascii():
+        # Sin caracteres acentuados no hay nada que descomponer
+        return " ".join(texto.casefold().split())
+    descompuesto = unicodedata.normalize("NFKD", texto)
+    sin_marcas = "".join(c for c in descompuesto if not unicodedata.combining(c))
+    return " ".join(sin_marcas.casefold().split())
@@ -3,6 +3,9 @@ Clase Paciente - Representa a un paciente de la clínica
 """
 
 class Paciente:
+    # Atributos fijos: evita el __dict__ por instancia
+    __slots__ = ('__nombre', '__dni', '__fecha_nacimiento')
+    
     def __init__(self, nombre: str, dni: str, fecha_nacimiento: str):
         """
         Constructor de la clase Paciente
@@ -55,6 +58,14 @@ class Paciente:
         """Devuelve el DNI del paciente"""
         return self.__dni
     
+    def obtener_nombre(self) -> str:
+        """Devuelve el nombre completo del paciente"""
+        return self.__nombre
+    
+    def obtener_fecha_nacimiento(self) -> str:
+        """Devuelve la fecha de nacimiento en formato dd/mm/aaaa"""
+        return self.__fecha_nacimiento
+    
     def __str__(self) -> str:
         """Devuelve una representación legible del paciente"""
         return f"{self.__nombre}, {self.__dni}, {self.__fecha_nacimiento}"
\ No newline at end of file
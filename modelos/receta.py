@@ -2,12 +2,16 @@
 Clase Receta - Representa una receta médica
 """
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 from .paciente import Paciente
 from .medico import Medico
 
 class Receta:
-    def __init__(self, paciente: Paciente, medico: Medico, medicamentos: List[str]):
+    # Atributos fijos: evita el __dict__ por instancia
+    __slots__ = ('__paciente', '__medico', '__medicamentos', '__fecha')
+    
+    def __init__(self, paciente: Paciente, medico: Medico, medicamentos: List[str],
+                 fecha: Optional[datetime] = None):
         """
         Constructor de la clase Receta
         
@@ -15,12 +19,15 @@ class Receta:
             paciente: Paciente al que se le emite la receta
             medico: Médico que emite la receta
             medicamentos: Lista de medicamentos recetados
+            fecha: Fecha de emisión (por defecto, el momento actual)
         """
         # Validaciones
         if not isinstance(paciente, Paciente):
             raise TypeError("Se esperaba un objeto de tipo Paciente")
         if not isinstance(medico, Medico):
             raise TypeError("Se esperaba un objeto de tipo Medico")
+        if fecha is not None and not isinstance(fecha, datetime):
+            raise TypeError("Se esperaba un objeto de tipo datetime")
         if not medicamentos:
             raise ValueError("La lista de medicamentos no puede estar vacía")
         
@@ -35,8 +42,24 @@ class Receta:
         
         self.__paciente = paciente
         self.__medico = medico
-        self.__medicamentos = medicamentos_limpios
-        self.__fecha = datetime.now()
+        self.__medicamentos = tuple(medicamentos_limpios)
+        self.__fecha = fecha if fecha is not None else datetime.now()
+    
+    def obtener_paciente(self) -> Paciente:
+        """Devuelve el paciente al que se le emitió la receta"""
+        return self.__paciente
+    
+    def obtener_medico(self) -> Medico:
+        """Devuelve el médico que emitió la receta"""
+        return self.__medico
+    
+    def obtener_medicamentos(self) -> List[str]:
+        """Devuelve una copia de la lista de medicamentos recetados"""
+        return list(self.__medicamentos)
+    
+    def obtener_fecha(self) -> datetime:
+        """Devuelve la fecha de emisión de la receta"""
+        return self.__fecha
     
     def agregar_receta(self, receta):
         """Agrega una receta (método para compatibilidad)"""
@@ -1,12 +1,21 @@
 """
 Clase Turno - Representa un turno médico
 """
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import Optional
 from .paciente import Paciente
 from .medico import Medico
 
 class Turno:
-    def __init__(self, paciente: Paciente, medico: Medico, fecha_hora: datetime, especialidad: str):
+    # Atributos fijos: evita el __dict__ por instancia
+    __slots__ = ('__paciente', '__medico', '__fecha_hora', '__especialidad', '__duracion',
+                 '__id')
+    
+    # Duración de los turnos que no indican una
+    DURACION_POR_DEFECTO = timedelta(minutes=30)
+    
+    def __init__(self, paciente: Paciente, medico: Medico, fecha_hora: datetime, especialidad: str,
+                 duracion: Optional[timedelta] = None, id_turno: Optional[int] = None):
         """
         Constructor de la clase Turno
         
@@ -15,6 +24,8 @@ class Turno:
             medico: Médico asignado al turno
             fecha_hora: Fecha y hora del turno
             especialidad: Especialidad para la cual se agendó el turno
+            duracion: Duración del turno (por defecto, DURACION_POR_DEFECTO)
+            id_turno: Identificador estable asignado por la Clinica (None si no tiene)
         """
         # Validaciones
         if not isinstance(paciente, Paciente):
@@ -25,11 +36,25 @@ class Turno:
             raise TypeError("Se esperaba un objeto de tipo datetime")
         if not especialidad or not especialidad.strip():
             raise ValueError("La especialidad no puede estar vacía")
+        if duracion is None:
+            duracion = self.DURACION_POR_DEFECTO
+        if not isinstance(duracion, timedelta) or duracion <= timedelta(0):
+            raise ValueError("La duración debe ser un timedelta positivo")
         
         self.__paciente = paciente
         self.__medico = medico
         self.__fecha_hora = fecha_hora
         self.__especialidad = especialidad.strip()
+        self.__duracion = duracion
+        self.__id = id_turno
+    
+    def obtener_id(self) -> Optional[int]:
+        """Devuelve el identificador del turno (se conserva al reprogramarlo)"""
+        return self.__id
+    
+    def obtener_paciente(self) -> Paciente:
+        """Devuelve el paciente que asiste al turno"""
+        return self.__paciente
     
     def obtener_medico(self) -> Medico:
         """Devuelve el médico asignado al turno"""
@@ -39,6 +64,18 @@ class Turno:
         """Devuelve la fecha y hora del turno"""
         return self.__fecha_hora
     
+    def obtener_duracion(self) -> timedelta:
+        """Devuelve la duración del turno"""
+        return self.__duracion
+    
+    def obtener_fin(self) -> datetime:
+        """Devuelve el momento en que termina el turno (exclusivo)"""
+        return self.__fecha_hora + self.__duracion
+    
+    def obtener_especialidad(self) -> str:
+        """Devuelve la especialidad para la cual se agendó el turno"""
+        return self.__especialidad
+    
     def __str__(self) -> str:
         """Devuelve una representación legible del turno"""
         return (f"Turno(Paciente({self.__paciente}), "
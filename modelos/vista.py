@@ -0,0 +1,58 @@
+"""
+Clase VistaSecuencia - Vista de solo lectura sobre una lista interna
+"""
+from collections.abc import Sequence
+from typing import Any, Iterator, List, Optional
+
+class VistaSecuencia(Sequence):
+    # Atributos fijos: evita el __dict__ por instancia
+    __slots__ = ('__lista',)
+
+    def __init__(self, lista: List[Any]):
+        """
+        Constructor de la clase VistaSecuencia
+
+        Crear la vista cuesta O(1): no copia la lista, solo la envuelve. La
+        vista refleja los cambios posteriores de la lista pero no permite
+        modificarla.
+
+        Args:
+            lista: Lista interna a exponer
+        """
+        self.__lista = lista
+
+    def __len__(self) -> int:
+        return len(self.__lista)
+
+    def __getitem__(self, indice):
+        """Devuelve un elemento; con un slice devuelve una lista nueva"""
+        return self.__lista[indice]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.__lista)
+
+    def __reversed__(self) -> Iterator[Any]:
+        return reversed(self.__lista)
+
+    def __contains__(self, elemento: Any) -> bool:
+        return elemento in self.__lista
+
+    def __eq__(self, otro: Any) -> bool:
+        if isinstance(otro, (VistaSecuencia, list, tuple)):
+            return list(self) == list(otro)
+        return NotImplemented
+
+    __hash__ = None
+
+    def pagina(self, offset: int = 0, limite: Optional[int] = None) -> List[Any]:
+        """Devuelve a lo sumo `limite` elementos a partir de la posición `offset`"""
+        if offset < 0:
+            raise ValueError("El offset no puede ser negativo")
+        if limite is not None and limite < 0:
+            raise ValueError("El límite no puede ser negativo")
+        fin = None if limite is None else offset + limite
+        return self.__lista[offset:fin]
+
+    def __repr__(self) -> str:
+        return f"VistaSecuencia({self.__lista!r})"
+
@@ -0,0 +1,13 @@
+from .almacen import Almacen
+from .almacen_sqlite import AlmacenSQLite
+from .almacen_journal import AlmacenJournal
+from .importador import importar_pacientes, importar_medicos, ResultadoImportacion
+
+__all__ = [
+    'Almacen',
+    'AlmacenSQLite',
+    'AlmacenJournal',
+    'importar_pacientes',
+    'importar_medicos',
+    'ResultadoImportacion'
+]
@@ -0,0 +1,91 @@
+"""
+Clase Almacen - Interfaz común de los mecanismos de persistencia de la Clinica
+"""
+from abc import ABC, abstractmethod
+from contextlib import nullcontext
+from datetime import datetime
+from typing import Any, ContextManager, Iterator, List, Tuple
+
+from modelos.paciente     import Paciente
+from modelos.medico       import Medico
+from modelos.especialidad import Especialidad
+from modelos.turno        import Turno
+from modelos.receta       import Receta
+
+# Un registro es una tupla cuyo primer elemento indica el tipo de operación:
+#   ("paciente",     Paciente)
+#   ("medico",       Medico)
+#   ("especialidad", matricula, Especialidad)
+#   ("turno",        dni, matricula, especialidad, fecha_hora, duracion, id_turno)
+#   ("cancelacion",  id_turno)   (turno cancelado, o reprogramado si le sigue
+#                                 otro "turno" con el mismo id)
+#   ("reprogramacion", id_turno, fecha_hora, duracion)   (turno reprogramado)
+#   ("receta",       dni, matricula, medicamentos, fecha)
+#   ("ids_turno",    proximo_id)   (id mínimo para el próximo turno nuevo: los de
+#                                   turnos cancelados no se reutilizan)
+Registro = Tuple[Any, ...]
+
+
+class Almacen(ABC):
+    """
+    Clase base de los almacenes persistentes.
+
+    La Clinica notifica cada operación exitosa mediante los métodos guardar_*
+    y, al iniciar, reconstruye su estado aplicando los registros devueltos
+    por cargar() en orden. Las subclases deben implementar los métodos
+    abstractos; si falta alguno, fallan al construirse.
+    """
+
+    # Si es True, cargar() no devuelve recetas: la Clinica las pide por DNI
+    # con cargar_recetas() la primera vez que se consulta la historia clínica.
+    RECETAS_DIFERIDAS = False
+
+    @abstractmethod
+    def guardar_paciente(self, paciente: Paciente) -> None:
+        """Guarda un paciente nuevo"""
+
+    @abstractmethod
+    def guardar_medico(self, medico: Medico) -> None:
+        """Guarda un médico nuevo con sus especialidades"""
+
+    @abstractmethod
+    def guardar_especialidad(self, matricula: str, especialidad: Especialidad) -> None:
+        """Guarda una especialidad agregada a un médico ya guardado"""
+
+    @abstractmethod
+    def guardar_turno(self, turno: Turno) -> None:
+        """Guarda un turno agendado"""
+
+    @abstractmethod
+    def eliminar_turno(self, id_turno: int) -> None:
+        """Registra la cancelación del turno con ese id"""
+
+    def reemplazar_turno(self, turno: Turno) -> None:
+        """Guarda el turno reprogramado en lugar del que tenía su mismo id"""
+        with self.transaccion():
+            self.eliminar_turno(turno.obtener_id())
+            self.guardar_turno(turno)
+
+    @abstractmethod
+    def guardar_receta(self, receta: Receta) -> None:
+        """Guarda una receta emitida"""
+
+    @abstractmethod
+    def cargar(self) -> Iterator[Registro]:
+        """Devuelve los registros necesarios para reconstruir la clínica"""
+
+    def cargar_recetas(self, dni: str) -> Iterator[Tuple[str, List[str], datetime]]:
+        """Devuelve (matricula, medicamentos, fecha) de las recetas de un paciente"""
+        return iter(())
+
+    def cargar_todas_las_recetas(self) -> Iterator[Tuple[str, str, List[str], datetime]]:
+        """Devuelve (dni, matricula, medicamentos, fecha) de todas las recetas, en orden de emisión"""
+        return iter(())
+
+    def transaccion(self) -> ContextManager:
+        """Agrupa varias operaciones guardar_* en una sola escritura"""
+        return nullcontext()
+
+    def cerrar(self) -> None:
+        """Libera los recursos del almacén"""
+        pass
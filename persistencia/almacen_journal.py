@@ -0,0 +1,381 @@
+"""
+Clase AlmacenJournal - Persistencia de la Clinica en un registro de operaciones
+de solo anexado, con instantáneas periódicas y compactación en segundo plano
+"""
+import glob
+import json
+import os
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional
+
+from modelos.paciente     import Paciente
+from modelos.medico       import Medico
+from modelos.especialidad import Especialidad
+from modelos.turno        import Turno
+from modelos.receta       import Receta
+from .almacen             import Almacen, Registro
+
+# Formato de cada línea del registro (un arreglo JSON compacto):
+#   ["p", dni, nombre, fecha_nacimiento]
+#   ["m", matricula, nombre, [[tipo, [dias...]], ...]]
+#   ["e", matricula, tipo, [dias...]]
+#   ["t", dni, matricula, especialidad, fecha_hora_iso, duracion_segundos, id]
+#         (las líneas sin duración, de versiones anteriores, son de 30 minutos;
+#          las que no tienen id lo reciben en orden, igual que en la Clinica)
+#   ["x", id]   turno cancelado (o reprogramado, si le sigue otro "t" con el mismo id)
+#   ["y", id, fecha_hora_iso, duracion_segundos]   turno reprogramado
+#   ["r", dni, matricula, [medicamentos...], fecha_iso]
+PATRON_SEGMENTO    = "journal-{:08d}.log"
+PATRON_INSTANTANEA = "snapshot-{:08d}.json"
+
+
+def _generacion(ruta: str) -> int:
+    """Extrae el número de generación del nombre de un segmento o instantánea"""
+    return int(os.path.basename(ruta).split("-")[1].split(".")[0])
+
+
+class _TurnosPlegados:
+    """
+    Turnos vigentes de una instantánea en construcción, por id, para aplicar
+    las cancelaciones en O(1). A los turnos sin id (de versiones anteriores)
+    les asigna el siguiente, con la misma regla que la Clinica al cargarlos.
+    """
+    __slots__ = ('__por_id', '__siguiente')
+
+    def __init__(self, turnos: List[List[Any]], siguiente: int = 1):
+        self.__por_id: Dict[int, List[Any]] = {}
+        self.__siguiente = siguiente
+        for turno in turnos:
+            self.agregar(turno)
+
+    def agregar(self, turno: List[Any]) -> None:
+        """turno = [dni, matricula, especialidad, fecha_hora_iso(, duracion_segundos(, id))]"""
+        duracion = turno[4] if len(turno) > 4 else None
+        id_turno = turno[5] if len(turno) > 5 else None
+        if id_turno is None:
+            id_turno = self.__siguiente
+        self.__siguiente = max(self.__siguiente, id_turno + 1)
+        self.__por_id[id_turno] = turno[:4] + [duracion, id_turno]
+
+    def quitar(self, id_turno: int) -> None:
+        self.__por_id.pop(id_turno, None)
+
+    def reprogramar(self, id_turno: int, fecha_hora: str, duracion: int) -> None:
+        """Cambia fecha y duración del turno sin moverlo de su lugar"""
+        turno = self.__por_id.get(id_turno)
+        if turno is not None:
+            turno[3], turno[4] = fecha_hora, duracion
+
+    def listar(self) -> List[List[Any]]:
+        return list(self.__por_id.values())
+
+    def obtener_siguiente(self) -> int:
+        """Id del próximo turno nuevo; incluye los de turnos ya cancelados"""
+        return self.__siguiente
+
+
+class AlmacenJournal(Almacen):
+    """
+    Almacén basado en un registro de operaciones (journal).
+
+    Cada operación se anexa como una línea JSON al segmento activo. Cada
+    `registros_por_instantanea` operaciones se abre un segmento nuevo y un
+    hilo en segundo plano pliega los segmentos cerrados sobre la última
+    instantánea, escribe una instantánea nueva y borra lo ya plegado.
+    Al iniciar se lee la última instantánea y solo se reproducen los
+    segmentos posteriores.
+    """
+
+    def __init__(self, directorio: str, registros_por_instantanea: int = 10_000,
+                 sincronizar: bool = False):
+        """
+        Constructor de la clase AlmacenJournal
+
+        Args:
+            directorio: Carpeta donde se guardan segmentos e instantáneas
+            registros_por_instantanea: Operaciones por segmento antes de compactar
+            sincronizar: Si es True, hace fsync tras cada escritura
+        """
+        if registros_por_instantanea < 1:
+            raise ValueError("registros_por_instantanea debe ser mayor que cero")
+
+        os.makedirs(directorio, exist_ok=True)
+        self.__directorio = directorio
+        self.__registros_por_instantanea = registros_por_instantanea
+        self.__sincronizar = sincronizar
+        self.__lock = threading.RLock()
+        # Bloques transaccion() abiertos, de cualquier hilo
+        self.__transacciones = 0
+        self.__compactador: Optional[threading.Thread] = None
+
+        segmentos = self.__segmentos()
+        self.__generacion = _generacion(segmentos[-1]) + 1 if segmentos else 1
+        ultima = self.__ultima_instantanea()
+        if ultima is not None:
+            self.__generacion = max(self.__generacion, _generacion(ultima) + 1)
+
+        self.__registros_en_segmento = 0
+        self.__archivo = self.__abrir_segmento(self.__generacion)
+
+    # ============================================================
+    # ARCHIVOS
+    # ============================================================
+    def __ruta(self, patron: str, generacion: int) -> str:
+        return os.path.join(self.__directorio, patron.format(generacion))
+
+    def __segmentos(self) -> List[str]:
+        return sorted(glob.glob(os.path.join(self.__directorio, "journal-*.log")), key=_generacion)
+
+    def __ultima_instantanea(self) -> Optional[str]:
+        instantaneas = sorted(
+            glob.glob(os.path.join(self.__directorio, "snapshot-*.json")), key=_generacion
+        )
+        return instantaneas[-1] if instantaneas else None
+
+    def __abrir_segmento(self, generacion: int):
+        return open(self.__ruta(PATRON_SEGMENTO, generacion), "a", encoding="utf-8")
+
+    # ============================================================
+    # ESCRITURA
+    # ============================================================
+    def __anexar(self, registro: List[Any]) -> None:
+        linea = json.dumps(registro, ensure_ascii=False, separators=(",", ":"))
+        with self.__lock:
+            self.__archivo.write(linea + "\n")
+            self.__registros_en_segmento += 1
+            if not self.__transacciones:
+                self.__volcar()
+
+    def __volcar(self) -> None:
+        self.__archivo.flush()
+        if self.__sincronizar:
+            os.fsync(self.__archivo.fileno())
+        if self.__registros_en_segmento >= self.__registros_por_instantanea:
+            self.__rotar()
+
+    def __rotar(self) -> None:
+        """Cierra el segmento activo, abre uno nuevo y lanza la compactación"""
+        self.__archivo.close()
+        self.__generacion += 1
+        self.__archivo = self.__abrir_segmento(self.__generacion)
+        self.__registros_en_segmento = 0
+        self.compactar(esperar=False)
+
+    @contextmanager
+    def transaccion(self):
+        """
+        Difiere el volcado a disco hasta el final del bloque. El cerrojo del
+        almacén no se retiene durante el bloque (ver AlmacenSQLite.transaccion):
+        lo anexado por otros hilos mientras tanto se vuelca con él.
+        """
+        with self.__lock:
+            self.__transacciones += 1
+        try:
+            yield
+        finally:
+            with self.__lock:
+                self.__transacciones -= 1
+                if not self.__transacciones:
+                    self.__volcar()
+
+    def guardar_paciente(self, paciente: Paciente) -> None:
+        self.__anexar(["p", paciente.obtener_dni(), paciente.obtener_nombre(),
+                       paciente.obtener_fecha_nacimiento()])
+
+    def guardar_medico(self, medico: Medico) -> None:
+        self.__anexar(["m", medico.obtener_matricula(), medico.obtener_nombre(),
+                       [[e.obtener_especialidad(), e.obtener_dias()]
+                        for e in medico.obtener_especialidades()]])
+
+    def guardar_especialidad(self, matricula: str, especialidad: Especialidad) -> None:
+        self.__anexar(["e", matricula, especialidad.obtener_especialidad(),
+                       especialidad.obtener_dias()])
+
+    def guardar_turno(self, turno: Turno) -> None:
+        self.__anexar(["t", turno.obtener_paciente().obtener_dni(),
+                       turno.obtener_medico().obtener_matricula(),
+                       turno.obtener_especialidad(),
+                       turno.obtener_fecha_hora().isoformat(),
+                       int(turno.obtener_duracion().total_seconds()),
+                       turno.obtener_id()])
+
+    def eliminar_turno(self, id_turno: int) -> None:
+        self.__anexar(["x", id_turno])
+
+    def reemplazar_turno(self, turno: Turno) -> None:
+        self.__anexar(["y", turno.obtener_id(), turno.obtener_fecha_hora().isoformat(),
+                       int(turno.obtener_duracion().total_seconds())])
+
+    def guardar_receta(self, receta: Receta) -> None:
+        self.__anexar(["r", receta.obtener_paciente().obtener_dni(),
+                       receta.obtener_medico().obtener_matricula(),
+                       receta.obtener_medicamentos(),
+                       receta.obtener_fecha().isoformat()])
+
+    # ============================================================
+    # INSTANTÁNEAS Y COMPACTACIÓN
+    # ============================================================
+    def compactar(self, esperar: bool = True) -> None:
+        """
+        Pliega los segmentos cerrados en una nueva instantánea.
+
+        Args:
+            esperar: Si es True, incluye también el segmento activo y bloquea
+                     hasta terminar; si es False, la compactación corre en un
+                     hilo en segundo plano (y se omite si ya hay una en curso)
+        """
+        with self.__lock:
+            previo = self.__compactador
+            if previo is not None and previo.is_alive() and not esperar:
+                return
+        if previo is not None:
+            previo.join()
+
+        with self.__lock:
+            if esperar and self.__registros_en_segmento:
+                self.__archivo.close()
+                self.__generacion += 1
+                self.__archivo = self.__abrir_segmento(self.__generacion)
+                self.__registros_en_segmento = 0
+            hilo = threading.Thread(
+                target=self.__compactar_hasta,
+                args=(self.__generacion - 1,),
+                name="compactador-journal",
+                daemon=True,
+            )
+            self.__compactador = hilo
+            hilo.start()
+        if esperar:
+            hilo.join()
+
+    def __compactar_hasta(self, generacion: int) -> None:
+        """Escribe la instantánea de la generación dada y borra lo ya plegado"""
+        ultima = self.__ultima_instantanea()
+        if ultima is not None and _generacion(ultima) >= generacion:
+            return
+
+        estado = self.__leer_instantanea(ultima)
+        estado["turnos"] = _TurnosPlegados(estado["turnos"], estado.get("proximo_id_turno", 1))
+        segmentos = [s for s in self.__segmentos() if _generacion(s) <= generacion]
+        for segmento in segmentos:
+            for registro in self.__leer_segmento(segmento):
+                self.__plegar(estado, registro)
+        # Los turnos cancelados no pasan a la instantánea, pero sus ids no se reutilizan
+        estado["proximo_id_turno"] = estado["turnos"].obtener_siguiente()
+        estado["turnos"] = estado["turnos"].listar()
+
+        destino = self.__ruta(PATRON_INSTANTANEA, generacion)
+        temporal = destino + ".tmp"
+        with open(temporal, "w", encoding="utf-8") as archivo:
+            json.dump(estado, archivo, ensure_ascii=False, separators=(",", ":"))
+            archivo.flush()
+            os.fsync(archivo.fileno())
+        os.replace(temporal, destino)
+
+        for segmento in segmentos:
+            os.remove(segmento)
+        for instantanea in glob.glob(os.path.join(self.__directorio, "snapshot-*.json")):
+            if _generacion(instantanea) < generacion:
+                os.remove(instantanea)
+
+    @staticmethod
+    def __leer_instantanea(ruta: Optional[str]) -> Dict[str, Any]:
+        if ruta is None:
+            return {"pacientes": [], "medicos": [], "turnos": [], "recetas": []}
+        with open(ruta, encoding="utf-8") as archivo:
+            return json.load(archivo)
+
+    @staticmethod
+    def __leer_segmento(ruta: str) -> Iterator[List[Any]]:
+        with open(ruta, encoding="utf-8") as archivo:
+            for linea in archivo:
+                if not linea.endswith("\n"):
+                    break  # línea truncada por una caída durante la escritura
+                yield json.loads(linea)
+
+    @staticmethod
+    def __plegar(estado: Dict[str, Any], registro: List[Any]) -> None:
+        """Aplica un registro del journal sobre el estado de una instantánea"""
+        tipo = registro[0]
+        if tipo == "p":
+            estado["pacientes"].append(registro[1:])
+        elif tipo == "m":
+            estado["medicos"].append(registro[1:])
+        elif tipo == "e":
+            for medico in estado["medicos"]:
+                if medico[0] == registro[1]:
+                    medico[2].append(registro[2:])
+                    break
+        elif tipo == "t":
+            estado["turnos"].agregar(registro[1:])
+        elif tipo == "x":
+            estado["turnos"].quitar(registro[1])
+        elif tipo == "y":
+            estado["turnos"].reprogramar(*registro[1:])
+        elif tipo == "r":
+            estado["recetas"].append(registro[1:])
+
+    # ============================================================
+    # LECTURA
+    # ============================================================
+    def cargar(self) -> Iterator[Registro]:
+        """Devuelve la última instantánea seguida de los segmentos posteriores"""
+        with self.__lock:
+            ultima = self.__ultima_instantanea()
+            desde = _generacion(ultima) if ultima is not None else 0
+            segmentos = [s for s in self.__segmentos() if _generacion(s) > desde]
+            estado = self.__leer_instantanea(ultima)
+
+        for dni, nombre, fecha_nacimiento in estado["pacientes"]:
+            yield ("paciente", Paciente(nombre, dni, fecha_nacimiento))
+        for matricula, nombre, especialidades in estado["medicos"]:
+            yield ("medico", Medico(nombre, matricula,
+                                    [Especialidad(tipo, dias) for tipo, dias in especialidades]))
+        for registro in estado["turnos"]:
+            yield self.__a_registro(["t"] + registro)
+        if "proximo_id_turno" in estado:
+            yield ("ids_turno", estado["proximo_id_turno"])
+        for registro in estado["recetas"]:
+            yield self.__a_registro(["r"] + registro)
+
+        for segmento in segmentos:
+            for registro in self.__leer_segmento(segmento):
+                yield self.__a_registro(registro)
+
+    @staticmethod
+    def __a_registro(registro: List[Any]) -> Registro:
+        """Convierte una línea del journal en un registro de la interfaz Almacen"""
+        tipo = registro[0]
+        if tipo == "p":
+            return ("paciente", Paciente(registro[2], registro[1], registro[3]))
+        if tipo == "m":
+            return ("medico", Medico(registro[2], registro[1],
+                                     [Especialidad(tipo, dias) for tipo, dias in registro[3]]))
+        if tipo == "e":
+            return ("especialidad", registro[1], Especialidad(registro[2], registro[3]))
+        if tipo == "t":
+            segundos = registro[5] if len(registro) > 5 else None
+            duracion = timedelta(seconds=segundos) if segundos is not None else None
+            id_turno = registro[6] if len(registro) > 6 else None
+            return ("turno", registro[1], registro[2], registro[3],
+                    datetime.fromisoformat(registro[4]), duracion, id_turno)
+        if tipo == "x":
+            return ("cancelacion", registro[1])
+        if tipo == "y":
+            return ("reprogramacion", registro[1], datetime.fromisoformat(registro[2]),
+                    timedelta(seconds=registro[3]))
+        if tipo == "r":
+            return ("receta", registro[1], registro[2], registro[3],
+                    datetime.fromisoformat(registro[4]))
+        raise ValueError(f"Registro desconocido en el journal: {tipo}")
+
+    def cerrar(self) -> None:
+        """Espera la compactación en curso y cierra el segmento activo"""
+        with self.__lock:
+            hilo = self.__compactador
+        if hilo is not None:
+            hilo.join()
+        with self.__lock:
+            self.__archivo.close()
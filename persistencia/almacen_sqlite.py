@@ -0,0 +1,268 @@
+"""
+Clase AlmacenSQLite - Persistencia de la Clinica en un archivo SQLite local
+"""
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Iterator, List, Tuple
+
+from modelos.paciente     import Paciente
+from modelos.medico       import Medico
+from modelos.especialidad import Especialidad
+from modelos.turno        import Turno
+from modelos.receta       import Receta
+from .almacen             import Almacen, Registro
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS pacientes (
+    dni              TEXT PRIMARY KEY,
+    nombre           TEXT NOT NULL,
+    fecha_nacimiento TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS medicos (
+    matricula TEXT PRIMARY KEY,
+    nombre    TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS especialidades (
+    id        INTEGER PRIMARY KEY,
+    matricula TEXT NOT NULL REFERENCES medicos(matricula),
+    tipo      TEXT NOT NULL,
+    dias      TEXT NOT NULL,
+    UNIQUE (matricula, tipo)
+);
+CREATE TABLE IF NOT EXISTS turnos (
+    id           INTEGER PRIMARY KEY,
+    dni          TEXT NOT NULL REFERENCES pacientes(dni),
+    matricula    TEXT NOT NULL REFERENCES medicos(matricula),
+    especialidad TEXT NOT NULL,
+    fecha_hora   TEXT NOT NULL,
+    duracion_segundos INTEGER NOT NULL DEFAULT 1800
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_turnos_matricula_fecha ON turnos (matricula, fecha_hora);
+CREATE INDEX IF NOT EXISTS idx_turnos_dni ON turnos (dni);
+CREATE TABLE IF NOT EXISTS recetas (
+    id           INTEGER PRIMARY KEY,
+    dni          TEXT NOT NULL REFERENCES pacientes(dni),
+    matricula    TEXT NOT NULL REFERENCES medicos(matricula),
+    medicamentos TEXT NOT NULL,
+    fecha        TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_recetas_dni ON recetas (dni);
+CREATE TABLE IF NOT EXISTS meta (
+    clave TEXT PRIMARY KEY,
+    valor INTEGER NOT NULL
+);
+"""
+
+# Sentencias parametrizadas: sqlite3 las compila una vez y las reutiliza
+# desde su caché de sentencias preparadas.
+SQL_INSERTAR_PACIENTE     = "INSERT INTO pacientes (dni, nombre, fecha_nacimiento) VALUES (?, ?, ?)"
+SQL_INSERTAR_MEDICO       = "INSERT INTO medicos (matricula, nombre) VALUES (?, ?)"
+SQL_INSERTAR_ESPECIALIDAD = "INSERT INTO especialidades (matricula, tipo, dias) VALUES (?, ?, ?)"
+SQL_INSERTAR_TURNO        = ("INSERT INTO turnos (id, dni, matricula, especialidad, fecha_hora, "
+                             "duracion_segundos) VALUES (?, ?, ?, ?, ?, ?)")
+SQL_ELIMINAR_TURNO        = "DELETE FROM turnos WHERE id = ?"
+# Los turnos cancelados se borran: se guarda el mayor id usado para no reutilizarlo
+SQL_REGISTRAR_ID_TURNO    = ("INSERT INTO meta (clave, valor) VALUES ('ultimo_id_turno', ?) "
+                             "ON CONFLICT (clave) DO UPDATE SET valor = max(valor, excluded.valor)")
+SQL_REEMPLAZAR_TURNO      = "UPDATE turnos SET fecha_hora = ?, duracion_segundos = ? WHERE id = ?"
+SQL_INSERTAR_RECETA       = ("INSERT INTO recetas (dni, matricula, medicamentos, fecha) "
+                             "VALUES (?, ?, ?, ?)")
+SQL_RECETAS_POR_DNI       = "SELECT matricula, medicamentos, fecha FROM recetas WHERE dni = ? ORDER BY id"
+SQL_TODAS_LAS_RECETAS     = "SELECT dni, matricula, medicamentos, fecha FROM recetas ORDER BY id"
+
+
+class AlmacenSQLite(Almacen):
+    """
+    Almacén en un archivo SQLite en modo WAL.
+
+    Pacientes, médicos y turnos se cargan al iniciar (las validaciones de
+    agendamiento los necesitan en memoria); las recetas se leen por DNI
+    recién cuando se consulta la historia clínica del paciente.
+    """
+
+    RECETAS_DIFERIDAS = True
+
+    def __init__(self, ruta: str):
+        """
+        Constructor de la clase AlmacenSQLite
+
+        Args:
+            ruta: Ruta del archivo de base de datos (se crea si no existe)
+        """
+        self.__conexion = sqlite3.connect(ruta, check_same_thread=False, cached_statements=64)
+        self.__lock = threading.RLock()
+        # Bloques transaccion() abiertos, de cualquier hilo
+        self.__transacciones = 0
+
+        self.__conexion.execute("PRAGMA journal_mode=WAL")
+        self.__conexion.execute("PRAGMA synchronous=NORMAL")
+        self.__conexion.execute("PRAGMA foreign_keys=ON")
+        self.__conexion.executescript(ESQUEMA)
+        self.__migrar()
+        self.__conexion.commit()
+
+    def __migrar(self) -> None:
+        """Agrega las columnas que no existían en bases creadas por versiones anteriores"""
+        columnas = {fila[1] for fila in self.__conexion.execute("PRAGMA table_info(turnos)")}
+        if "duracion_segundos" not in columnas:
+            # Los turnos anteriores a las duraciones eran de 30 minutos
+            self.__conexion.execute(
+                "ALTER TABLE turnos ADD COLUMN duracion_segundos INTEGER NOT NULL DEFAULT 1800"
+            )
+
+    # ============================================================
+    # ESCRITURA
+    # ============================================================
+    def __ejecutar(self, sql: str, parametros: tuple) -> None:
+        with self.__lock:
+            self.__conexion.execute(sql, parametros)
+            if not self.__transacciones:
+                self.__conexion.commit()
+
+    @contextmanager
+    def transaccion(self):
+        """
+        Agrupa las operaciones del bloque en un único commit.
+
+        El cerrojo del almacén se toma solo en cada sentencia, no durante todo
+        el bloque: la Clinica toma los cerrojos de matrícula y DNI antes que
+        el del almacén, y un bloque que lo retuviera mientras agenda turnos
+        invertiría ese orden. Las escrituras de otros hilos mientras el bloque
+        está abierto se confirman con él. Lo escrito se confirma aunque el
+        bloque termine con una excepción: la Clinica ya aplicó esas
+        operaciones en memoria y deshacerlas dejaría al almacén detrás.
+        """
+        with self.__lock:
+            self.__transacciones += 1
+        try:
+            yield
+        finally:
+            with self.__lock:
+                self.__transacciones -= 1
+                if not self.__transacciones:
+                    self.__conexion.commit()
+
+    @contextmanager
+    def __atomico(self):
+        """Ejecuta el bloque como una unidad (SAVEPOINT) y retiene el cerrojo mientras tanto"""
+        with self.__lock:
+            self.__conexion.execute("SAVEPOINT atomico")
+            self.__transacciones += 1
+            try:
+                yield
+            except BaseException:
+                self.__conexion.execute("ROLLBACK TO atomico")
+                raise
+            finally:
+                self.__transacciones -= 1
+                self.__conexion.execute("RELEASE atomico")
+                if not self.__transacciones:
+                    self.__conexion.commit()
+
+    def guardar_paciente(self, paciente: Paciente) -> None:
+        self.__ejecutar(SQL_INSERTAR_PACIENTE, (
+            paciente.obtener_dni(),
+            paciente.obtener_nombre(),
+            paciente.obtener_fecha_nacimiento(),
+        ))
+
+    def guardar_medico(self, medico: Medico) -> None:
+        with self.__atomico():
+            matricula = medico.obtener_matricula()
+            self.__ejecutar(SQL_INSERTAR_MEDICO, (matricula, medico.obtener_nombre()))
+            for especialidad in medico.obtener_especialidades():
+                self.guardar_especialidad(matricula, especialidad)
+
+    def guardar_especialidad(self, matricula: str, especialidad: Especialidad) -> None:
+        self.__ejecutar(SQL_INSERTAR_ESPECIALIDAD, (
+            matricula,
+            especialidad.obtener_especialidad(),
+            ",".join(especialidad.obtener_dias()),
+        ))
+
+    def guardar_turno(self, turno: Turno) -> None:
+        self.__ejecutar(SQL_INSERTAR_TURNO, (
+            turno.obtener_id(),
+            turno.obtener_paciente().obtener_dni(),
+            turno.obtener_medico().obtener_matricula(),
+            turno.obtener_especialidad(),
+            turno.obtener_fecha_hora().isoformat(),
+            int(turno.obtener_duracion().total_seconds()),
+        ))
+
+    def eliminar_turno(self, id_turno: int) -> None:
+        with self.__atomico():
+            self.__ejecutar(SQL_REGISTRAR_ID_TURNO, (id_turno,))
+            self.__ejecutar(SQL_ELIMINAR_TURNO, (id_turno,))
+
+    def reemplazar_turno(self, turno: Turno) -> None:
+        self.__ejecutar(SQL_REEMPLAZAR_TURNO, (
+            turno.obtener_fecha_hora().isoformat(),
+            int(turno.obtener_duracion().total_seconds()),
+            turno.obtener_id(),
+        ))
+
+    def guardar_receta(self, receta: Receta) -> None:
+        self.__ejecutar(SQL_INSERTAR_RECETA, (
+            receta.obtener_paciente().obtener_dni(),
+            receta.obtener_medico().obtener_matricula(),
+            json.dumps(receta.obtener_medicamentos(), ensure_ascii=False),
+            receta.obtener_fecha().isoformat(),
+        ))
+
+    # ============================================================
+    # LECTURA
+    # ============================================================
+    def cargar(self) -> Iterator[Registro]:
+        """Devuelve pacientes, médicos (con sus especialidades) y turnos"""
+        with self.__lock:
+            for dni, nombre, fecha_nacimiento in self.__conexion.execute(
+                "SELECT dni, nombre, fecha_nacimiento FROM pacientes"
+            ):
+                yield ("paciente", Paciente(nombre, dni, fecha_nacimiento))
+
+            especialidades = {}
+            for matricula, tipo, dias in self.__conexion.execute(
+                "SELECT matricula, tipo, dias FROM especialidades ORDER BY id"
+            ):
+                especialidades.setdefault(matricula, []).append(
+                    Especialidad(tipo, dias.split(","))
+                )
+            for matricula, nombre in self.__conexion.execute(
+                "SELECT matricula, nombre FROM medicos"
+            ):
+                yield ("medico", Medico(nombre, matricula, especialidades.get(matricula, [])))
+
+            # Los turnos cancelados ya no están en la tabla
+            for id_turno, dni, matricula, especialidad, fecha_hora, segundos in self.__conexion.execute(
+                "SELECT id, dni, matricula, especialidad, fecha_hora, duracion_segundos "
+                "FROM turnos ORDER BY id"
+            ):
+                yield ("turno", dni, matricula, especialidad, datetime.fromisoformat(fecha_hora),
+                       timedelta(seconds=segundos), id_turno)
+
+            fila = self.__conexion.execute(
+                "SELECT valor FROM meta WHERE clave = 'ultimo_id_turno'"
+            ).fetchone()
+            if fila is not None:
+                yield ("ids_turno", fila[0] + 1)
+
+    def cargar_recetas(self, dni: str) -> Iterator[Tuple[str, List[str], datetime]]:
+        with self.__lock:
+            filas = self.__conexion.execute(SQL_RECETAS_POR_DNI, (dni,)).fetchall()
+        for matricula, medicamentos, fecha in filas:
+            yield (matricula, json.loads(medicamentos), datetime.fromisoformat(fecha))
+
+    def cargar_todas_las_recetas(self) -> Iterator[Tuple[str, str, List[str], datetime]]:
+        """Un único recorrido de la tabla, en lugar de una consulta por paciente"""
+        with self.__lock:
+            filas = self.__conexion.execute(SQL_TODAS_LAS_RECETAS).fetchall()
+        for dni, matricula, medicamentos, fecha in filas:
+            yield (dni, matricula, json.loads(medicamentos), datetime.fromisoformat(fecha))
+
+    def cerrar(self) -> None:
+        with self.__lock:
+            self.__conexion.close()
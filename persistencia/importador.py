@@ -0,0 +1,233 @@
+"""
+Importación masiva de pacientes y médicos desde archivos CSV o JSONL
+
+Los archivos se leen fila por fila y se procesan en bloques: cada bloque se
+valida con las mismas reglas que Paciente, Medico y Especialidad, y las
+filas válidas se registran en la Clinica dentro de una única transacción del
+almacén. Las filas inválidas o duplicadas no detienen la importación: se
+copian a un archivo de rechazos, en el mismo formato que la entrada y con el
+número de línea y el motivo, para poder corregirlas y volver a importarlas.
+La memoria usada depende del tamaño del bloque, no del archivo.
+
+Formatos (se eligen por la extensión: .csv, o .jsonl / .ndjson):
+- Pacientes CSV:   nombre,dni,fecha_nacimiento
+- Pacientes JSONL: {"nombre": ..., "dni": ..., "fecha_nacimiento": "dd/mm/aaaa"}
+- Médicos CSV:     nombre,matricula,especialidades
+                   con especialidades como "Pediatría:lunes|miércoles;Cardiología:martes"
+- Médicos JSONL:   {"nombre": ..., "matricula": ...,
+                    "especialidades": [{"tipo": ..., "dias": [...]}]}
+"""
+import csv
+import json
+import os
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO, Tuple
+
+from modelos.clinica      import Clinica
+from modelos.paciente     import Paciente
+from modelos.medico       import Medico
+from modelos.especialidad import Especialidad
+
+FILAS_POR_BLOQUE = 10_000
+# Separadores de la columna de especialidades en CSV
+SEPARADOR_ESPECIALIDADES = ";"
+SEPARADOR_TIPO = ":"
+SEPARADOR_DIAS = "|"
+
+# (número de línea, fila leída, error de lectura o None)
+FilaLeida = Tuple[int, Any, Optional[str]]
+
+
+class ResultadoImportacion:
+    """Cantidad de filas importadas y rechazadas de un archivo"""
+    __slots__ = ('importados', 'rechazados', 'ruta_rechazos')
+
+    def __init__(self, ruta_rechazos: str):
+        self.importados = 0
+        self.rechazados = 0
+        self.ruta_rechazos = ruta_rechazos
+
+    def __str__(self) -> str:
+        texto = f"{self.importados} importados, {self.rechazados} rechazados"
+        if self.rechazados:
+            texto += f" (ver {self.ruta_rechazos})"
+        return texto
+
+
+def importar_pacientes(clinica: Clinica, ruta: str, ruta_rechazos: Optional[str] = None,
+                       filas_por_bloque: int = FILAS_POR_BLOQUE) -> ResultadoImportacion:
+    """
+    Importa los pacientes del archivo a la clínica
+
+    Args:
+        clinica: Clínica donde registrar los pacientes
+        ruta: Archivo CSV o JSONL de pacientes
+        ruta_rechazos: Archivo donde copiar las filas rechazadas (por defecto,
+                       junto a la entrada con el sufijo .rechazos)
+        filas_por_bloque: Filas que se validan y registran juntas
+    """
+    return _importar(clinica, ruta, ruta_rechazos, filas_por_bloque,
+                     _paciente_desde_fila, clinica.agregar_paciente)
+
+
+def importar_medicos(clinica: Clinica, ruta: str, ruta_rechazos: Optional[str] = None,
+                     filas_por_bloque: int = FILAS_POR_BLOQUE) -> ResultadoImportacion:
+    """Importa los médicos (con sus especialidades) del archivo; ver importar_pacientes"""
+    return _importar(clinica, ruta, ruta_rechazos, filas_por_bloque,
+                     _medico_desde_fila, clinica.agregar_medico)
+
+
+# ============================================================
+# CONVERSIÓN DE FILAS
+# ============================================================
+def _campo(fila: Dict[str, Any], nombre: str) -> Any:
+    """Devuelve el campo de la fila, o lanza ValueError si falta"""
+    valor = fila.get(nombre)
+    if valor is None:
+        raise ValueError(f"Falta el campo {nombre}")
+    return valor
+
+def _paciente_desde_fila(fila: Dict[str, Any]) -> Paciente:
+    return Paciente(_campo(fila, "nombre"), _campo(fila, "dni"), _campo(fila, "fecha_nacimiento"))
+
+def _medico_desde_fila(fila: Dict[str, Any]) -> Medico:
+    especialidades = _campo(fila, "especialidades")
+    if isinstance(especialidades, str):
+        especialidades = [_especialidad_desde_texto(texto)
+                          for texto in especialidades.split(SEPARADOR_ESPECIALIDADES) if texto.strip()]
+    else:
+        especialidades = [Especialidad(_campo(e, "tipo"), _campo(e, "dias")) for e in especialidades]
+    return Medico(_campo(fila, "nombre"), _campo(fila, "matricula"), especialidades)
+
+def _especialidad_desde_texto(texto: str) -> Especialidad:
+    """Convierte "Pediatría:lunes|miércoles" en una Especialidad"""
+    tipo, separador, dias = texto.partition(SEPARADOR_TIPO)
+    if not separador:
+        raise ValueError(f"Especialidad sin días de atención: {texto.strip()}")
+    return Especialidad(tipo, [dia.strip() for dia in dias.split(SEPARADOR_DIAS)])
+
+
+# ============================================================
+# LECTURA Y RECHAZOS
+# ============================================================
+def _formato(ruta: str) -> str:
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension == ".csv":
+        return "csv"
+    if extension in (".jsonl", ".ndjson"):
+        return "jsonl"
+    raise ValueError(f"Formato no soportado: {ruta} (se espera .csv, .jsonl o .ndjson)")
+
+def _leer_csv(lector: csv.DictReader) -> Iterator[FilaLeida]:
+    linea = lector.line_num
+    for fila in lector:
+        # line_num cuenta líneas físicas: la fila empieza después de la anterior
+        inicio, linea = linea + 1, lector.line_num
+        error = "Sobran columnas" if None in fila else None
+        yield inicio, fila, error
+
+def _leer_jsonl(entrada: TextIO) -> Iterator[FilaLeida]:
+    for numero, linea in enumerate(entrada, 1):
+        if not linea.strip():
+            continue
+        try:
+            fila = json.loads(linea)
+        except json.JSONDecodeError as e:
+            yield numero, linea.rstrip("\n"), f"JSON inválido: {e}"
+            continue
+        if not isinstance(fila, dict):
+            yield numero, fila, "Cada línea debe ser un objeto JSON"
+            continue
+        yield numero, fila, None
+
+
+class _ArchivoRechazos:
+    """Archivo de filas rechazadas; se crea recién con el primer rechazo"""
+    __slots__ = ('__ruta', '__formato', '__columnas', '__archivo', '__escritor')
+
+    def __init__(self, ruta: str, formato: str, columnas: Optional[List[str]]):
+        self.__ruta = ruta
+        self.__formato = formato
+        self.__columnas = columnas
+        self.__archivo: Optional[TextIO] = None
+        self.__escritor = None
+
+    def escribir(self, linea: int, fila: Any, error: str):
+        if self.__archivo is None:
+            self.__archivo = open(self.__ruta, "w", newline="", encoding="utf-8")
+            if self.__formato == "csv":
+                self.__escritor = csv.DictWriter(
+                    self.__archivo, ["linea", "error"] + list(self.__columnas or []),
+                    extrasaction="ignore",
+                )
+                self.__escritor.writeheader()
+
+        if self.__formato == "csv":
+            self.__escritor.writerow({**fila, "linea": linea, "error": error})
+        else:
+            rechazo = dict(fila) if isinstance(fila, dict) else {"contenido": fila}
+            rechazo.update(linea=linea, error=error)
+            self.__archivo.write(json.dumps(rechazo, ensure_ascii=False) + "\n")
+
+    def cerrar(self):
+        if self.__archivo is not None:
+            self.__archivo.close()
+
+
+def _importar(
+    clinica: Clinica,
+    ruta: str,
+    ruta_rechazos: Optional[str],
+    filas_por_bloque: int,
+    construir: Callable[[Dict[str, Any]], Any],
+    agregar: Callable[[Any], None],
+) -> ResultadoImportacion:
+    """Lee el archivo por bloques, valida cada fila y registra las válidas"""
+    if filas_por_bloque < 1:
+        raise ValueError("La cantidad de filas por bloque debe ser mayor que cero")
+
+    formato = _formato(ruta)
+    if ruta_rechazos is None:
+        base, extension = os.path.splitext(ruta)
+        ruta_rechazos = f"{base}.rechazos{extension}"
+    resultado = ResultadoImportacion(ruta_rechazos)
+
+    with open(ruta, newline="", encoding="utf-8") as entrada:
+        if formato == "csv":
+            lector = csv.DictReader(entrada)
+            filas, columnas = _leer_csv(lector), lector.fieldnames
+        else:
+            filas, columnas = _leer_jsonl(entrada), None
+        rechazos = _ArchivoRechazos(ruta_rechazos, formato, columnas)
+
+        try:
+            while True:
+                bloque = list(islice(filas, filas_por_bloque))
+                if not bloque:
+                    break
+
+                # Validar todo el bloque antes de abrir la transacción
+                entidades = []
+                for linea, fila, error in bloque:
+                    entidad = None
+                    if error is None:
+                        try:
+                            entidad = construir(fila)
+                        except (ValueError, TypeError, AttributeError) as e:
+                            error = str(e)
+                    entidades.append((linea, fila, entidad, error))
+
+                with clinica.transaccion():
+                    for linea, fila, entidad, error in entidades:
+                        if entidad is not None:
+                            try:
+                                agregar(entidad)
+                                resultado.importados += 1
+                                continue
+                            except ValueError as e:
+                                error = str(e)
+                        rechazos.escribir(linea, fila, error)
+                        resultado.rechazados += 1
+        finally:
+            rechazos.cerrar()
+    return resultado
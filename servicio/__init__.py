@@ -0,0 +1,14 @@
+from .comandos import ejecutar_comando
+from .servidor import ServidorClinica
+from .particionado import ClinicaParticionada
+from .federacion import FederacionClinicas, HistoriaFederada
+from .lote import ejecutar_lote
+
+__all__ = [
+    'ejecutar_comando',
+    'ServidorClinica',
+    'ClinicaParticionada',
+    'FederacionClinicas',
+    'HistoriaFederada',
+    'ejecutar_lote'
+]
@@ -0,0 +1,340 @@
+"""
+Traducción de comandos estructurados (diccionarios JSON) a operaciones de la Clinica
+
+Cada comando tiene la forma {"op": "<operación>", "args": {...}} y produce
+una respuesta {"ok": true, "resultado": ...} o
+{"ok": false, "error": "<tipo de excepción>", "mensaje": "..."}.
+Lo usan el servidor de red y el modo por lotes de la consola.
+"""
+import math
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from modelos.clinica          import Clinica
+from modelos.paciente         import Paciente
+from modelos.medico           import Medico
+from modelos.especialidad     import Especialidad
+from modelos.turno            import Turno
+from modelos.receta           import Receta
+from modelos.historia_clinica import HistoriaClinica
+from modelos.lista_espera     import SolicitudEspera
+from excepciones.excepciones_clinica import (
+    PacienteNoEncontradoException,
+    MedicoNoDisponibleException,
+    TurnoOcupadoException,
+    TurnoNoEncontradoException,
+    RecetaInvalidaException,
+)
+
+# Errores que se informan al cliente; cualquier otro se propaga
+ERRORES_ESPERADOS = (
+    PacienteNoEncontradoException,
+    MedicoNoDisponibleException,
+    TurnoOcupadoException,
+    TurnoNoEncontradoException,
+    RecetaInvalidaException,
+    ValueError,
+    TypeError,
+    KeyError,
+    OverflowError,  # fechas válidas cuya aritmética sale del rango de datetime
+)
+
+
+# ============================================================
+# SERIALIZACIÓN
+# ============================================================
+def serializar_paciente(paciente: Paciente) -> Dict[str, Any]:
+    return {
+        "nombre": paciente.obtener_nombre(),
+        "dni": paciente.obtener_dni(),
+        "fecha_nacimiento": paciente.obtener_fecha_nacimiento(),
+    }
+
+def serializar_especialidad(especialidad: Especialidad) -> Dict[str, Any]:
+    return {"tipo": especialidad.obtener_especialidad(), "dias": especialidad.obtener_dias()}
+
+def serializar_medico(medico: Medico) -> Dict[str, Any]:
+    return {
+        "nombre": medico.obtener_nombre(),
+        "matricula": medico.obtener_matricula(),
+        "especialidades": [serializar_especialidad(e) for e in medico.obtener_especialidades()],
+    }
+
+def serializar_turno(turno: Turno) -> Dict[str, Any]:
+    return {
+        "id_turno": turno.obtener_id(),
+        "dni": turno.obtener_paciente().obtener_dni(),
+        "matricula": turno.obtener_medico().obtener_matricula(),
+        "especialidad": turno.obtener_especialidad(),
+        "fecha_hora": turno.obtener_fecha_hora().isoformat(),
+        "duracion_minutos": turno.obtener_duracion() / timedelta(minutes=1),
+    }
+
+def serializar_solicitud(solicitud: SolicitudEspera) -> Dict[str, Any]:
+    turno = solicitud.obtener_turno()
+    return {
+        "id_solicitud": solicitud.obtener_id(),
+        "dni": solicitud.obtener_dni(),
+        "especialidad": solicitud.obtener_especialidad(),
+        "matricula": solicitud.obtener_matricula(),
+        "prioridad": solicitud.obtener_prioridad(),
+        "estado": solicitud.obtener_estado(),
+        "turno": serializar_turno(turno) if turno is not None else None,
+    }
+
+def serializar_receta(receta: Receta) -> Dict[str, Any]:
+    return {
+        "dni": receta.obtener_paciente().obtener_dni(),
+        "matricula": receta.obtener_medico().obtener_matricula(),
+        "medicamentos": receta.obtener_medicamentos(),
+        "fecha": receta.obtener_fecha().isoformat(),
+    }
+
+def serializar_historia(historia: HistoriaClinica) -> Dict[str, Any]:
+    return {
+        "turnos": [serializar_turno(t) for t in historia.obtener_turnos()],
+        "recetas": [serializar_receta(r) for r in historia.obtener_recetas()],
+    }
+
+
+# Marca de argumento obligatorio en los extractores de argumentos
+_REQUERIDO = object()
+
+def _valor(args: Dict[str, Any], clave: str, defecto: Any) -> Any:
+    """Devuelve args[clave]; si falta (o es null) y no es obligatorio, el defecto"""
+    if defecto is _REQUERIDO:
+        return args[clave]
+    valor = args.get(clave)
+    return defecto if valor is None else valor
+
+def _texto(args: Dict[str, Any], clave: str, defecto: Any = _REQUERIDO) -> Any:
+    """Devuelve el argumento `clave`, que debe ser texto"""
+    valor = _valor(args, clave, defecto)
+    if not isinstance(valor, str) and not (valor is None and defecto is None):
+        raise TypeError(f"El argumento {clave} debe ser texto")
+    return valor
+
+def _entero(args: Dict[str, Any], clave: str, defecto: Any = _REQUERIDO) -> Any:
+    """Devuelve el argumento `clave`, que debe ser un número entero"""
+    valor = _valor(args, clave, defecto)
+    if valor is None and defecto is None:
+        return None
+    if isinstance(valor, bool) or not isinstance(valor, int):
+        raise TypeError(f"El argumento {clave} debe ser un número entero")
+    return valor
+
+def _textos(valor: Any, clave: str) -> List[str]:
+    """Verifica que el argumento `clave` sea una lista de textos"""
+    if not isinstance(valor, list) or not all(isinstance(v, str) for v in valor):
+        raise TypeError(f"El argumento {clave} debe ser una lista de textos")
+    return valor
+
+def _objeto(valor: Any, clave: str) -> Dict[str, Any]:
+    """Verifica que el argumento `clave` sea un objeto JSON"""
+    if not isinstance(valor, dict):
+        raise TypeError(f"El argumento {clave} debe ser un objeto JSON")
+    return valor
+
+def _fecha(valor: Optional[str]) -> Optional[datetime]:
+    """Convierte una fecha ISO 8601 (ej: '2025-12-08T14:30') en datetime"""
+    if valor is None:
+        return None
+    if not isinstance(valor, str):
+        raise TypeError("Las fechas deben enviarse como texto ISO 8601")
+    return datetime.fromisoformat(valor)
+
+def _duracion(minutos: Any) -> timedelta:
+    """Convierte una cantidad de minutos en timedelta"""
+    if isinstance(minutos, bool) or not isinstance(minutos, (int, float)):
+        raise TypeError("La duración debe enviarse como cantidad de minutos")
+    if not math.isfinite(minutos):
+        raise ValueError("La duración debe ser un número finito de minutos")
+    try:
+        return timedelta(minutes=minutos)
+    except OverflowError:
+        raise ValueError(f"Duración fuera de rango: {minutos} minutos") from None
+
+def _especialidad(valor: Any) -> Especialidad:
+    datos = _objeto(valor, "especialidades")
+    return Especialidad(_texto(datos, "tipo"), _textos(datos["dias"], "dias"))
+
+
+# ============================================================
+# OPERACIONES
+# ============================================================
+# Los argumentos se leen con los extractores de arriba: un tipo inesperado
+# (ej: un número donde va un nombre) se informa como TypeError al cliente en
+# lugar de llegar a los modelos.
+def _agregar_paciente(clinica: Clinica, args: Dict[str, Any]) -> None:
+    clinica.agregar_paciente(Paciente(
+        _texto(args, "nombre"), _texto(args, "dni"), _texto(args, "fecha_nacimiento")
+    ))
+
+def _agregar_medico(clinica: Clinica, args: Dict[str, Any]) -> None:
+    especialidades = args.get("especialidades", [])
+    if not isinstance(especialidades, list):
+        raise TypeError("El argumento especialidades debe ser una lista")
+    clinica.agregar_medico(Medico(
+        _texto(args, "nombre"), _texto(args, "matricula"),
+        [_especialidad(e) for e in especialidades],
+    ))
+
+def _agregar_especialidad(clinica: Clinica, args: Dict[str, Any]) -> None:
+    medico = clinica.obtener_medico_por_matricula(_texto(args, "matricula"))
+    medico.agregar_especialidad(Especialidad(_texto(args, "tipo"), _textos(args["dias"], "dias")))
+
+def _agendar_turno(clinica: Clinica, args: Dict[str, Any]) -> Dict[str, Any]:
+    turno = clinica.agendar_turno(
+        _texto(args, "dni"), _texto(args, "matricula"), _texto(args, "especialidad"),
+        _fecha(args["fecha_hora"]), _duracion(args.get("duracion_minutos", 30)),
+    )
+    return serializar_turno(turno)
+
+def _cancelar_turno(clinica: Clinica, args: Dict[str, Any]) -> Dict[str, Any]:
+    return serializar_turno(clinica.cancelar_turno(_entero(args, "id_turno")))
+
+def _reprogramar_turno(clinica: Clinica, args: Dict[str, Any]) -> Dict[str, Any]:
+    minutos = args.get("duracion_minutos")
+    turno = clinica.reprogramar_turno(
+        _entero(args, "id_turno"), _fecha(args["fecha_hora"]),
+        _duracion(minutos) if minutos is not None else None,
+    )
+    return serializar_turno(turno)
+
+def _agregar_a_lista_espera(clinica: Clinica, args: Dict[str, Any]) -> Dict[str, Any]:
+    minutos = args.get("duracion_minutos")
+    solicitud = clinica.agregar_a_lista_espera(
+        _texto(args, "dni"), _texto(args, "especialidad"), _texto(args, "matricula", None),
+        _entero(args, "prioridad", 0),
+        _duracion(minutos) if minutos is not None else None,
+        _fecha(args.get("desde")), _fecha(args.get("hasta")),
+    )
+    return serializar_solicitud(solicitud)
+
+def _retirar_de_lista_espera(clinica: Clinica, args: Dict[str, Any]) -> Dict[str, Any]:
+    return serializar_solicitud(clinica.retirar_de_lista_espera(_entero(args, "id_solicitud")))
+
+def _obtener_lista_espera(clinica: Clinica, args: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [serializar_solicitud(s) for s in clinica.obtener_lista_espera()]
+
+def _emitir_receta(clinica: Clinica, args: Dict[str, Any]) -> None:
+    clinica.emitir_receta(_texto(args, "dni"), _texto(args, "matricula"),
+                          _textos(args["medicamentos"], "medicamentos"))
+
+def _obtener_historia_clinica(clinica: Clinica, args: Dict[str, Any]) -> Dict[str, Any]:
+    return serializar_historia(clinica.obtener_historia_clinica_por_dni(_texto(args, "dni")))
+
+def _obtener_turnos(clinica: Clinica, args: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [serializar_turno(t) for t in clinica.obtener_turnos()]
+
+def _obtener_pacientes(clinica: Clinica, args: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [serializar_paciente(p) for p in clinica.obtener_pacientes()]
+
+def _obtener_medicos(clinica: Clinica, args: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [serializar_medico(m) for m in clinica.obtener_medicos()]
+
+def _obtener_medicos_por_especialidad(clinica: Clinica, args: Dict[str, Any]) -> List[Dict[str, Any]]:
+    medicos = clinica.obtener_medicos_por_especialidad(
+        _texto(args, "especialidad"), _texto(args, "dia_semana", None)
+    )
+    return [serializar_medico(m) for m in medicos]
+
+def _obtener_agenda(clinica: Clinica, args: Dict[str, Any]) -> List[Dict[str, Any]]:
+    turnos = clinica.obtener_agenda(
+        _texto(args, "matricula"), _fecha(args.get("desde")), _fecha(args.get("hasta"))
+    )
+    return [serializar_turno(t) for t in turnos]
+
+def _buscar_proximo_turno(clinica: Clinica, args: Dict[str, Any]) -> List[Dict[str, Any]]:
+    libres = clinica.buscar_proximo_turno(
+        _texto(args, "especialidad"),
+        _fecha(args["desde"]),
+        _duracion(args.get("duracion_minutos", 30)),
+        _entero(args, "n", 5),
+        _fecha(args.get("hasta")),
+    )
+    return [{"fecha_hora": f.isoformat(), "matricula": m} for f, m in libres]
+
+def _obtener_proximos_turnos(clinica: Clinica, args: Dict[str, Any]) -> List[Dict[str, Any]]:
+    turnos = clinica.obtener_proximos_turnos(
+        _texto(args, "dni"), _fecha(args.get("desde")), _fecha(args.get("hasta")),
+        _entero(args, "limite", None),
+    )
+    return [serializar_turno(t) for t in turnos]
+
+def _obtener_huecos_libres(clinica: Clinica, args: Dict[str, Any]) -> List[Dict[str, Any]]:
+    huecos = clinica.obtener_huecos_libres(
+        _texto(args, "matricula"), _fecha(args["desde"]), _fecha(args["hasta"])
+    )
+    return [{"desde": inicio.isoformat(), "hasta": fin.isoformat()} for inicio, fin in huecos]
+
+def _buscar_pacientes(clinica: Clinica, args: Dict[str, Any]) -> List[Dict[str, Any]]:
+    pacientes = clinica.buscar_pacientes(_texto(args, "texto"), _entero(args, "limite", 20))
+    return [serializar_paciente(p) for p in pacientes]
+
+def _buscar_medicos(clinica: Clinica, args: Dict[str, Any]) -> List[Dict[str, Any]]:
+    medicos = clinica.buscar_medicos(_texto(args, "texto"), _entero(args, "limite", 20))
+    return [serializar_medico(m) for m in medicos]
+
+def _obtener_metricas(clinica: Clinica, args: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    metricas = clinica.obtener_metricas()
+    return metricas.obtener_resumen() if metricas is not None else None
+
+
+OPERACIONES: Dict[str, Callable[[Clinica, Dict[str, Any]], Any]] = {
+    "agregar_paciente":                 _agregar_paciente,
+    "agregar_medico":                   _agregar_medico,
+    "agregar_especialidad":             _agregar_especialidad,
+    "agendar_turno":                    _agendar_turno,
+    "cancelar_turno":                   _cancelar_turno,
+    "reprogramar_turno":                _reprogramar_turno,
+    "agregar_a_lista_espera":           _agregar_a_lista_espera,
+    "retirar_de_lista_espera":          _retirar_de_lista_espera,
+    "obtener_lista_espera":             _obtener_lista_espera,
+    "emitir_receta":                    _emitir_receta,
+    "obtener_historia_clinica":         _obtener_historia_clinica,
+    "obtener_turnos":                   _obtener_turnos,
+    "obtener_pacientes":                _obtener_pacientes,
+    "obtener_medicos":                  _obtener_medicos,
+    "obtener_medicos_por_especialidad": _obtener_medicos_por_especialidad,
+    "obtener_agenda":                   _obtener_agenda,
+    "buscar_proximo_turno":             _buscar_proximo_turno,
+    "obtener_huecos_libres":            _obtener_huecos_libres,
+    "obtener_proximos_turnos":          _obtener_proximos_turnos,
+    "buscar_pacientes":                 _buscar_pacientes,
+    "buscar_medicos":                   _buscar_medicos,
+    "obtener_metricas":                 _obtener_metricas,
+}
+
+
+def respuesta_de_error(excepcion: BaseException) -> Dict[str, Any]:
+    """Respuesta {"ok": false, ...} que describe la excepción"""
+    mensaje = f"Falta el argumento {excepcion}" if isinstance(excepcion, KeyError) else str(excepcion)
+    return {"ok": False, "error": type(excepcion).__name__, "mensaje": mensaje}
+
+
+def ejecutar_comando(clinica: Clinica, comando: Any) -> Dict[str, Any]:
+    """
+    Ejecuta un comando sobre la clínica y devuelve la respuesta serializable.
+    Si el comando trae "id", se copia en la respuesta.
+    """
+    respuesta: Dict[str, Any] = {}
+    if isinstance(comando, dict) and "id" in comando:
+        respuesta["id"] = comando["id"]
+
+    try:
+        if not isinstance(comando, dict):
+            raise ValueError("El comando debe ser un objeto JSON")
+        operacion = OPERACIONES.get(comando.get("op"))
+        if operacion is None:
+            raise ValueError(f"Operación desconocida: {comando.get('op')}")
+        args = comando.get("args", {})
+        if not isinstance(args, dict):
+            raise ValueError("Los argumentos deben ser un objeto JSON")
+
+        resultado = operacion(clinica, args)
+    except ERRORES_ESPERADOS as e:
+        respuesta.update(respuesta_de_error(e))
+    else:
+        respuesta.update(ok=True, resultado=resultado)
+    return respuesta
@@ -0,0 +1,168 @@
+"""
+Clase FederacionClinicas - Consultas sobre varias sedes, cada una con su
+propia Clinica
+
+Cada consulta se envía a todas las sedes a la vez a través de un pool de
+hilos y los resultados se combinan: la latencia de una consulta es la de la
+sede más lenta y no la suma de todas. Las sedes se consultan en hilos del
+pool, así que si se modifican mientras tanto desde otros hilos deben crearse
+con Clinica(concurrente=True).
+"""
+import heapq
+from concurrent.futures import Executor, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar
+
+from modelos.clinica  import Clinica
+from modelos.paciente import Paciente
+from modelos.receta   import Receta
+from modelos.turno    import Turno
+from excepciones.excepciones_clinica import PacienteNoEncontradoException
+
+R = TypeVar("R")
+
+
+class HistoriaFederada:
+    """Historia clínica de un paciente reunida de todas las sedes"""
+    __slots__ = ('sedes', 'turnos', 'recetas')
+
+    def __init__(self):
+        # Sedes donde el paciente está registrado, en orden de registro
+        self.sedes: List[str] = []
+        # (sede, turno) por fecha y hora
+        self.turnos: List[Tuple[str, Turno]] = []
+        # (sede, receta) por fecha de emisión
+        self.recetas: List[Tuple[str, Receta]] = []
+
+    def __str__(self) -> str:
+        return (f"HistoriaFederada({', '.join(self.sedes)}: {len(self.turnos)} turnos, "
+                f"{len(self.recetas)} recetas)")
+
+
+class FederacionClinicas:
+    """Registro de sedes que responde consultas entre todas ellas"""
+
+    def __init__(self, ejecutor: Optional[Executor] = None, max_hilos: Optional[int] = None):
+        """
+        Constructor de la clase FederacionClinicas
+
+        Args:
+            ejecutor: Ejecutor donde correr las consultas a las sedes. Si no se
+                      indica se crea un ThreadPoolExecutor propio, que se
+                      detiene con cerrar(). Un pool de procesos no sirve: las
+                      sedes son objetos en memoria de este proceso.
+            max_hilos: Hilos del pool propio (por defecto, el de ThreadPoolExecutor)
+        """
+        self.__sedes: Dict[str, Clinica] = {}
+        self.__ejecutor_propio = ejecutor is None
+        self.__ejecutor = ejecutor if ejecutor is not None else ThreadPoolExecutor(
+            max_workers=max_hilos, thread_name_prefix="federacion"
+        )
+
+    # ============================================================
+    # SEDES
+    # ============================================================
+    def registrar_sede(self, nombre: str, clinica: Clinica) -> None:
+        if not nombre or not nombre.strip():
+            raise ValueError("El nombre de la sede no puede estar vacío")
+        if nombre in self.__sedes:
+            raise ValueError(f"Ya existe una sede llamada {nombre}")
+        self.__sedes[nombre] = clinica
+
+    def quitar_sede(self, nombre: str) -> Clinica:
+        if nombre not in self.__sedes:
+            raise ValueError(f"No existe una sede llamada {nombre}")
+        return self.__sedes.pop(nombre)
+
+    def obtener_sedes(self) -> List[str]:
+        return list(self.__sedes)
+
+    def obtener_sede(self, nombre: str) -> Clinica:
+        if nombre not in self.__sedes:
+            raise ValueError(f"No existe una sede llamada {nombre}")
+        return self.__sedes[nombre]
+
+    # ============================================================
+    # CONSULTAS
+    # ============================================================
+    def buscar_paciente(self, dni: str) -> List[Tuple[str, Paciente]]:
+        """
+        Devuelve (sede, paciente) de cada sede donde el paciente está
+        registrado, en orden de registro de las sedes; vacía si no está en
+        ninguna.
+        """
+        return self._consultar(lambda clinica: clinica.obtener_paciente_por_dni(dni))
+
+    def buscar_proximo_turno(
+        self,
+        especialidad: str,
+        desde: datetime,
+        duracion: timedelta,
+        n: int = 5,
+        hasta: Optional[datetime] = None,
+    ) -> List[Tuple[datetime, str, str]]:
+        """
+        Devuelve hasta n horarios libres (fecha_hora, sede, matricula) en orden
+        cronológico, entre todas las sedes. Cada sede aporta sus n primeros,
+        ya ordenados, y se mezclan con un heap (heapq.merge).
+        """
+        por_sede = self._consultar(
+            lambda clinica: clinica.buscar_proximo_turno(especialidad, desde, duracion, n, hasta)
+        )
+        flujos = [
+            [(fecha_hora, sede, matricula) for fecha_hora, matricula in horarios]
+            for sede, horarios in por_sede
+        ]
+        return list(islice(heapq.merge(*flujos), n))
+
+    def obtener_historia_clinica_por_dni(self, dni: str) -> HistoriaFederada:
+        """Reúne los turnos y recetas del paciente en todas las sedes donde está registrado"""
+        def leer(clinica: Clinica) -> Tuple[List[Turno], List[Receta]]:
+            historia = clinica.obtener_historia_clinica_por_dni(dni)
+            # Se copian en el hilo del pool, para no recorrer las vistas después
+            return list(historia.obtener_turnos()), list(historia.obtener_recetas())
+
+        por_sede = self._consultar(leer)
+        if not por_sede:
+            raise PacienteNoEncontradoException(
+                f"No existe un paciente con DNI {dni} en ninguna sede"
+            )
+        resultado = HistoriaFederada()
+        for sede, (turnos, recetas) in por_sede:
+            resultado.sedes.append(sede)
+            resultado.turnos.extend((sede, turno) for turno in turnos)
+            resultado.recetas.extend((sede, receta) for receta in recetas)
+        resultado.turnos.sort(key=lambda par: par[1].obtener_fecha_hora())
+        resultado.recetas.sort(key=lambda par: par[1].obtener_fecha())
+        return resultado
+
+    def _consultar(self, consulta: Callable[[Clinica], R]) -> List[Tuple[str, R]]:
+        """
+        Ejecuta la consulta en todas las sedes a la vez y devuelve (sede,
+        resultado) en orden de registro. Las sedes donde el paciente no
+        existe se omiten; cualquier otro error se propaga.
+        """
+        pendientes = [(nombre, self.__ejecutor.submit(consulta, clinica))
+                      for nombre, clinica in self.__sedes.items()]
+        resultados: List[Tuple[str, R]] = []
+        for nombre, futuro in pendientes:
+            try:
+                resultados.append((nombre, futuro.result()))
+            except PacienteNoEncontradoException:
+                continue
+        return resultados
+
+    # ============================================================
+    # CIERRE
+    # ============================================================
+    def cerrar(self) -> None:
+        """Detiene el pool propio; un ejecutor recibido queda a cargo de quien lo creó"""
+        if self.__ejecutor_propio:
+            self.__ejecutor.shutdown(wait=True)
+
+    def __enter__(self) -> "FederacionClinicas":
+        return self
+
+    def __exit__(self, *excepcion) -> None:
+        self.cerrar()
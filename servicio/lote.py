@@ -0,0 +1,124 @@
+"""
+Modo por lotes: ejecuta un archivo (o stdin) de comandos JSON, uno por línea
+
+Usa el mismo formato de comandos que el servidor de red (ver
+servicio.comandos) y escribe una respuesta JSON por línea. Las líneas vacías
+y las que empiezan con '#' se ignoran. Las respuestas se acumulan y se
+escriben en bloques, y las escrituras al almacén se agrupan en una
+transacción por bloque. Con una ClinicaParticionada cada bloque se reparte
+entre las particiones, que lo ejecutan en paralelo.
+"""
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
+
+from modelos.clinica import Clinica
+from .comandos       import ejecutar_comando, respuesta_de_error
+from .particionado   import ClinicaParticionada
+
+# Cantidad de comandos por transacción y por escritura de la salida
+COMANDOS_POR_BLOQUE = 1_000
+
+
+def ejecutar_lote(
+    clinica: Union[Clinica, ClinicaParticionada],
+    entrada: Iterable[str],
+    salida: TextIO,
+    detener_en_error: bool = False,
+    comandos_por_bloque: int = COMANDOS_POR_BLOQUE,
+) -> Tuple[int, int]:
+    """
+    Ejecuta los comandos de la entrada y escribe las respuestas en la salida.
+    Si un comando no trae "id", la respuesta lleva el número de línea.
+
+    Args:
+        clinica: Clínica sobre la que se ejecutan los comandos
+        entrada: Líneas con un comando JSON cada una (ej: un archivo abierto o sys.stdin)
+        salida: Destino de las respuestas, una por línea
+        detener_en_error: Si es True, se detiene en el primer comando fallido (con
+                          una ClinicaParticionada, al terminar el bloque que lo contiene)
+        comandos_por_bloque: Comandos por transacción y por escritura de la salida
+
+    Returns:
+        (comandos ejecutados, comandos con error)
+    """
+    if comandos_por_bloque < 1:
+        raise ValueError("La cantidad de comandos por bloque debe ser mayor que cero")
+
+    ejecutados = errores = 0
+    for bloque in _bloques(entrada, comandos_por_bloque):
+        if isinstance(clinica, ClinicaParticionada):
+            respuestas = _ejecutar_particionado(clinica, bloque)
+        else:
+            respuestas = _ejecutar(clinica, bloque, detener_en_error)
+
+        lineas: List[str] = []
+        for (numero, _), respuesta in zip(bloque, respuestas):
+            respuesta.setdefault("id", numero)
+            lineas.append(json.dumps(respuesta, ensure_ascii=False))
+            ejecutados += 1
+            if not respuesta["ok"]:
+                errores += 1
+        salida.write("\n".join(lineas) + "\n")
+        if detener_en_error and errores:
+            break
+    salida.flush()
+    return ejecutados, errores
+
+
+def _ejecutar(clinica: Clinica, bloque: List[Tuple[int, str]],
+              detener_en_error: bool) -> List[Dict[str, Any]]:
+    """Ejecuta el bloque en orden dentro de una transacción del almacén"""
+    respuestas = []
+    with clinica.transaccion():
+        for _, linea in bloque:
+            comando, respuesta = _decodificar(linea)
+            if respuesta is None:
+                respuesta = _ejecutar_uno(clinica, comando)
+            respuestas.append(respuesta)
+            if detener_en_error and not respuesta["ok"]:
+                break
+    return respuestas
+
+
+def _ejecutar_particionado(clinica: ClinicaParticionada,
+                           bloque: List[Tuple[int, str]]) -> List[Dict[str, Any]]:
+    """Ejecuta el bloque completo repartido entre las particiones"""
+    decodificados = [_decodificar(linea) for _, linea in bloque]
+    validas = iter(clinica.ejecutar_varios(
+        [comando for comando, error in decodificados if error is None]
+    ))
+    return [error if error is not None else next(validas) for _, error in decodificados]
+
+
+def _ejecutar_uno(clinica: Clinica, comando: Any) -> Dict[str, Any]:
+    """
+    Ejecuta un comando; un error inesperado (ej: del almacén) se informa en
+    su respuesta en lugar de cortar el lote y perder las respuestas del bloque
+    """
+    try:
+        return ejecutar_comando(clinica, comando)
+    except Exception as e:
+        return respuesta_de_error(e)
+
+
+def _decodificar(linea: str) -> Tuple[Any, Optional[Dict[str, Any]]]:
+    """Devuelve (comando, None) o (None, respuesta de error) si la línea no es JSON válido"""
+    try:
+        return json.loads(linea), None
+    except json.JSONDecodeError as e:
+        return None, {"ok": False, "error": "JSONDecodeError", "mensaje": str(e)}
+
+
+def _bloques(entrada: Iterable[str], tamanio: int) -> Iterator[List[Tuple[int, str]]]:
+    """Agrupa las líneas con contenido en bloques de (número de línea, texto)"""
+    bloque: List[Tuple[int, str]] = []
+    for numero, linea in enumerate(entrada, 1):
+        linea = linea.strip()
+        if not linea or linea.startswith("#"):
+            continue
+        bloque.append((numero, linea))
+        if len(bloque) == tamanio:
+            yield bloque
+            bloque = []
+    if bloque:
+        yield bloque
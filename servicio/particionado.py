@@ -0,0 +1,423 @@
+"""
+Modo particionado: la clínica repartida por matrícula entre varios procesos
+
+Cada partición es un proceso con su propia Clinica en memoria que atiende
+comandos estructurados (ver servicio.comandos). Los médicos, y con ellos sus
+turnos, agendas y recetas, viven en la partición que corresponde a su
+matrícula; los pacientes se replican en todas. El coordinador (este proceso)
+enruta cada comando:
+- a la partición dueña de la matrícula (o del id de turno),
+- a todas, para las altas de pacientes (registro replicado),
+- a una réplica cualquiera, en rotación, para las lecturas de pacientes,
+- a todas y combinando las respuestas (scatter-gather) para los listados,
+  que conservan el orden de una Clinica única.
+
+Los ids de turno son globales: id = id_local * particiones + partición.
+Como los turnos de un paciente pueden quedar en particiones distintas, el
+coordinador lleva los horarios de cada paciente y rechaza los turnos que se
+superponen, igual que una Clinica única.
+Limitaciones: la lista de espera no está disponible y el estado no se
+persiste.
+"""
+import heapq
+import itertools
+import math
+import multiprocessing
+import os
+import zlib
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from modelos.clinica import Clinica
+from excepciones.excepciones_clinica import TurnoOcupadoException
+from .comandos       import ejecutar_comando, respuesta_de_error, _duracion, _entero, _fecha, _texto
+
+# Operaciones que se envían a la partición dueña de args["matricula"]
+POR_MATRICULA = {
+    "agregar_medico", "agregar_especialidad", "agendar_turno", "emitir_receta",
+    "obtener_agenda", "obtener_huecos_libres",
+}
+# Operaciones que se envían a la partición dueña de args["id_turno"]
+POR_TURNO = {"cancelar_turno", "reprogramar_turno"}
+# Lecturas del registro replicado de pacientes: las atiende cualquier réplica
+REPLICADAS = {"obtener_pacientes", "buscar_pacientes"}
+# Operaciones que no se ofrecen en modo particionado
+NO_DISPONIBLES = {"agregar_a_lista_espera", "retirar_de_lista_espera", "obtener_lista_espera"}
+
+Respuesta = Dict[str, Any]
+# (inicio, fin, matricula) de un turno
+Horario = Tuple[datetime, datetime, str]
+
+
+def _particion(conexion) -> None:
+    """Proceso de una partición: ejecuta bloques de comandos hasta recibir None"""
+    clinica = Clinica()
+    while True:
+        bloque = conexion.recv()
+        if bloque is None:
+            break
+        respuestas = []
+        for comando in bloque:
+            try:
+                respuestas.append(ejecutar_comando(clinica, comando))
+            except Exception as e:
+                # Un error inesperado no debe terminar la partición
+                respuestas.append(respuesta_de_error(e))
+        conexion.send(respuestas)
+    conexion.close()
+
+
+class ClinicaParticionada:
+    """
+    Coordinador de una clínica repartida entre procesos.
+
+    Se usa con comandos estructurados, igual que ejecutar_comando; un bloque
+    de comandos (ejecutar_varios) se reparte de una vez entre las particiones,
+    que lo procesan en paralelo y en orden dentro de cada una.
+    """
+
+    def __init__(self, particiones: Optional[int] = None, contexto: Optional[str] = None):
+        """
+        Constructor de la clase ClinicaParticionada
+
+        Args:
+            particiones: Cantidad de procesos (por defecto, uno por CPU)
+            contexto: Método de inicio de multiprocessing ("fork", "spawn", ...);
+                      None usa el de la plataforma
+        """
+        particiones = particiones or os.cpu_count() or 1
+        if particiones < 1:
+            raise ValueError("La cantidad de particiones debe ser mayor que cero")
+
+        mp = multiprocessing.get_context(contexto)
+        self.__conexiones = []
+        self.__procesos = []
+        for indice in range(particiones):
+            propia, remota = mp.Pipe()
+            proceso = mp.Process(target=_particion, args=(remota,),
+                                 name=f"particion-{indice}", daemon=True)
+            proceso.start()
+            remota.close()
+            self.__conexiones.append(propia)
+            self.__procesos.append(proceso)
+        self.__rotacion = itertools.cycle(range(particiones))
+        self.__horarios = _HorariosPacientes()
+        # Número de alta global de cada médico y turno vigente, para mezclar
+        # los listados en el mismo orden que una Clinica única
+        self.__altas: Dict[Tuple[str, Any], int] = {}
+        self.__contador_altas = itertools.count()
+
+    # ============================================================
+    # ENRUTAMIENTO
+    # ============================================================
+    def obtener_cantidad_particiones(self) -> int:
+        return len(self.__conexiones)
+
+    def particion_de_matricula(self, matricula: str) -> int:
+        """Partición dueña del médico; crc32 es estable entre procesos, a diferencia de hash()"""
+        return zlib.crc32(matricula.encode("utf-8")) % len(self.__conexiones)
+
+    def __destinos(self, comando: Any) -> Tuple[List[int], Any]:
+        """Devuelve las particiones que reciben el comando y el comando a enviarles"""
+        todas = list(range(len(self.__conexiones)))
+        if not isinstance(comando, dict) or not isinstance(comando.get("args", {}), dict):
+            # Cualquier partición responde el error de formato
+            return [next(self.__rotacion)], comando
+
+        op, args = comando.get("op"), comando.get("args", {})
+        if op in POR_MATRICULA and isinstance(args.get("matricula"), str):
+            return [self.particion_de_matricula(args["matricula"])], comando
+        if op in POR_TURNO and _es_entero(args.get("id_turno")):
+            local, particion = divmod(args["id_turno"], len(self.__conexiones))
+            return [particion], {**comando, "args": {**args, "id_turno": local}}
+        if op == "agregar_paciente" or op not in REPLICADAS | POR_MATRICULA | POR_TURNO:
+            return todas, comando
+        # Lecturas replicadas, y comandos a los que les falta la clave (la
+        # partición elegida responde el error)
+        return [next(self.__rotacion)], comando
+
+    # ============================================================
+    # EJECUCIÓN
+    # ============================================================
+    def ejecutar(self, comando: Any) -> Respuesta:
+        """Ejecuta un comando y devuelve la respuesta, como ejecutar_comando"""
+        return self.ejecutar_varios([comando])[0]
+
+    def ejecutar_varios(self, comandos: Sequence[Any]) -> List[Respuesta]:
+        """
+        Ejecuta un bloque de comandos repartiéndolo entre las particiones, que
+        trabajan en paralelo, y devuelve las respuestas en el mismo orden.
+        Dentro de cada partición los comandos se ejecutan en el orden dado.
+        """
+        resultado: List[Respuesta] = []
+        while len(resultado) < len(comandos):
+            resultado.extend(self.__ejecutar_tramo(comandos[len(resultado):]))
+        return resultado
+
+    def __ejecutar_tramo(self, comandos: Sequence[Any]) -> List[Respuesta]:
+        """
+        Ejecuta los comandos desde el primero hasta el que necesita conocer el
+        resultado de otro turno del mismo paciente enviado en este tramo, y
+        devuelve las respuestas de los ejecutados (al menos uno).
+        """
+        por_particion: List[List[Any]] = [[] for _ in self.__conexiones]
+        # Por comando: lista de (partición, posición de su respuesta en esa partición)
+        ubicaciones: List[List[Tuple[int, int]]] = []
+        respuestas_locales: Dict[int, Respuesta] = {}
+        horarios = self.__horarios
+        for posicion, comando in enumerate(comandos):
+            if isinstance(comando, dict) and comando.get("op") in NO_DISPONIBLES:
+                respuestas_locales[posicion] = {
+                    "ok": False, "error": "ValueError",
+                    "mensaje": f"Operación no disponible en modo particionado: {comando['op']}",
+                }
+                ubicaciones.append([])
+                continue
+            try:
+                if not horarios.reservar(comando):
+                    # Depende de un comando en curso: va en el próximo tramo
+                    break
+            except TurnoOcupadoException as e:
+                respuestas_locales[posicion] = respuesta_de_error(e)
+                ubicaciones.append([])
+                continue
+            destinos, enviado = self.__destinos(comando)
+            ubicaciones.append([(p, len(por_particion[p])) for p in destinos])
+            for particion in destinos:
+                por_particion[particion].append(enviado)
+
+        # Scatter: todas las particiones reciben su parte antes de esperar a ninguna
+        for conexion, bloque in zip(self.__conexiones, por_particion):
+            if bloque:
+                conexion.send(bloque)
+        recibidas = [conexion.recv() if bloque else []
+                     for conexion, bloque in zip(self.__conexiones, por_particion)]
+
+        # Gather
+        resultado: List[Respuesta] = []
+        for posicion, comando in enumerate(comandos[:len(ubicaciones)]):
+            if posicion in respuestas_locales:
+                respuesta = respuestas_locales[posicion]
+            else:
+                parciales = [(p, recibidas[p][i]) for p, i in ubicaciones[posicion]]
+                respuesta = self.__combinar(comando, parciales)
+                horarios.confirmar(comando, respuesta)
+                self.__registrar_alta(comando, respuesta)
+            if isinstance(comando, dict) and "id" in comando:
+                respuesta["id"] = comando["id"]
+            resultado.append(respuesta)
+        horarios.cerrar_tramo()
+        return resultado
+
+    def __combinar(self, comando: Any, parciales: List[Tuple[int, Respuesta]]) -> Respuesta:
+        """Une las respuestas de las particiones en la respuesta de un único proceso"""
+        for particion, respuesta in parciales:
+            if respuesta["ok"]:
+                _globalizar_ids(respuesta["resultado"], particion, len(self.__conexiones))
+            respuesta.pop("id", None)
+
+        if len(parciales) == 1:
+            return parciales[0][1]
+        errores = [r for _, r in parciales if not r["ok"]]
+        exitos = [r["resultado"] for _, r in parciales if r["ok"]]
+        op, args = comando.get("op"), comando.get("args", {})
+        if op == "obtener_historia_clinica":
+            # El paciente existe en todas las particiones: un error es de todas
+            if errores:
+                return errores[0]
+        elif errores and (op == "agregar_paciente" or not exitos):
+            return errores[0]
+
+        if op in EN_ORDEN_DE_ALTA:
+            campo, limite, defecto = EN_ORDEN_DE_ALTA[op]
+            altas = self.__altas
+            combinar = _mezclar_por(lambda e: altas.get((campo, e[campo]), math.inf), limite, defecto)
+        else:
+            combinar = COMBINACIONES.get(op, _concatenar)
+        return {"ok": True, "resultado": combinar(exitos, args)}
+
+    def __registrar_alta(self, comando: Any, respuesta: Respuesta) -> None:
+        """Numera los médicos y turnos nuevos en el orden en que se confirman"""
+        if not respuesta["ok"]:
+            return
+        op = comando.get("op")
+        if op == "agregar_medico":
+            self.__altas[("matricula", comando["args"]["matricula"])] = next(self.__contador_altas)
+        elif op == "agendar_turno":
+            self.__altas[("id_turno", respuesta["resultado"]["id_turno"])] = next(self.__contador_altas)
+        elif op == "cancelar_turno":
+            self.__altas.pop(("id_turno", respuesta["resultado"]["id_turno"]), None)
+
+    # ============================================================
+    # CIERRE
+    # ============================================================
+    def cerrar(self) -> None:
+        """Detiene los procesos de las particiones"""
+        for conexion in self.__conexiones:
+            try:
+                conexion.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            conexion.close()
+        for proceso in self.__procesos:
+            proceso.join(timeout=5)
+            if proceso.is_alive():
+                proceso.terminate()
+        self.__conexiones = []
+        self.__procesos = []
+
+    def __enter__(self) -> "ClinicaParticionada":
+        return self
+
+    def __exit__(self, *excepcion) -> None:
+        self.cerrar()
+
+
+class _HorariosPacientes:
+    """
+    Horarios de los turnos de cada paciente, llevados por el coordinador.
+
+    Cada partición solo ve los turnos de sus médicos, así que la superposición
+    de turnos de un mismo paciente se verifica acá. Los comandos de un tramo
+    se envían juntos: si un turno depende del resultado de otro del mismo
+    paciente que todavía no volvió, se deja para el tramo siguiente.
+    """
+
+    def __init__(self):
+        self.__por_dni: Dict[str, Dict[int, Horario]] = {}
+        self.__dni_de_turno: Dict[int, str] = {}
+        # Del tramo en curso: horarios pedidos por dni, y pacientes con un turno
+        # cancelado o reprogramado cuyo resultado aún no se conoce
+        self.__pedidos: Dict[str, List[Tuple[datetime, datetime]]] = {}
+        self.__modificados: Set[str] = set()
+
+    def reservar(self, comando: Any) -> bool:
+        """
+        Registra el comando en el tramo en curso. Devuelve False si debe esperar
+        al tramo siguiente y lanza TurnoOcupadoException si el paciente ya tiene
+        un turno en ese horario. Los comandos mal formados se dejan pasar: la
+        partición responde el error.
+        """
+        if not isinstance(comando, dict) or not isinstance(comando.get("args", {}), dict):
+            return True
+        op, args = comando.get("op"), comando.get("args", {})
+        try:
+            if op == "agendar_turno":
+                dni = _texto(args, "dni")
+                inicio = _fecha(args["fecha_hora"])
+                fin = inicio + _duracion(args.get("duracion_minutos", 30))
+                id_turno = None
+            elif op in POR_TURNO:
+                id_turno = _entero(args, "id_turno")
+                dni = self.__dni_de_turno[id_turno]
+                if op == "cancelar_turno":
+                    self.__modificados.add(dni)
+                    return True
+                inicio = _fecha(args["fecha_hora"])
+                minutos = args.get("duracion_minutos")
+                anterior_inicio, anterior_fin, _ = self.__por_dni[dni][id_turno]
+                fin = inicio + (_duracion(minutos) if minutos is not None
+                                else anterior_fin - anterior_inicio)
+            else:
+                return True
+        except (KeyError, TypeError, ValueError, OverflowError):
+            return True
+
+        if dni in self.__modificados:
+            return False
+        if any(a < fin and inicio < b for a, b in self.__pedidos.get(dni, [])):
+            return False
+        for otro, (a, b, matricula) in self.__por_dni.get(dni, {}).items():
+            if otro != id_turno and a < fin and inicio < b:
+                raise TurnoOcupadoException(
+                    f"El paciente ya tiene un turno de {a:%H:%M} a {b:%H:%M} "
+                    f"con el médico de matrícula {matricula}"
+                )
+        self.__pedidos.setdefault(dni, []).append((inicio, fin))
+        if id_turno is not None:
+            self.__modificados.add(dni)
+        return True
+
+    def confirmar(self, comando: Any, respuesta: Respuesta) -> None:
+        """Actualiza los horarios con la respuesta de un comando ejecutado"""
+        if not respuesta["ok"] or comando.get("op") not in ("agendar_turno", *POR_TURNO):
+            return
+        turno = respuesta["resultado"]
+        id_turno, dni = turno["id_turno"], turno["dni"]
+        turnos = self.__por_dni.setdefault(dni, {})
+        if comando["op"] == "cancelar_turno":
+            turnos.pop(id_turno, None)
+            self.__dni_de_turno.pop(id_turno, None)
+            return
+        inicio = datetime.fromisoformat(turno["fecha_hora"])
+        fin = inicio + _duracion(turno["duracion_minutos"])
+        turnos[id_turno] = (inicio, fin, turno["matricula"])
+        self.__dni_de_turno[id_turno] = dni
+
+    def cerrar_tramo(self) -> None:
+        self.__pedidos.clear()
+        self.__modificados.clear()
+
+
+# ============================================================
+# COMBINACIÓN DE RESULTADOS
+# ============================================================
+def _es_entero(valor: Any) -> bool:
+    return isinstance(valor, int) and not isinstance(valor, bool)
+
+def _globalizar_ids(resultado: Any, particion: int, particiones: int) -> None:
+    """Reemplaza en el resultado cada id de turno local por el global"""
+    if isinstance(resultado, list):
+        for elemento in resultado:
+            _globalizar_ids(elemento, particion, particiones)
+    elif isinstance(resultado, dict):
+        for clave, valor in resultado.items():
+            if clave == "id_turno" and _es_entero(valor):
+                resultado[clave] = valor * particiones + particion
+            else:
+                _globalizar_ids(valor, particion, particiones)
+
+def _primero(resultados: List[Any], args: Dict[str, Any]) -> Any:
+    return resultados[0]
+
+def _concatenar(resultados: List[Any], args: Dict[str, Any]) -> List[Any]:
+    return [elemento for resultado in resultados for elemento in resultado]
+
+def _mezclar_por(clave: Callable[[Any], Any], limite: Optional[str] = None, defecto=None):
+    """Mezcla listas ya ordenadas por `clave` y, si se indica, corta en args[limite]"""
+    def combinar(resultados: List[List[Any]], args: Dict[str, Any]) -> List[Any]:
+        mezclados = heapq.merge(*resultados, key=clave)
+        cantidad = args.get(limite, defecto) if limite else None
+        return list(itertools.islice(mezclados, cantidad) if cantidad is not None else mezclados)
+    return combinar
+
+def _historia(resultados: List[Dict[str, Any]], args: Dict[str, Any]) -> Dict[str, Any]:
+    """Turnos por fecha y hora y recetas por fecha de emisión, de todas las particiones"""
+    return {
+        "turnos": sorted(_concatenar([h["turnos"] for h in resultados], args),
+                         key=lambda t: t["fecha_hora"]),
+        "recetas": sorted(_concatenar([h["recetas"] for h in resultados], args),
+                          key=lambda r: r["fecha"]),
+    }
+
+def _metricas(resultados: List[Any], args: Dict[str, Any]) -> List[Any]:
+    """Un resumen por partición"""
+    return resultados
+
+COMBINACIONES: Dict[str, Callable[[List[Any], Dict[str, Any]], Any]] = {
+    "agregar_paciente":                 _primero,
+    "obtener_historia_clinica":         _historia,
+    "obtener_medicos_por_especialidad": _mezclar_por(lambda m: m["matricula"]),
+    "buscar_proximo_turno":             _mezclar_por(lambda t: (t["fecha_hora"], t["matricula"]), "n", 5),
+    "obtener_proximos_turnos":          _mezclar_por(lambda t: t["fecha_hora"], "limite"),
+    "obtener_metricas":                 _metricas,
+}
+
+# Listados en orden de alta: cada partición los devuelve en su orden de alta y
+# se mezclan por el número de alta global que lleva el coordinador.
+# op -> (campo que identifica al elemento, argumento con el límite, límite por defecto)
+EN_ORDEN_DE_ALTA: Dict[str, Tuple[str, Optional[str], Optional[int]]] = {
+    "obtener_medicos": ("matricula", None, None),
+    "buscar_medicos":  ("matricula", "limite", 20),
+    "obtener_turnos":  ("id_turno", None, None),
+}
@@ -0,0 +1,114 @@
+"""
+Clase ServidorClinica - Servicio asyncio que expone la Clinica por un socket
+local usando un protocolo de líneas JSON
+"""
+import asyncio
+import json
+from concurrent.futures import Executor
+from typing import Any, Dict, Optional
+
+from modelos.clinica import Clinica
+from .comandos       import ejecutar_comando, respuesta_de_error
+
+# Tamaño máximo de una línea de pedido
+LIMITE_LINEA = 1024 * 1024
+
+
+class ServidorClinica:
+    """
+    Servidor de líneas JSON sobre TCP o socket Unix.
+
+    Cada línea recibida es un comando {"id": ..., "op": ..., "args": {...}}
+    (ver servicio.comandos) y se responde con una línea JSON, en el mismo
+    orden. Todas las conexiones se atienden en un único bucle de eventos,
+    sin un hilo por cliente.
+    """
+
+    def __init__(self, clinica: Clinica, ejecutor: Optional[Executor] = None):
+        """
+        Constructor de la clase ServidorClinica
+
+        Args:
+            clinica: Clínica compartida por todos los clientes
+            ejecutor: Si se indica, los comandos corren en ese ejecutor para no
+                      bloquear el bucle (útil con almacenes en disco). En ese
+                      caso la clínica debe crearse con concurrente=True.
+        """
+        self.__clinica = clinica
+        self.__ejecutor = ejecutor
+        self.__servidor: Optional[asyncio.AbstractServer] = None
+
+    async def iniciar_tcp(self, host: str = "127.0.0.1", puerto: int = 0) -> int:
+        """Comienza a escuchar por TCP y devuelve el puerto asignado"""
+        self.__servidor = await asyncio.start_server(
+            self.__atender, host, puerto, limit=LIMITE_LINEA
+        )
+        return self.__servidor.sockets[0].getsockname()[1]
+
+    async def iniciar_unix(self, ruta: str) -> None:
+        """Comienza a escuchar en un socket Unix"""
+        self.__servidor = await asyncio.start_unix_server(
+            self.__atender, ruta, limit=LIMITE_LINEA
+        )
+
+    async def servir_para_siempre(self) -> None:
+        if self.__servidor is None:
+            raise RuntimeError("El servidor no fue iniciado")
+        async with self.__servidor:
+            await self.__servidor.serve_forever()
+
+    async def detener(self) -> None:
+        if self.__servidor is not None:
+            self.__servidor.close()
+            await self.__servidor.wait_closed()
+            self.__servidor = None
+
+    async def __ejecutar(self, comando: Any) -> Dict[str, Any]:
+        try:
+            if self.__ejecutor is None:
+                return ejecutar_comando(self.__clinica, comando)
+            bucle = asyncio.get_running_loop()
+            return await bucle.run_in_executor(
+                self.__ejecutor, ejecutar_comando, self.__clinica, comando
+            )
+        except Exception as e:
+            # Un error inesperado (ej: del almacén) se responde al cliente en
+            # lugar de cerrar su conexión
+            respuesta = respuesta_de_error(e)
+            if isinstance(comando, dict) and "id" in comando:
+                respuesta["id"] = comando["id"]
+            return respuesta
+
+    async def __atender(self, lector: asyncio.StreamReader, escritor: asyncio.StreamWriter) -> None:
+        """Atiende una conexión hasta que el cliente la cierra"""
+        try:
+            while True:
+                try:
+                    linea = await lector.readline()
+                except ValueError:
+                    respuesta = {"ok": False, "error": "ValueError",
+                                 "mensaje": "Línea demasiado larga"}
+                    escritor.write(json.dumps(respuesta).encode() + b"\n")
+                    break
+                if not linea:
+                    break
+                if not linea.strip():
+                    continue
+
+                try:
+                    comando = json.loads(linea)
+                except json.JSONDecodeError as e:
+                    respuesta = {"ok": False, "error": "JSONDecodeError", "mensaje": str(e)}
+                else:
+                    respuesta = await self.__ejecutar(comando)
+
+                escritor.write(json.dumps(respuesta, ensure_ascii=False).encode("utf-8") + b"\n")
+                await escritor.drain()
+        except ConnectionError:
+            pass
+        finally:
+            escritor.close()
+            try:
+                await escritor.wait_closed()
+            except ConnectionError:
+                pass
@@ -0,0 +1,101 @@
+import unittest
+from datetime import datetime
+from modelos import Agenda, Turno, Paciente, Medico, Especialidad
+
+class TestAgenda(unittest.TestCase):
+    
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.paciente = Paciente("Juan Pérez", "12345678", "01/01/1990")
+        especialidad = Especialidad("Pediatría", ["lunes", "miércoles"])
+        self.medico = Medico("Dr. García", "54321", [especialidad])
+        self.agenda = Agenda()
+    
+    def crear_turno(self, fecha_hora):
+        return Turno(self.paciente, self.medico, fecha_hora, "Pediatría")
+    
+    def test_agenda_vacia(self):
+        """Test para verificar que una agenda nueva no tiene turnos"""
+        self.assertEqual(len(self.agenda), 0)
+        self.assertEqual(self.agenda.obtener_turnos_entre(), [])
+    
+    def test_agregar_turnos_desordenados(self):
+        """Test para verificar que los turnos quedan ordenados cronológicamente"""
+        fechas = [datetime(2025, 12, 10, 9), datetime(2025, 12, 8, 14), datetime(2025, 12, 8, 9)]
+        for fecha in fechas:
+            self.agenda.agregar_turno(self.crear_turno(fecha))
+        
+        obtenidas = [t.obtener_fecha_hora() for t in self.agenda.obtener_turnos_entre()]
+        self.assertEqual(obtenidas, sorted(fechas))
+    
+    def test_obtener_turnos_entre(self):
+        """Test para verificar el intervalo [desde, hasta)"""
+        for dia in (8, 10, 15):
+            self.agenda.agregar_turno(self.crear_turno(datetime(2025, 12, dia, 9)))
+        
+        semana = self.agenda.obtener_turnos_entre(datetime(2025, 12, 8), datetime(2025, 12, 15, 9))
+        self.assertEqual([t.obtener_fecha_hora().day for t in semana], [8, 10])
+        self.assertEqual(len(self.agenda.obtener_turnos_entre(desde=datetime(2025, 12, 10, 9))), 2)
+        primeros = self.agenda.obtener_turnos_entre(datetime(2025, 12, 9), limite=1)
+        self.assertEqual([t.obtener_fecha_hora().day for t in primeros], [10])
+    
+    def test_obtener_superposicion(self):
+        """Test para detectar turnos que se superponen con un intervalo"""
+        turno = self.crear_turno(datetime(2025, 12, 8, 10, 0))
+        self.agenda.agregar_turno(turno)
+        self.agenda.agregar_turno(self.crear_turno(datetime(2025, 12, 8, 11, 0)))
+        
+        self.assertIs(self.agenda.obtener_superposicion(datetime(2025, 12, 8, 10, 5),
+                                                        datetime(2025, 12, 8, 10, 20)), turno)
+        self.assertIs(self.agenda.obtener_superposicion(datetime(2025, 12, 8, 9, 45),
+                                                        datetime(2025, 12, 8, 10, 1)), turno)
+        self.assertIsNone(self.agenda.obtener_superposicion(datetime(2025, 12, 8, 10, 30),
+                                                            datetime(2025, 12, 8, 11, 0)))
+        self.assertIsNone(self.agenda.obtener_superposicion(datetime(2025, 12, 8, 9, 0),
+                                                            datetime(2025, 12, 8, 10, 0)))
+    
+    def test_ignorar_turno_en_superposicion(self):
+        """Test para descartar un turno (el que se reprograma) al buscar superposiciones"""
+        anterior = self.crear_turno(datetime(2025, 12, 8, 9, 0))
+        turno = self.crear_turno(datetime(2025, 12, 8, 10, 0))
+        self.agenda.agregar_turno(anterior)
+        self.agenda.agregar_turno(turno)
+        
+        self.assertIsNone(self.agenda.obtener_superposicion(datetime(2025, 12, 8, 9, 30),
+                                                            datetime(2025, 12, 8, 10, 15), turno))
+        self.assertIs(self.agenda.obtener_superposicion(datetime(2025, 12, 8, 9, 15),
+                                                        datetime(2025, 12, 8, 10, 15), turno), anterior)
+    
+    def test_quitar_turno(self):
+        """Test para quitar un turno y liberar su horario"""
+        turno = self.crear_turno(datetime(2025, 12, 8, 10, 0))
+        self.agenda.agregar_turno(self.crear_turno(datetime(2025, 12, 8, 9, 0)))
+        self.agenda.agregar_turno(turno)
+        
+        self.agenda.quitar_turno(turno)
+        self.assertEqual(len(self.agenda), 1)
+        self.assertIsNone(self.agenda.obtener_superposicion(datetime(2025, 12, 8, 10, 0),
+                                                            datetime(2025, 12, 8, 10, 30)))
+        with self.assertRaises(ValueError):
+            self.agenda.quitar_turno(turno)
+    
+    def test_obtener_huecos(self):
+        """Test para obtener los intervalos libres entre turnos"""
+        for hora, minuto in ((9, 0), (9, 30), (11, 0)):
+            self.agenda.agregar_turno(self.crear_turno(datetime(2025, 12, 8, hora, minuto)))
+        
+        huecos = self.agenda.obtener_huecos(datetime(2025, 12, 8, 9, 15), datetime(2025, 12, 8, 12, 0))
+        self.assertEqual(huecos, [
+            (datetime(2025, 12, 8, 10, 0), datetime(2025, 12, 8, 11, 0)),
+            (datetime(2025, 12, 8, 11, 30), datetime(2025, 12, 8, 12, 0)),
+        ])
+        self.assertEqual(self.agenda.obtener_huecos(datetime(2025, 12, 9), datetime(2025, 12, 10)),
+                         [(datetime(2025, 12, 9), datetime(2025, 12, 10))])
+    
+    def test_agregar_turno_invalido(self):
+        """Test para verificar error al agregar un turno inválido"""
+        with self.assertRaises(TypeError):
+            self.agenda.agregar_turno("turno_string")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+from persistencia import Almacen
+
+class AlmacenEnMemoria(Almacen):
+    """Almacén mínimo que guarda los registros en una lista"""
+
+    def __init__(self):
+        self.registros = []
+
+    def guardar_paciente(self, paciente):
+        self.registros.append(("paciente", paciente))
+
+    def guardar_medico(self, medico):
+        self.registros.append(("medico", medico))
+
+    def guardar_especialidad(self, matricula, especialidad):
+        self.registros.append(("especialidad", matricula, especialidad))
+
+    def guardar_turno(self, turno):
+        self.registros.append(("turno", turno))
+
+    def eliminar_turno(self, id_turno):
+        self.registros.append(("cancelacion", id_turno))
+
+    def guardar_receta(self, receta):
+        self.registros.append(("receta", receta))
+
+    def cargar(self):
+        return iter(self.registros)
+
+class TestAlmacen(unittest.TestCase):
+
+    def test_es_abstracto(self):
+        """Test para verificar que el almacén base no se puede instanciar"""
+        with self.assertRaises(TypeError):
+            Almacen()
+
+    def test_subclase_incompleta_falla_al_construirse(self):
+        """Test para verificar que una subclase sin todos los métodos falla al construirse, no al guardar"""
+        class SinCancelaciones(Almacen):
+            guardar_paciente = AlmacenEnMemoria.guardar_paciente
+            guardar_medico = AlmacenEnMemoria.guardar_medico
+            guardar_especialidad = AlmacenEnMemoria.guardar_especialidad
+            guardar_turno = AlmacenEnMemoria.guardar_turno
+            guardar_receta = AlmacenEnMemoria.guardar_receta
+            cargar = AlmacenEnMemoria.cargar
+
+        with self.assertRaisesRegex(TypeError, "eliminar_turno"):
+            SinCancelaciones()
+
+    def test_subclase_completa(self):
+        """Test para usar los métodos con implementación por defecto en una subclase completa"""
+        almacen = AlmacenEnMemoria()
+        with almacen.transaccion():
+            almacen.eliminar_turno(3)
+        self.assertEqual(list(almacen.cargar()), [("cancelacion", 3)])
+        self.assertEqual(list(almacen.cargar_recetas("12345678")), [])
+        self.assertFalse(almacen.RECETAS_DIFERIDAS)
+
+if __name__ == '__main__':
+    unittest.main()
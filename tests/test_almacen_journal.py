@@ -0,0 +1,159 @@
+import glob
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from modelos import Clinica, Paciente, Medico, Especialidad
+from persistencia import AlmacenJournal
+from excepciones import TurnoNoEncontradoException
+
+class TestAlmacenJournal(unittest.TestCase):
+    
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.directorio = tempfile.TemporaryDirectory()
+        self.almacenes = []
+    
+    def tearDown(self):
+        for almacen in self.almacenes:
+            almacen.cerrar()
+        self.directorio.cleanup()
+    
+    def abrir_clinica(self, registros_por_instantanea=10_000):
+        almacen = AlmacenJournal(self.directorio.name, registros_por_instantanea)
+        self.almacenes.append(almacen)
+        return Clinica(almacen), almacen
+    
+    def reabrir(self, **kwargs):
+        self.almacenes.pop().cerrar()
+        return self.abrir_clinica(**kwargs)
+    
+    def poblar(self, clinica):
+        clinica.agregar_paciente(Paciente("Juan Pérez", "12345678", "01/01/1990"))
+        medico = Medico("Dr. García", "54321", [Especialidad("Pediatría", ["lunes", "miércoles"])])
+        clinica.agregar_medico(medico)
+        medico.agregar_especialidad(Especialidad("Cardiología", ["martes"]))
+        clinica.agendar_turno("12345678", "54321", "Pediatría", datetime(2025, 12, 8, 14, 30))
+        clinica.agendar_turno("12345678", "54321", "Cardiología", datetime(2025, 12, 9, 10, 0),
+                              timedelta(minutes=45))
+        clinica.emitir_receta("12345678", "54321", ["Paracetamol"])
+    
+    def verificar_estado(self, clinica):
+        medico = clinica.obtener_medico_por_matricula("54321")
+        self.assertEqual(
+            [e.obtener_especialidad() for e in medico.obtener_especialidades()],
+            ["Pediatría", "Cardiología"],
+        )
+        historia = clinica.obtener_historia_clinica_por_dni("12345678")
+        self.assertEqual([t.obtener_duracion() for t in historia.obtener_turnos()],
+                         [timedelta(minutes=30), timedelta(minutes=45)])
+        self.assertEqual(historia.obtener_recetas()[0].obtener_medicamentos(), ["Paracetamol"])
+    
+    def test_reproducir_journal(self):
+        """Test para reconstruir la clínica reproduciendo el registro de operaciones"""
+        clinica, _ = self.abrir_clinica()
+        self.poblar(clinica)
+        clinica, _ = self.reabrir()
+        self.verificar_estado(clinica)
+    
+    def test_instantanea_y_cola(self):
+        """Test para reconstruir desde una instantánea más los registros posteriores"""
+        clinica, almacen = self.abrir_clinica()
+        self.poblar(clinica)
+        almacen.compactar()
+        clinica.emitir_receta("12345678", "54321", ["Ibuprofeno"])
+        
+        self.assertEqual(len(glob.glob(os.path.join(self.directorio.name, "snapshot-*.json"))), 1)
+        clinica, _ = self.reabrir()
+        self.verificar_estado(clinica)
+        recetas = clinica.obtener_historia_clinica_por_dni("12345678").obtener_recetas()
+        self.assertEqual(len(recetas), 2)
+    
+    def test_compactacion_automatica(self):
+        """Test para verificar la compactación en segundo plano al llenarse un segmento"""
+        clinica, _ = self.abrir_clinica(registros_por_instantanea=2)
+        self.poblar(clinica)
+        clinica, _ = self.reabrir(registros_por_instantanea=2)
+        
+        self.assertTrue(glob.glob(os.path.join(self.directorio.name, "snapshot-*.json")))
+        self.verificar_estado(clinica)
+    
+    def test_cancelar_y_reprogramar(self):
+        """Test para reproducir y compactar cancelaciones y reprogramaciones"""
+        clinica, almacen = self.abrir_clinica()
+        self.poblar(clinica)
+        turno = clinica.agendar_turno("12345678", "54321", "Pediatría", datetime(2025, 12, 10, 9, 0))
+        clinica.reprogramar_turno(turno.obtener_id(), datetime(2025, 12, 15, 9, 0))
+        primero = clinica.obtener_turnos()[0]
+        clinica.reprogramar_turno(primero.obtener_id(), datetime(2025, 12, 8, 15, 0))
+        for compactar in (False, True):
+            if compactar:
+                almacen.compactar()
+            clinica, almacen = self.reabrir()
+            self.assertEqual(clinica.obtener_turno(turno.obtener_id()).obtener_fecha_hora(),
+                             datetime(2025, 12, 15, 9, 0))
+            # El turno reprogramado conserva su lugar
+            self.assertEqual(clinica.obtener_turnos()[0].obtener_fecha_hora(), datetime(2025, 12, 8, 15, 0))
+        
+        clinica.reprogramar_turno(primero.obtener_id(), datetime(2025, 12, 8, 14, 30))
+        clinica.cancelar_turno(turno.obtener_id())
+        almacen.compactar()
+        clinica, _ = self.reabrir()
+        self.verificar_estado(clinica)
+        self.assertEqual(len(clinica.obtener_turnos()), 2)
+        with self.assertRaises(TurnoNoEncontradoException):
+            clinica.obtener_turno(turno.obtener_id())
+    
+    def test_ids_de_turnos_cancelados_no_se_reutilizan(self):
+        """Test para verificar que el id del último turno cancelado no se reasigna, con o sin instantánea"""
+        for compactar in (False, True):
+            with self.subTest(compactar=compactar):
+                clinica, almacen = self.abrir_clinica()
+                if not clinica.obtener_pacientes():
+                    self.poblar(clinica)
+                ultimo = clinica.obtener_turnos()[-1]
+                clinica.cancelar_turno(ultimo.obtener_id())
+                if compactar:
+                    almacen.compactar()
+                clinica, _ = self.reabrir()
+                
+                nuevo = clinica.agendar_turno("12345678", "54321", "Pediatría",
+                                              datetime(2025, 12, 10, 9, 0))
+                self.assertGreater(nuevo.obtener_id(), ultimo.obtener_id())
+                self.almacenes.pop().cerrar()
+    
+    def test_linea_truncada_se_ignora(self):
+        """Test para verificar que una escritura incompleta no impide reiniciar"""
+        clinica, _ = self.abrir_clinica()
+        self.poblar(clinica)
+        self.almacenes.pop().cerrar()
+        segmento = sorted(glob.glob(os.path.join(self.directorio.name, "journal-*.log")))[-1]
+        with open(segmento, "a", encoding="utf-8") as archivo:
+            archivo.write('["p","999')
+        
+        clinica, _ = self.abrir_clinica()
+        self.verificar_estado(clinica)
+        self.assertEqual(len(clinica.obtener_pacientes()), 1)
+    
+    def test_turno_sin_duracion_de_version_anterior(self):
+        """Test para verificar que las líneas de turno sin duración se leen como de 30 minutos"""
+        clinica, _ = self.abrir_clinica()
+        self.poblar(clinica)
+        self.almacenes.pop().cerrar()
+        segmento = sorted(glob.glob(os.path.join(self.directorio.name, "journal-*.log")))[-1]
+        with open(segmento, "a", encoding="utf-8") as archivo:
+            archivo.write('["t", "12345678", "54321", "Pediatría", "2025-12-10T09:00:00"]\n')
+        
+        clinica, almacen = self.abrir_clinica()
+        turno = clinica.obtener_agenda("54321", datetime(2025, 12, 10))[0]
+        self.assertEqual(turno.obtener_duracion(), timedelta(minutes=30))
+        
+        # Recibe el id siguiente, también al compactar
+        self.assertEqual(turno.obtener_id(), 3)
+        clinica.cancelar_turno(3)
+        almacen.compactar()
+        clinica, _ = self.reabrir()
+        self.assertEqual(clinica.obtener_agenda("54321", datetime(2025, 12, 10)), [])
+
+if __name__ == '__main__':
+    unittest.main()
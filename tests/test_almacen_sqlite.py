@@ -0,0 +1,185 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from collections import Counter
+from datetime import datetime, timedelta
+from modelos import Clinica, Paciente, Medico, Especialidad
+from persistencia import AlmacenSQLite
+from excepciones import TurnoOcupadoException, TurnoNoEncontradoException
+
+class AlmacenConLecturas(AlmacenSQLite):
+    """Cuenta las lecturas de recetas diferidas"""
+
+    def __init__(self, ruta):
+        super().__init__(ruta)
+        self.lecturas = Counter()
+
+    def cargar_recetas(self, dni):
+        self.lecturas["por_dni"] += 1
+        return super().cargar_recetas(dni)
+
+    def cargar_todas_las_recetas(self):
+        self.lecturas["todas"] += 1
+        return super().cargar_todas_las_recetas()
+
+class TestAlmacenSQLite(unittest.TestCase):
+    
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.directorio = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self.directorio.name, "clinica.db")
+        self.almacenes = []
+    
+    def tearDown(self):
+        for almacen in self.almacenes:
+            almacen.cerrar()
+        self.directorio.cleanup()
+    
+    def abrir_clinica(self):
+        almacen = AlmacenSQLite(self.ruta)
+        self.almacenes.append(almacen)
+        return Clinica(almacen)
+    
+    def poblar(self, clinica):
+        clinica.agregar_paciente(Paciente("Juan Pérez", "12345678", "01/01/1990"))
+        medico = Medico("Dr. García", "54321", [Especialidad("Pediatría", ["lunes", "miércoles"])])
+        clinica.agregar_medico(medico)
+        medico.agregar_especialidad(Especialidad("Cardiología", ["martes"]))
+        clinica.agendar_turno("12345678", "54321", "Pediatría", datetime(2025, 12, 8, 14, 30))
+        clinica.agendar_turno("12345678", "54321", "Cardiología", datetime(2025, 12, 9, 10, 0),
+                              timedelta(minutes=45))
+        clinica.emitir_receta("12345678", "54321", ["Paracetamol", "Ibuprofeno"])
+    
+    def test_reabrir_recupera_estado(self):
+        """Test para verificar que la clínica se reconstruye desde el archivo"""
+        self.poblar(self.abrir_clinica())
+        self.almacenes.pop().cerrar()
+        
+        clinica = self.abrir_clinica()
+        self.assertEqual([p.obtener_dni() for p in clinica.obtener_pacientes()], ["12345678"])
+        medico = clinica.obtener_medico_por_matricula("54321")
+        self.assertEqual(
+            [e.obtener_especialidad() for e in medico.obtener_especialidades()],
+            ["Pediatría", "Cardiología"],
+        )
+        self.assertEqual(len(clinica.obtener_turnos()), 2)
+        
+        historia = clinica.obtener_historia_clinica_por_dni("12345678")
+        self.assertEqual([t.obtener_duracion() for t in historia.obtener_turnos()],
+                         [timedelta(minutes=30), timedelta(minutes=45)])
+        recetas = historia.obtener_recetas()
+        self.assertEqual(len(recetas), 1)
+        self.assertEqual(recetas[0].obtener_medicamentos(), ["Paracetamol", "Ibuprofeno"])
+    
+    def test_validaciones_tras_reabrir(self):
+        """Test para verificar que los turnos recuperados siguen ocupando su horario"""
+        self.poblar(self.abrir_clinica())
+        self.almacenes.pop().cerrar()
+        
+        clinica = self.abrir_clinica()
+        with self.assertRaises(TurnoOcupadoException):
+            clinica.agendar_turno("12345678", "54321", "Pediatría", datetime(2025, 12, 8, 14, 30))
+    
+    def test_cancelar_y_reprogramar_tras_reabrir(self):
+        """Test para verificar que cancelaciones y reprogramaciones persisten con ids estables"""
+        clinica = self.abrir_clinica()
+        self.poblar(clinica)
+        primero, segundo = clinica.obtener_turnos()
+        clinica.cancelar_turno(primero.obtener_id())
+        clinica.reprogramar_turno(segundo.obtener_id(), datetime(2025, 12, 16, 10, 0))
+        self.almacenes.pop().cerrar()
+        
+        clinica = self.abrir_clinica()
+        turno = clinica.obtener_turno(segundo.obtener_id())
+        self.assertEqual(turno.obtener_fecha_hora(), datetime(2025, 12, 16, 10, 0))
+        self.assertEqual(turno.obtener_duracion(), timedelta(minutes=45))
+        self.assertEqual(len(clinica.obtener_turnos()), 1)
+        nuevo = clinica.agendar_turno("12345678", "54321", "Pediatría", datetime(2025, 12, 8, 14, 30))
+        self.assertGreater(nuevo.obtener_id(), segundo.obtener_id())
+    
+    def test_ids_de_turnos_cancelados_no_se_reutilizan(self):
+        """Test para verificar que tras reiniciar no se reasigna el id del último turno cancelado"""
+        clinica = self.abrir_clinica()
+        self.poblar(clinica)
+        _, segundo = clinica.obtener_turnos()
+        clinica.cancelar_turno(segundo.obtener_id())
+        self.almacenes.pop().cerrar()
+        
+        clinica = self.abrir_clinica()
+        clinica.agregar_paciente(Paciente("Ana Gómez", "87654321", "02/02/1992"))
+        nuevo = clinica.agendar_turno("87654321", "54321", "Pediatría", datetime(2025, 12, 10, 9, 0))
+        self.assertGreater(nuevo.obtener_id(), segundo.obtener_id())
+        with self.assertRaises(TurnoNoEncontradoException):
+            clinica.cancelar_turno(segundo.obtener_id())
+    
+    def test_recetas_diferidas_conservan_orden(self):
+        """Test para verificar recetas emitidas antes de leer la historia diferida"""
+        self.poblar(self.abrir_clinica())
+        self.almacenes.pop().cerrar()
+        
+        clinica = self.abrir_clinica()
+        clinica.emitir_receta("12345678", "54321", ["Amoxicilina"])
+        recetas = clinica.obtener_historia_clinica_por_dni("12345678").obtener_recetas()
+        self.assertEqual(
+            [r.obtener_medicamentos() for r in recetas],
+            [["Paracetamol", "Ibuprofeno"], ["Amoxicilina"]],
+        )
+        self.assertEqual(len(clinica.obtener_historia_clinica_por_dni("12345678").obtener_recetas()), 2)
+
+    def test_consulta_por_medicamento_lee_recetas_diferidas(self):
+        """Test para verificar que el índice por medicamento incluye recetas aún en disco"""
+        self.poblar(self.abrir_clinica())
+        self.almacenes.pop().cerrar()
+        
+        clinica = self.abrir_clinica()
+        recetas = clinica.obtener_recetas_por_medicamento("ibuprofeno")
+        self.assertEqual(len(recetas), 1)
+        self.assertEqual(len(clinica.obtener_historia_clinica_por_dni("12345678").obtener_recetas()), 1)
+    
+    def test_consulta_por_medicamento_lee_todas_las_recetas_de_una_vez(self):
+        """Test para verificar que la primera consulta por medicamento no hace una lectura por paciente"""
+        clinica = self.abrir_clinica()
+        self.poblar(clinica)
+        for i in range(20):
+            dni = f"{10000000 + i}"
+            clinica.agregar_paciente(Paciente(f"Paciente {i}", dni, "01/01/1990"))
+            clinica.emitir_receta(dni, "54321", ["Ibuprofeno"])
+        self.almacenes.pop().cerrar()
+        
+        almacen = AlmacenConLecturas(self.ruta)
+        self.almacenes.append(almacen)
+        clinica = Clinica(almacen)
+        clinica.emitir_receta("10000000", "54321", ["Amoxicilina"])
+        self.assertEqual(len(clinica.obtener_recetas_por_medicamento("ibuprofeno")), 21)
+        self.assertEqual(clinica.obtener_medicamentos(), ["Amoxicilina", "Ibuprofeno", "Paracetamol"])
+        self.assertEqual(almacen.lecturas, Counter(por_dni=1, todas=1))
+        recetas = clinica.obtener_historia_clinica_por_dni("10000000").obtener_recetas()
+        self.assertEqual([r.obtener_medicamentos() for r in recetas], [["Ibuprofeno"], ["Amoxicilina"]])
+    
+    def test_migrar_base_sin_duraciones(self):
+        """Test para abrir una base creada antes de que los turnos tuvieran duración"""
+        conexion = sqlite3.connect(self.ruta)
+        conexion.executescript("""
+            CREATE TABLE pacientes (dni TEXT PRIMARY KEY, nombre TEXT NOT NULL,
+                                    fecha_nacimiento TEXT NOT NULL);
+            CREATE TABLE medicos (matricula TEXT PRIMARY KEY, nombre TEXT NOT NULL);
+            CREATE TABLE turnos (id INTEGER PRIMARY KEY, dni TEXT NOT NULL, matricula TEXT NOT NULL,
+                                 especialidad TEXT NOT NULL, fecha_hora TEXT NOT NULL);
+            INSERT INTO pacientes VALUES ('12345678', 'Juan Pérez', '01/01/1990');
+            INSERT INTO medicos VALUES ('54321', 'Dr. García');
+            INSERT INTO turnos (dni, matricula, especialidad, fecha_hora)
+                VALUES ('12345678', '54321', 'Pediatría', '2025-12-08T14:30:00');
+        """)
+        conexion.commit()
+        conexion.close()
+        
+        clinica = self.abrir_clinica()
+        self.assertEqual(clinica.obtener_turnos()[0].obtener_duracion(), timedelta(minutes=30))
+        clinica.obtener_medico_por_matricula("54321").agregar_especialidad(
+            Especialidad("Pediatría", ["lunes"]))
+        with self.assertRaises(TurnoOcupadoException):
+            clinica.agendar_turno("12345678", "54321", "Pediatría", datetime(2025, 12, 8, 14, 45))
+
+if __name__ == '__main__':
+    unittest.main()
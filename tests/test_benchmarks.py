@@ -0,0 +1,36 @@
+import unittest
+from modelos import Clinica
+from benchmarks.generador import generar_datos
+from benchmarks.suite import medir_escala, poblar, agendar, emitir
+
+class TestBenchmarks(unittest.TestCase):
+    
+    def test_generador_deterministico(self):
+        """Test para verificar que la misma semilla genera los mismos datos"""
+        a = generar_datos(50, 5, 200, 20, semilla=7)
+        b = generar_datos(50, 5, 200, 20, semilla=7)
+        self.assertEqual([str(p) for p in a.pacientes], [str(p) for p in b.pacientes])
+        self.assertEqual([str(m) for m in a.medicos], [str(m) for m in b.medicos])
+        self.assertEqual(a.turnos, b.turnos)
+        self.assertEqual(a.recetas, b.recetas)
+        self.assertNotEqual(a.turnos, generar_datos(50, 5, 200, 20, semilla=8).turnos)
+    
+    def test_datos_generados_son_validos(self):
+        """Test para verificar que todos los turnos y recetas generados se aceptan"""
+        datos = generar_datos(30, 4, 300, 30)
+        clinica = Clinica()
+        poblar(clinica, datos)
+        agendar(clinica, datos)
+        emitir(clinica, datos)
+        self.assertEqual(len(clinica.obtener_turnos()), 300)
+    
+    def test_medir_escala(self):
+        """Test para verificar que la suite mide cada operación"""
+        resultados = medir_escala("mini", 20, 3, 50, 10)
+        operaciones = {r.operacion: r.a_dict() for r in resultados}
+        self.assertEqual(operaciones["agendar_turno"]["operaciones"], 50)
+        self.assertIn("carga_sqlite", operaciones)
+        self.assertIn("carga_journal", operaciones)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+from datetime import datetime
+from modelos import CatalogoMedicamentos, Receta, Paciente, Medico, Especialidad
+
+class TestCatalogoMedicamentos(unittest.TestCase):
+    
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.catalogo = CatalogoMedicamentos()
+        self.paciente = Paciente("Juan Pérez", "12345678", "01/01/1990")
+        self.medico = Medico("Dr. García", "54321", [Especialidad("Pediatría", ["lunes"])])
+    
+    def crear_receta(self, medicamentos, dia):
+        return Receta(self.paciente, self.medico, medicamentos, datetime(2025, 12, dia, 10, 0))
+    
+    def test_registrar_normaliza_nombres(self):
+        """Test para verificar que distintas grafías comparten el mismo nombre canónico"""
+        canonico = self.catalogo.registrar("Ácido Fólico")
+        self.assertEqual(canonico, "Ácido Fólico")
+        self.assertIs(self.catalogo.registrar("  acido   folico "), canonico)
+        self.assertIn("ÁCIDO FÓLICO", self.catalogo)
+        self.assertEqual(len(self.catalogo), 1)
+        with self.assertRaises(ValueError):
+            self.catalogo.registrar("   ")
+    
+    def test_obtener_recetas_por_fecha(self):
+        """Test para consultar recetas de un medicamento en un rango de fechas"""
+        tardia = self.crear_receta(["Paracetamol"], 20)
+        temprana = self.crear_receta(["paracetamol", "Ibuprofeno"], 5)
+        media = self.crear_receta(["Ibuprofeno"], 10)
+        for receta in (tardia, temprana, media):
+            self.catalogo.indexar_receta(receta)
+        
+        self.assertEqual(self.catalogo.obtener_recetas("PARACETAMOL"), [temprana, tardia])
+        self.assertEqual(
+            self.catalogo.obtener_recetas("ibuprofeno", datetime(2025, 12, 6), datetime(2025, 12, 31)),
+            [media],
+        )
+        self.assertEqual(self.catalogo.obtener_recetas("Amoxicilina"), [])
+        self.assertEqual(self.catalogo.nombres(), ["Ibuprofeno", "Paracetamol"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,11 @@
 import unittest
-from datetime import datetime
+from datetime import datetime, timedelta
 from modelos import Clinica, Paciente, Medico, Especialidad
 from excepciones import (
     PacienteNoEncontradoException,
     MedicoNoDisponibleException,
     TurnoOcupadoException,
+    TurnoNoEncontradoException,
     RecetaInvalidaException
 )
 
@@ -31,6 +32,20 @@ class TestClinica(unittest.TestCase):
             self.clinica.agregar_paciente(self.paciente)
         self.assertIn("Ya existe", str(context.exception))
     
+    def test_obtener_pacientes_paginado(self):
+        """Test para listar pacientes con vista de solo lectura y paginación"""
+        for i in range(5):
+            self.clinica.agregar_paciente(Paciente(f"Paciente {i}", f"{10000000 + i}", "01/01/1990"))
+        
+        pacientes = self.clinica.obtener_pacientes()
+        self.assertEqual(len(pacientes), 5)
+        with self.assertRaises(TypeError):
+            pacientes[0] = self.paciente
+        
+        pagina = self.clinica.obtener_pacientes(offset=3, limite=10)
+        self.assertEqual([p.obtener_dni() for p in pagina], ["10000003", "10000004"])
+        self.assertEqual(len(self.clinica.obtener_pacientes(limite=2)), 2)
+    
     def test_agregar_medico_exitoso(self):
         """Test para agregar médico exitosamente"""
         self.clinica.agregar_medico(self.medico)
@@ -99,6 +114,305 @@ class TestClinica(unittest.TestCase):
         with self.assertRaises(TurnoOcupadoException):
             self.clinica.agendar_turno("87654321", "54321", "Pediatría", fecha)
     
+    def test_agendar_turno_superpuesto(self):
+        """Test para rechazar turnos que se superponen en parte con otro del médico"""
+        self.clinica.agregar_paciente(self.paciente)
+        self.clinica.agregar_medico(self.medico)
+        self.clinica.agendar_turno("12345678", "54321", "Pediatría", datetime(2025, 12, 8, 10, 0))
+        
+        with self.assertRaises(TurnoOcupadoException) as context:
+            self.clinica.agendar_turno("12345678", "54321", "Pediatría", datetime(2025, 12, 8, 10, 5))
+        self.assertIn("10:00 a 10:30", str(context.exception))
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_turno("12345678", "54321", "Pediatría", datetime(2025, 12, 8, 9, 0),
+                                       timedelta(hours=1, minutes=1))
+        
+        # Turnos contiguos no se superponen
+        self.clinica.agendar_turno("12345678", "54321", "Pediatría", datetime(2025, 12, 8, 9, 0),
+                                   timedelta(hours=1))
+        self.clinica.agendar_turno("12345678", "54321", "Pediatría", datetime(2025, 12, 8, 10, 30))
+        self.assertEqual(len(self.clinica.obtener_agenda("54321")), 3)
+    
+    def test_agendar_turno_paciente_ocupado(self):
+        """Test para rechazar dos turnos simultáneos del mismo paciente con médicos distintos"""
+        medico2 = Medico("Dra. López", "11111", [Especialidad("Cardiología", ["lunes"])])
+        self.clinica.agregar_paciente(self.paciente)
+        self.clinica.agregar_medico(self.medico)
+        self.clinica.agregar_medico(medico2)
+        self.clinica.agendar_turno("12345678", "54321", "Pediatría", datetime(2025, 12, 8, 10, 0))
+        
+        with self.assertRaises(TurnoOcupadoException) as context:
+            self.clinica.agendar_turno("12345678", "11111", "Cardiología", datetime(2025, 12, 8, 10, 15))
+        self.assertIn("10:00 a 10:30 con Dr. García", str(context.exception))
+        self.assertEqual(self.clinica.obtener_agenda("11111"), [])
+        
+        # Al terminar el primer turno, el paciente queda libre
+        self.clinica.agendar_turno("12345678", "11111", "Cardiología", datetime(2025, 12, 8, 10, 30))
+        self.assertEqual(len(self.clinica.obtener_turnos()), 2)
+    
+    def test_obtener_proximos_turnos(self):
+        """Test para consultar los turnos de un paciente en orden cronológico"""
+        self.clinica.agregar_paciente(self.paciente)
+        self.clinica.agregar_medico(self.medico)
+        self.assertEqual(self.clinica.obtener_proximos_turnos("12345678"), [])
+        for fecha in (datetime(2025, 12, 10, 9), datetime(2025, 12, 8, 9), datetime(2025, 12, 15, 9)):
+            self.clinica.agendar_turno("12345678", "54321", "Pediatría", fecha)
+        
+        proximos = self.clinica.obtener_proximos_turnos("12345678", desde=datetime(2025, 12, 9), limite=1)
+        self.assertEqual([t.obtener_fecha_hora() for t in proximos], [datetime(2025, 12, 10, 9)])
+        semana = self.clinica.obtener_proximos_turnos("12345678", datetime(2025, 12, 8), datetime(2025, 12, 15))
+        self.assertEqual([t.obtener_fecha_hora().day for t in semana], [8, 10])
+        with self.assertRaises(PacienteNoEncontradoException):
+            self.clinica.obtener_proximos_turnos("99999999")
+    
+    def test_cancelar_turno(self):
+        """Test para cancelar un turno y liberar su horario en todos los índices"""
+        self.clinica.agregar_paciente(self.paciente)
+        self.clinica.agregar_medico(self.medico)
+        fecha = datetime(2025, 12, 8, 10, 0)
+        turno = self.clinica.agendar_turno("12345678", "54321", "Pediatría", fecha)
+        otro = self.clinica.agendar_turno("12345678", "54321", "Pediatría", datetime(2025, 12, 10, 9))
+        self.assertEqual(len(self.clinica.obtener_turnos()), 2)
+        
+        self.assertIs(self.clinica.cancelar_turno(turno.obtener_id()), turno)
+        self.assertEqual(list(self.clinica.obtener_turnos()), [otro])
+        self.assertEqual(self.clinica.obtener_agenda("54321"), [otro])
+        self.assertEqual(self.clinica.obtener_proximos_turnos("12345678", datetime(2025, 12, 1)), [otro])
+        self.assertEqual(list(self.clinica.obtener_historia_clinica_por_dni("12345678").obtener_turnos()),
+                         [otro])
+        self.assertEqual(self.clinica.buscar_proximo_turno("Pediatría", fecha, timedelta(minutes=30), 1),
+                         [(fecha, "54321")])
+        with self.assertRaises(TurnoNoEncontradoException):
+            self.clinica.cancelar_turno(turno.obtener_id())
+        
+        # El horario liberado se puede volver a agendar, con un id nuevo
+        nuevo = self.clinica.agendar_turno("12345678", "54321", "Pediatría", fecha)
+        self.assertNotIn(nuevo.obtener_id(), (turno.obtener_id(), otro.obtener_id()))
+        self.assertIs(self.clinica.obtener_turno(nuevo.obtener_id()), nuevo)
+    
+    def test_reprogramar_turno(self):
+        """Test para mover un turno conservando su id"""
+        self.clinica.agregar_paciente(self.paciente)
+        self.clinica.agregar_medico(self.medico)
+        turno = self.clinica.agendar_turno("12345678", "54321", "Pediatría", datetime(2025, 12, 8, 10, 0))
+        otro = self.clinica.agendar_turno("12345678", "54321", "Pediatría", datetime(2025, 12, 8, 11, 0))
+        
+        # Puede superponerse con su propio horario anterior
+        movido = self.clinica.reprogramar_turno(turno.obtener_id(), datetime(2025, 12, 8, 10, 15))
+        self.assertEqual(movido.obtener_id(), turno.obtener_id())
+        self.assertEqual(movido.obtener_duracion(), timedelta(minutes=30))
+        self.assertEqual([t.obtener_fecha_hora() for t in self.clinica.obtener_agenda("54321")],
+                         [datetime(2025, 12, 8, 10, 15), datetime(2025, 12, 8, 11, 0)])
+        # Conserva su lugar en el listado y en la historia clínica
+        self.assertEqual(list(self.clinica.obtener_turnos()), [movido, otro])
+        self.assertEqual(list(self.clinica.obtener_historia_clinica_por_dni("12345678").obtener_turnos()),
+                         [movido, otro])
+        
+        # Un horario inválido deja el turno como estaba
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.reprogramar_turno(turno.obtener_id(), datetime(2025, 12, 8, 10, 15),
+                                           timedelta(hours=1))
+        with self.assertRaises(MedicoNoDisponibleException):
+            self.clinica.reprogramar_turno(turno.obtener_id(), datetime(2025, 12, 9, 10, 0))
+        self.assertIs(self.clinica.obtener_turno(turno.obtener_id()), movido)
+        self.assertEqual(len(self.clinica.obtener_historia_clinica_por_dni("12345678").obtener_turnos()), 2)
+        with self.assertRaises(TurnoNoEncontradoException):
+            self.clinica.reprogramar_turno(999, datetime(2025, 12, 8, 12, 0))
+    
+    def test_lista_espera_ocupa_horario_cancelado(self):
+        """Test para asignar automáticamente un horario cancelado a la lista de espera"""
+        self.clinica = Clinica(reloj=lambda: datetime(2025, 12, 1, 9, 0))
+        medico2 = Medico("Dra. López", "11111", [Especialidad("Pediatría", ["lunes"])])
+        self.clinica.agregar_paciente(self.paciente)
+        self.clinica.agregar_medico(self.medico)
+        self.clinica.agregar_medico(medico2)
+        for dni in ("1", "2", "3"):
+            self.clinica.agregar_paciente(Paciente(f"Paciente {dni}", dni, "01/01/2000"))
+        fecha = datetime(2025, 12, 8, 10, 0)
+        turno = self.clinica.agendar_turno("12345678", "54321", "Pediatría", fecha)
+        
+        # "1" pide otro médico, "2" no puede a esa hora y "3" es el siguiente en orden
+        self.clinica.agregar_a_lista_espera("1", "Pediatría", "11111", prioridad=9)
+        tarde = self.clinica.agregar_a_lista_espera("2", "Pediatría", prioridad=5,
+                                                     desde=datetime(2025, 12, 8, 15, 0))
+        elegida = self.clinica.agregar_a_lista_espera("3", "Pediatría")
+        self.clinica.cancelar_turno(turno.obtener_id())
+        
+        asignado = elegida.obtener_turno()
+        self.assertEqual((asignado.obtener_paciente().obtener_dni(), asignado.obtener_fecha_hora()),
+                         ("3", fecha))
+        self.assertEqual(self.clinica.obtener_agenda("54321"), [asignado])
+        self.assertEqual([s.obtener_dni() for s in self.clinica.obtener_lista_espera()], ["1", "2"])
+        self.assertIs(self.clinica.retirar_de_lista_espera(tarde.obtener_id()), tarde)
+        
+        with self.assertRaises(PacienteNoEncontradoException):
+            self.clinica.agregar_a_lista_espera("99999999", "Pediatría")
+        with self.assertRaises(MedicoNoDisponibleException):
+            self.clinica.agregar_a_lista_espera("1", "Cardiología")
+        with self.assertRaises(MedicoNoDisponibleException):
+            self.clinica.agregar_a_lista_espera("1", "Cardiología", "54321")
+    
+    def test_lista_espera_ignora_horarios_pasados(self):
+        """Test para verificar que un horario cancelado que ya pasó no se asigna a la lista de espera"""
+        self.clinica = Clinica(reloj=lambda: datetime(2025, 12, 8, 12, 0))
+        self.clinica.agregar_paciente(self.paciente)
+        self.clinica.agregar_paciente(Paciente("Ana Gómez", "87654321", "02/02/1992"))
+        self.clinica.agregar_medico(self.medico)
+        pasado = self.clinica.agendar_turno("12345678", "54321", "Pediatría", datetime(2025, 12, 8, 9, 0))
+        futuro = self.clinica.agendar_turno("12345678", "54321", "Pediatría", datetime(2025, 12, 8, 15, 0))
+        solicitud = self.clinica.agregar_a_lista_espera("87654321", "Pediatría")
+        
+        self.clinica.cancelar_turno(pasado.obtener_id())
+        self.assertEqual(solicitud.obtener_estado(), "pendiente")
+        self.assertEqual(self.clinica.obtener_agenda("54321"), [futuro])
+        
+        self.clinica.cancelar_turno(futuro.obtener_id())
+        self.assertEqual(solicitud.obtener_turno().obtener_fecha_hora(), datetime(2025, 12, 8, 15, 0))
+    
+    def test_obtener_huecos_libres(self):
+        """Test para consultar los intervalos libres de un médico"""
+        self.clinica.agregar_paciente(self.paciente)
+        self.clinica.agregar_medico(self.medico)
+        self.clinica.agendar_turno("12345678", "54321", "Pediatría", datetime(2025, 12, 8, 9, 0),
+                                   timedelta(minutes=45))
+        
+        huecos = self.clinica.obtener_huecos_libres("54321", datetime(2025, 12, 8, 8), datetime(2025, 12, 8, 12))
+        self.assertEqual(huecos, [
+            (datetime(2025, 12, 8, 8, 0), datetime(2025, 12, 8, 9, 0)),
+            (datetime(2025, 12, 8, 9, 45), datetime(2025, 12, 8, 12, 0)),
+        ])
+        with self.assertRaises(MedicoNoDisponibleException):
+            self.clinica.obtener_huecos_libres("99999", datetime(2025, 12, 8), datetime(2025, 12, 9))
+    
+    def test_validar_turno_no_duplicado(self):
+        """Test para verificar la detección de turnos duplicados por médico y horario"""
+        self.clinica.agregar_paciente(self.paciente)
+        self.clinica.agregar_medico(self.medico)
+        
+        fecha = datetime(2025, 12, 8, 14, 30)
+        self.assertTrue(self.clinica.validar_turno_no_duplicado("54321", fecha))
+        self.clinica.agendar_turno("12345678", "54321", "Pediatría", fecha)
+        self.assertFalse(self.clinica.validar_turno_no_duplicado("54321", fecha))
+        self.assertTrue(self.clinica.validar_turno_no_duplicado("99999", fecha))
+        self.assertTrue(self.clinica.validar_turno_no_duplicado("54321", datetime(2025, 12, 8, 15, 0)))
+    
+    def test_obtener_agenda_por_rango(self):
+        """Test para obtener la agenda de un médico en un rango de fechas"""
+        self.clinica.agregar_paciente(self.paciente)
+        self.clinica.agregar_medico(self.medico)
+        
+        self.clinica.agendar_turno("12345678", "54321", "Pediatría", datetime(2025, 12, 10, 9, 0))
+        self.clinica.agendar_turno("12345678", "54321", "Pediatría", datetime(2025, 12, 8, 14, 30))
+        self.clinica.agendar_turno("12345678", "54321", "Pediatría", datetime(2025, 12, 15, 9, 0))
+        
+        semana = self.clinica.obtener_agenda("54321", datetime(2025, 12, 8), datetime(2025, 12, 15))
+        self.assertEqual(
+            [t.obtener_fecha_hora() for t in semana],
+            [datetime(2025, 12, 8, 14, 30), datetime(2025, 12, 10, 9, 0)],
+        )
+    
+    def test_obtener_agenda_medico_no_existe(self):
+        """Test para verificar error al pedir la agenda de un médico inexistente"""
+        with self.assertRaises(MedicoNoDisponibleException):
+            self.clinica.obtener_agenda("99999", datetime(2025, 12, 8), datetime(2025, 12, 15))
+    
+    def test_agendar_turnos_lote(self):
+        """Test para agendar un lote con resultados por solicitud"""
+        self.clinica.agregar_paciente(self.paciente)
+        self.clinica.agregar_medico(self.medico)
+        
+        lunes = datetime(2025, 12, 8, 14, 30)
+        resultados = self.clinica.agendar_turnos_lote([
+            ("12345678", "54321", "Pediatría", lunes),
+            ("12345678", "54321", "Pediatría", lunes),                       # duplicado en el lote
+            ("99999999", "54321", "Pediatría", datetime(2025, 12, 8, 15)),  # paciente inexistente
+            ("12345678", "54321", "Pediatría", datetime(2025, 12, 9, 15)),  # martes no atiende
+            ("12345678", "54321"),                                          # solicitud mal formada
+            ("12345678", "54321", "Pediatría", datetime(2025, 12, 10, 9)),
+        ])
+        
+        self.assertEqual([r["ok"] for r in resultados], [True, False, False, False, False, True])
+        self.assertIs(resultados[1]["excepcion"], TurnoOcupadoException)
+        self.assertIs(resultados[2]["excepcion"], PacienteNoEncontradoException)
+        self.assertIs(resultados[3]["excepcion"], MedicoNoDisponibleException)
+        self.assertIs(resultados[4]["excepcion"], ValueError)
+        self.assertTrue(resultados[2]["mensaje"])
+        self.assertEqual(len(self.clinica.obtener_turnos()), 2)
+    
+    def test_buscar_proximo_turno_entre_medicos(self):
+        """Test para buscar los próximos horarios libres combinando varios médicos"""
+        self.clinica.agregar_paciente(self.paciente)
+        self.clinica.agregar_medico(self.medico)
+        self.clinica.agregar_medico(Medico("Dra. López", "11111", [Especialidad("Pediatría", ["lunes"])]))
+        self.clinica.agregar_medico(Medico("Dr. Ruiz", "22222", [Especialidad("Cardiología", ["lunes"])]))
+        self.clinica.agendar_turno("12345678", "54321", "Pediatría", datetime(2025, 12, 8, 8, 0))
+        
+        libres = self.clinica.buscar_proximo_turno(
+            "Pediatría", datetime(2025, 12, 8, 7, 0), timedelta(minutes=30), n=3
+        )
+        self.assertEqual(libres, [
+            (datetime(2025, 12, 8, 8, 0), "11111"),
+            (datetime(2025, 12, 8, 8, 30), "11111"),
+            (datetime(2025, 12, 8, 8, 30), "54321"),
+        ])
+    
+    def test_buscar_proximo_turno_respeta_duraciones(self):
+        """Test para verificar que no se ofrecen horarios pisados por un turno largo"""
+        self.clinica.agregar_paciente(self.paciente)
+        self.clinica.agregar_medico(self.medico)
+        self.clinica.agendar_turno("12345678", "54321", "Pediatría", datetime(2025, 12, 8, 8, 15),
+                                   timedelta(minutes=50))
+        
+        libres = self.clinica.buscar_proximo_turno(
+            "Pediatría", datetime(2025, 12, 8, 7, 0), timedelta(minutes=30), n=2
+        )
+        self.assertEqual(libres, [(datetime(2025, 12, 8, 9, 30), "54321"),
+                                  (datetime(2025, 12, 8, 10, 0), "54321")])
+    
+    def test_buscar_proximo_turno_salta_dias_sin_atencion(self):
+        """Test para verificar que solo se ofrecen los días en que se atiende la especialidad"""
+        self.clinica.agregar_medico(self.medico)
+        
+        # Desde el lunes a las 17:45: el siguiente horario es el miércoles a la mañana
+        libres = self.clinica.buscar_proximo_turno(
+            "Pediatría", datetime(2025, 12, 8, 17, 45), timedelta(minutes=30), n=1
+        )
+        self.assertEqual(libres, [(datetime(2025, 12, 10, 8, 0), "54321")])
+        self.assertEqual(
+            self.clinica.buscar_proximo_turno("Dermatología", datetime(2025, 12, 8), timedelta(minutes=30)),
+            [],
+        )
+    
+    def test_buscar_proximo_turno_duracion_invalida(self):
+        """Test para verificar error con una duración no positiva"""
+        with self.assertRaises(ValueError):
+            self.clinica.buscar_proximo_turno("Pediatría", datetime(2025, 12, 8), timedelta(0))
+    
+    def test_obtener_medicos_por_especialidad(self):
+        """Test para consultar qué médicos atienden una especialidad y día"""
+        cardiologo = Medico("Dr. Ruiz", "22222", [Especialidad("Cardiología", ["martes"])])
+        self.clinica.agregar_medico(self.medico)
+        self.clinica.agregar_medico(cardiologo)
+        
+        self.assertEqual(
+            [m.obtener_matricula() for m in self.clinica.obtener_medicos_por_especialidad("Pediatría")],
+            ["54321"],
+        )
+        self.assertEqual(self.clinica.obtener_medicos_por_especialidad("Cardiología", "lunes"), [])
+        
+        # Una especialidad agregada directamente al médico también se indexa
+        self.medico.agregar_especialidad(Especialidad("Cardiología", ["lunes", "martes"]))
+        self.assertEqual(
+            [m.obtener_matricula() for m in self.clinica.obtener_medicos_por_especialidad("Cardiología", "martes")],
+            ["22222", "54321"],
+        )
+        self.assertEqual(
+            [m.obtener_matricula() for m in self.clinica.obtener_medicos_por_especialidad("Cardiología", "Lunes")],
+            ["54321"],
+        )
+        with self.assertRaises(ValueError):
+            self.clinica.obtener_medicos_por_especialidad("Cardiología", "feriado")
+    
     def test_emitir_receta_exitoso(self):
         """Test para emitir receta exitosamente"""
         self.clinica.agregar_paciente(self.paciente)
@@ -111,6 +425,41 @@ class TestClinica(unittest.TestCase):
         recetas = historia.obtener_recetas()
         self.assertEqual(len(recetas), 1)
     
+    def test_buscar_pacientes_y_medicos_por_nombre(self):
+        """Test para buscar pacientes y médicos por parte del nombre"""
+        self.clinica.agregar_paciente(self.paciente)
+        self.clinica.agregar_paciente(Paciente("Juana Pereyra", "87654321", "15/05/1985"))
+        self.clinica.agregar_medico(self.medico)
+        
+        self.assertEqual([p.obtener_dni() for p in self.clinica.buscar_pacientes("PER")],
+                         ["12345678", "87654321"])
+        self.assertEqual([p.obtener_dni() for p in self.clinica.buscar_pacientes("perez juan")],
+                         ["12345678"])
+        self.assertEqual(len(self.clinica.buscar_pacientes("per", limite=1)), 1)
+        self.assertEqual(self.clinica.buscar_medicos("garcia"), [self.medico])
+        self.assertEqual(self.clinica.buscar_medicos("López"), [])
+    
+    def test_consultar_recetas_por_medicamento(self):
+        """Test para consultar recetas y pacientes por medicamento"""
+        paciente2 = Paciente("María García", "87654321", "15/05/1985")
+        self.clinica.agregar_paciente(self.paciente)
+        self.clinica.agregar_paciente(paciente2)
+        self.clinica.agregar_medico(self.medico)
+        
+        self.clinica.emitir_receta("12345678", "54321", ["Paracetamol", "Ibuprofeno"])
+        self.clinica.emitir_receta("87654321", "54321", ["paracetamol"])
+        self.clinica.emitir_receta("12345678", "54321", ["PARACETAMOL "])
+        
+        recetas = self.clinica.obtener_recetas_por_medicamento("Paracetamol")
+        self.assertEqual(len(recetas), 3)
+        self.assertEqual(recetas[1].obtener_medicamentos(), ["Paracetamol"])
+        self.assertEqual(
+            [p.obtener_dni() for p in self.clinica.obtener_pacientes_por_medicamento("paracetamol")],
+            ["12345678", "87654321"],
+        )
+        self.assertEqual(self.clinica.obtener_recetas_por_medicamento("Paracetamol", hasta=datetime(2000, 1, 1)), [])
+        self.assertEqual(self.clinica.obtener_medicamentos(), ["Ibuprofeno", "Paracetamol"])
+    
     def test_emitir_receta_sin_medicamentos(self):
         """Test para verificar error al emitir receta sin medicamentos"""
         self.clinica.agregar_paciente(self.paciente)
@@ -139,6 +488,14 @@ class TestClinica(unittest.TestCase):
         self.assertEqual(self.clinica.obtener_dia_semana_en_espanol(fecha_lunes), "lunes")
         self.assertEqual(self.clinica.obtener_dia_semana_en_espanol(fecha_martes), "martes")
         self.assertEqual(self.clinica.obtener_dia_semana_en_espanol(fecha_domingo), "domingo")
+    
+    def test_validar_especialidad_en_dia(self):
+        """Test para verificar especialidad y día con y sin tilde"""
+        self.assertTrue(self.clinica.validar_especialidad_en_dia(self.medico, "Pediatría", "miercoles"))
+        self.assertTrue(self.clinica.validar_especialidad_en_dia(self.medico, "Pediatría", "Lunes"))
+        self.assertFalse(self.clinica.validar_especialidad_en_dia(self.medico, "Pediatría", "martes"))
+        self.assertFalse(self.clinica.validar_especialidad_en_dia(self.medico, "Cardiología", "lunes"))
+        self.assertFalse(self.clinica.validar_especialidad_en_dia(self.medico, "Pediatría", "feriado"))
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,143 @@
+import unittest
+from datetime import datetime
+from modelos import Clinica
+from servicio import ejecutar_comando
+
+class TestComandos(unittest.TestCase):
+    
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        # Las fechas de los comandos son de diciembre de 2025: el reloj las deja en el futuro
+        self.clinica = Clinica(reloj=lambda: datetime(2025, 12, 1))
+        ejecutar_comando(self.clinica, {"op": "agregar_paciente", "args": {
+            "nombre": "Juan Pérez", "dni": "12345678", "fecha_nacimiento": "01/01/1990"}})
+        ejecutar_comando(self.clinica, {"op": "agregar_medico", "args": {
+            "nombre": "Dr. García", "matricula": "54321",
+            "especialidades": [{"tipo": "Pediatría", "dias": ["lunes", "miércoles"]}]}})
+    
+    def test_agendar_y_consultar_historia(self):
+        """Test para agendar un turno y leer la historia serializada"""
+        respuesta = ejecutar_comando(self.clinica, {"id": 7, "op": "agendar_turno", "args": {
+            "dni": "12345678", "matricula": "54321", "especialidad": "Pediatría",
+            "fecha_hora": "2025-12-08T14:30"}})
+        self.assertEqual(respuesta["id"], 7)
+        self.assertEqual(respuesta["resultado"]["id_turno"], 1)
+        
+        ejecutar_comando(self.clinica, {"op": "emitir_receta", "args": {
+            "dni": "12345678", "matricula": "54321", "medicamentos": ["Paracetamol"]}})
+        historia = ejecutar_comando(self.clinica, {"op": "obtener_historia_clinica",
+                                                   "args": {"dni": "12345678"}})["resultado"]
+        self.assertEqual(historia["turnos"][0]["fecha_hora"], "2025-12-08T14:30:00")
+        self.assertEqual(historia["turnos"][0]["duracion_minutos"], 30)
+        self.assertEqual(historia["recetas"][0]["medicamentos"], ["Paracetamol"])
+    
+    def test_errores_se_informan(self):
+        """Test para verificar que los errores se devuelven en lugar de lanzarse"""
+        respuesta = ejecutar_comando(self.clinica, {"op": "agendar_turno", "args": {
+            "dni": "99999999", "matricula": "54321", "especialidad": "Pediatría",
+            "fecha_hora": "2025-12-08T14:30"}})
+        self.assertFalse(respuesta["ok"])
+        self.assertEqual(respuesta["error"], "PacienteNoEncontradoException")
+        
+        self.assertEqual(ejecutar_comando(self.clinica, {"op": "inexistente"})["error"], "ValueError")
+        self.assertEqual(ejecutar_comando(self.clinica, [1, 2])["error"], "ValueError")
+        faltante = ejecutar_comando(self.clinica, {"op": "emitir_receta", "args": {"dni": "12345678"}})
+        self.assertEqual(faltante["error"], "KeyError")
+    
+    def test_argumentos_de_tipo_invalido(self):
+        """Test para verificar que los tipos inesperados se informan como TypeError"""
+        comandos = [
+            {"op": "agregar_paciente", "args": {"nombre": 5, "dni": "1", "fecha_nacimiento": "01/01/1990"}},
+            {"op": "buscar_pacientes", "args": {"texto": None}},
+            {"op": "agregar_medico", "args": {"nombre": "Dr. X", "matricula": "1",
+                                              "especialidades": [{"tipo": "Clínica", "dias": [5]}]}},
+            {"op": "agregar_medico", "args": {"nombre": "Dr. X", "matricula": "1", "especialidades": "x"}},
+            {"op": "emitir_receta", "args": {"dni": "12345678", "matricula": "54321", "medicamentos": "x"}},
+            {"op": "cancelar_turno", "args": {"id_turno": "1"}},
+            {"op": "agregar_a_lista_espera", "args": {"dni": "12345678", "especialidad": "Pediatría",
+                                                      "prioridad": True}},
+        ]
+        for comando in comandos:
+            with self.subTest(comando=comando):
+                respuesta = ejecutar_comando(self.clinica, comando)
+                self.assertEqual(respuesta["error"], "TypeError")
+        self.assertEqual(len(self.clinica.obtener_pacientes()), 1)
+    
+    def test_valores_fuera_de_rango(self):
+        """Test para informar duraciones no finitas o enormes y fechas que salen del rango"""
+        def agendar(minutos):
+            return ejecutar_comando(self.clinica, {"op": "agendar_turno", "args": {
+                "dni": "12345678", "matricula": "54321", "especialidad": "Pediatría",
+                "fecha_hora": "2025-12-08T14:30", "duracion_minutos": minutos}})
+        
+        for minutos in (1e20, float("inf"), float("nan")):
+            with self.subTest(minutos=minutos):
+                self.assertEqual(agendar(minutos)["error"], "ValueError")
+        self.assertEqual(agendar(5e9)["error"], "OverflowError")
+        respuesta = ejecutar_comando(self.clinica, {"op": "buscar_proximo_turno", "args": {
+            "especialidad": "Pediatría", "desde": "9999-12-30T00:00"}})
+        self.assertEqual(respuesta["error"], "OverflowError")
+        self.assertEqual(len(self.clinica.obtener_turnos()), 0)
+    
+    def test_buscar_proximo_turno(self):
+        """Test para buscar horarios libres por comando"""
+        respuesta = ejecutar_comando(self.clinica, {"op": "buscar_proximo_turno", "args": {
+            "especialidad": "Pediatría", "desde": "2025-12-08T07:00", "n": 1}})
+        self.assertEqual(respuesta["resultado"], [{"fecha_hora": "2025-12-08T08:00:00", "matricula": "54321"}])
+    
+    def test_cancelar_y_reprogramar_turno(self):
+        """Test para cancelar y reprogramar turnos por id"""
+        agendado = ejecutar_comando(self.clinica, {"op": "agendar_turno", "args": {
+            "dni": "12345678", "matricula": "54321", "especialidad": "Pediatría",
+            "fecha_hora": "2025-12-08T14:30"}})["resultado"]
+        movido = ejecutar_comando(self.clinica, {"op": "reprogramar_turno", "args": {
+            "id_turno": agendado["id_turno"], "fecha_hora": "2025-12-10T09:00",
+            "duracion_minutos": 45}})["resultado"]
+        self.assertEqual((movido["id_turno"], movido["fecha_hora"], movido["duracion_minutos"]),
+                         (agendado["id_turno"], "2025-12-10T09:00:00", 45))
+        
+        cancelado = ejecutar_comando(self.clinica, {"op": "cancelar_turno",
+                                                    "args": {"id_turno": agendado["id_turno"]}})
+        self.assertTrue(cancelado["ok"])
+        otra_vez = ejecutar_comando(self.clinica, {"op": "cancelar_turno",
+                                                   "args": {"id_turno": agendado["id_turno"]}})
+        self.assertEqual(otra_vez["error"], "TurnoNoEncontradoException")
+    
+    def test_lista_espera(self):
+        """Test para anotarse en la lista de espera y recibir el horario cancelado"""
+        agendado = ejecutar_comando(self.clinica, {"op": "agendar_turno", "args": {
+            "dni": "12345678", "matricula": "54321", "especialidad": "Pediatría",
+            "fecha_hora": "2025-12-08T14:30"}})["resultado"]
+        ejecutar_comando(self.clinica, {"op": "agregar_paciente", "args": {
+            "nombre": "Ana Gómez", "dni": "87654321", "fecha_nacimiento": "02/02/1992"}})
+        solicitud = ejecutar_comando(self.clinica, {"op": "agregar_a_lista_espera", "args": {
+            "dni": "87654321", "especialidad": "Pediatría", "prioridad": 1}})["resultado"]
+        self.assertEqual(solicitud["estado"], "pendiente")
+        
+        ejecutar_comando(self.clinica, {"op": "cancelar_turno", "args": {"id_turno": agendado["id_turno"]}})
+        self.assertEqual(ejecutar_comando(self.clinica, {"op": "obtener_lista_espera"})["resultado"], [])
+        proximos = ejecutar_comando(self.clinica, {"op": "obtener_proximos_turnos", "args": {
+            "dni": "87654321", "desde": "2025-12-01T00:00"}})["resultado"]
+        self.assertEqual([t["fecha_hora"] for t in proximos], ["2025-12-08T14:30:00"])
+        retirar = ejecutar_comando(self.clinica, {"op": "retirar_de_lista_espera",
+                                                  "args": {"id_solicitud": solicitud["id_solicitud"]}})
+        self.assertEqual(retirar["error"], "ValueError")
+    
+    def test_obtener_proximos_turnos(self):
+        """Test para consultar los próximos turnos de un paciente por comando"""
+        ejecutar_comando(self.clinica, {"op": "agendar_turno", "args": {
+            "dni": "12345678", "matricula": "54321", "especialidad": "Pediatría",
+            "fecha_hora": "2025-12-08T14:30"}})
+        respuesta = ejecutar_comando(self.clinica, {"op": "obtener_proximos_turnos", "args": {
+            "dni": "12345678", "desde": "2025-12-01T00:00", "limite": 10}})
+        self.assertEqual([t["fecha_hora"] for t in respuesta["resultado"]], ["2025-12-08T14:30:00"])
+    
+    def test_buscar_pacientes_y_medicos(self):
+        """Test para buscar por nombre por comando"""
+        pacientes = ejecutar_comando(self.clinica, {"op": "buscar_pacientes", "args": {"texto": "perez"}})
+        self.assertEqual([p["dni"] for p in pacientes["resultado"]], ["12345678"])
+        medicos = ejecutar_comando(self.clinica, {"op": "buscar_medicos", "args": {"texto": "garc", "limite": 5}})
+        self.assertEqual([m["matricula"] for m in medicos["resultado"]], ["54321"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,177 @@
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from collections import Counter
+from datetime import datetime, timedelta
+from modelos import Clinica, Paciente, Medico, Especialidad
+from persistencia import AlmacenSQLite, AlmacenJournal
+from excepciones import TurnoOcupadoException
+
+DIAS_TODOS = ["lunes", "martes", "miércoles", "jueves", "viernes", "sábado", "domingo"]
+
+class TestConcurrencia(unittest.TestCase):
+    
+    HILOS = 8
+    HORARIOS = 200
+    
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.intervalo_original = sys.getswitchinterval()
+        # Cambios de hilo muy frecuentes para forzar la contención
+        sys.setswitchinterval(1e-6)
+        
+        self.clinica = Clinica(concurrente=True)
+        for i in range(self.HILOS):
+            self.clinica.agregar_paciente(Paciente(f"Paciente {i}", f"{10000000 + i}", "01/01/1990"))
+        for matricula in ("1000", "2000"):
+            self.clinica.agregar_medico(
+                Medico(f"Dr. {matricula}", matricula, [Especialidad("Clínica Médica", DIAS_TODOS)])
+            )
+        self.inicio = datetime(2025, 12, 8, 8, 0)
+    
+    def tearDown(self):
+        sys.setswitchinterval(self.intervalo_original)
+    
+    def ejecutar_en_hilos(self, tarea):
+        barrera = threading.Barrier(self.HILOS)
+        hilos = [
+            threading.Thread(target=tarea, args=(i, barrera)) for i in range(self.HILOS)
+        ]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+    
+    def test_sin_turnos_duplicados_bajo_contencion(self):
+        """Test para verificar que varios hilos no agendan dos veces el mismo horario"""
+        exitos = Counter()
+        lock_exitos = threading.Lock()
+        
+        def tarea(i, barrera):
+            dni = f"{10000000 + i}"
+            barrera.wait()
+            for k in range(self.HORARIOS):
+                for matricula in ("1000", "2000"):
+                    try:
+                        self.clinica.agendar_turno(
+                            dni, matricula, "Clínica Médica", self.inicio + timedelta(minutes=k),
+                            timedelta(minutes=1),
+                        )
+                    except TurnoOcupadoException:
+                        continue
+                    with lock_exitos:
+                        exitos[(matricula, k)] += 1
+        
+        self.ejecutar_en_hilos(tarea)
+        
+        self.assertEqual(len(exitos), 2 * self.HORARIOS)
+        self.assertTrue(all(cantidad == 1 for cantidad in exitos.values()))
+        self.assertEqual(len(self.clinica.obtener_turnos()), 2 * self.HORARIOS)
+        for matricula in ("1000", "2000"):
+            agenda = self.clinica.obtener_agenda(matricula)
+            self.assertEqual(len(agenda), self.HORARIOS)
+            self.assertEqual(len({t.obtener_fecha_hora() for t in agenda}), self.HORARIOS)
+        total_historias = sum(
+            len(self.clinica.obtener_historia_clinica_por_dni(f"{10000000 + i}").obtener_turnos())
+            for i in range(self.HILOS)
+        )
+        self.assertEqual(total_historias, 2 * self.HORARIOS)
+    
+    def test_recetas_concurrentes_mismo_paciente(self):
+        """Test para verificar que no se pierden recetas escritas en paralelo"""
+        def tarea(i, barrera):
+            barrera.wait()
+            for _ in range(50):
+                self.clinica.emitir_receta("10000000", "1000", [f"Medicamento {i}"])
+        
+        self.ejecutar_en_hilos(tarea)
+        recetas = self.clinica.obtener_historia_clinica_por_dni("10000000").obtener_recetas()
+        self.assertEqual(len(recetas), self.HILOS * 50)
+    
+    def test_lote_y_turnos_sueltos_con_almacen(self):
+        """Test para verificar que un lote y turnos sueltos del mismo médico no se bloquean con un almacén"""
+        for almacen_clase in (AlmacenSQLite, AlmacenJournal):
+            with self.subTest(almacen=almacen_clase.__name__), tempfile.TemporaryDirectory() as directorio:
+                ruta = os.path.join(directorio, "clinica.db") if almacen_clase is AlmacenSQLite else directorio
+                almacen = almacen_clase(ruta)
+                clinica = Clinica(almacen, concurrente=True)
+                for i in range(self.HILOS):
+                    clinica.agregar_paciente(Paciente(f"Paciente {i}", f"{10000000 + i}", "01/01/1990"))
+                clinica.agregar_medico(Medico("Dr. 1000", "1000", [Especialidad("Clínica Médica", DIAS_TODOS)]))
+                
+                def tarea(i, barrera):
+                    dni = f"{10000000 + i}"
+                    barrera.wait()
+                    for k in range(i, self.HORARIOS, self.HILOS):
+                        fecha_hora = self.inicio + timedelta(minutes=k)
+                        if i % 2:
+                            clinica.agendar_turnos_lote(
+                                [(dni, "1000", "Clínica Médica", fecha_hora, timedelta(minutes=1))])
+                        else:
+                            clinica.agendar_turno(dni, "1000", "Clínica Médica", fecha_hora,
+                                                  timedelta(minutes=1))
+                
+                barrera = threading.Barrier(self.HILOS)
+                hilos = [threading.Thread(target=tarea, args=(i, barrera), daemon=True)
+                         for i in range(self.HILOS)]
+                for hilo in hilos:
+                    hilo.start()
+                limite = time.monotonic() + 30
+                for hilo in hilos:
+                    hilo.join(timeout=max(0, limite - time.monotonic()))
+                self.assertFalse(any(hilo.is_alive() for hilo in hilos), "los hilos quedaron bloqueados")
+                almacen.cerrar()
+                
+                almacen = almacen_clase(ruta)
+                self.assertEqual(len(Clinica(almacen).obtener_turnos()), self.HORARIOS)
+                almacen.cerrar()
+    
+    def test_listados_son_copias_consistentes(self):
+        """Test para leer listados y páginas mientras otros hilos agendan y cancelan"""
+        historia = self.clinica.obtener_historia_clinica_por_dni("10000000")
+        primero = self.clinica.agendar_turno("10000000", "1000", "Clínica Médica", self.inicio)
+        turnos, turnos_historia = self.clinica.obtener_turnos(), historia.obtener_turnos()
+        self.clinica.cancelar_turno(primero.obtener_id())
+        self.assertEqual(list(turnos), [primero])
+        self.assertEqual(list(turnos_historia), [primero])
+        
+        terminado = threading.Event()
+        errores = []
+        
+        def escritor(i, barrera):
+            barrera.wait()
+            dni = f"{10000000 + i}"
+            for k in range(self.HORARIOS):
+                turno = self.clinica.agendar_turno(
+                    dni, "1000" if i % 2 else "2000", "Clínica Médica",
+                    self.inicio + timedelta(days=1 + i // 2, minutes=k), timedelta(minutes=1),
+                )
+                if k % 2:
+                    self.clinica.cancelar_turno(turno.obtener_id())
+        
+        def lector():
+            # Cada turno aparece una sola vez: una lectura rota repite o pierde entradas
+            while not terminado.is_set():
+                for leidos in (list(self.clinica.obtener_turnos()), self.clinica.obtener_turnos(5, 20),
+                               list(historia.obtener_turnos())):
+                    ids = [t.obtener_id() for t in leidos]
+                    if len(ids) != len(set(ids)):
+                        errores.append(ids)
+        
+        lectores = [threading.Thread(target=lector) for _ in range(2)]
+        for hilo in lectores:
+            hilo.start()
+        try:
+            self.ejecutar_en_hilos(escritor)
+        finally:
+            terminado.set()
+            for hilo in lectores:
+                hilo.join()
+        self.assertEqual(errores, [])
+        self.assertEqual(len(self.clinica.obtener_turnos()), self.HILOS * self.HORARIOS // 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -11,6 +11,16 @@ class TestEspecialidad(unittest.TestCase):
         self.assertTrue(especialidad.verificar_dia("LUNES"))  # Case insensitive
         self.assertFalse(especialidad.verificar_dia("martes"))
     
+    def test_mascara_de_dias(self):
+        """Test para verificar la máscara de días y las grafías sin tilde"""
+        especialidad = Especialidad("Pediatría", ["lunes", "miercoles", "Sábado"])
+        self.assertEqual(especialidad.obtener_mascara(), 0b0100101)
+        self.assertTrue(especialidad.verificar_dia("miércoles"))
+        self.assertTrue(especialidad.verificar_dia("sabado"))
+        self.assertTrue(especialidad.verificar_numero_dia(0))
+        self.assertFalse(especialidad.verificar_numero_dia(6))
+        self.assertFalse(especialidad.verificar_dia("feriado"))
+    
     def test_crear_especialidad_sin_tipo(self):
         """Test para verificar error cuando no se proporciona tipo"""
         with self.assertRaises(ValueError) as context:
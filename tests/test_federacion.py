@@ -0,0 +1,94 @@
+import threading
+import unittest
+from datetime import datetime, timedelta
+from modelos import Clinica, Paciente, Medico, Especialidad
+from excepciones import PacienteNoEncontradoException
+from servicio import FederacionClinicas
+
+class ClinicaConBarrera(Clinica):
+    """Sede que solo responde cuando todas las sedes están consultándose a la vez"""
+
+    def __init__(self, barrera: threading.Barrier):
+        super().__init__()
+        self.barrera = barrera
+
+    def obtener_paciente_por_dni(self, dni: str) -> Paciente:
+        self.barrera.wait(timeout=5)
+        return super().obtener_paciente_por_dni(dni)
+
+class TestFederacion(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.federacion = FederacionClinicas()
+        self.centro, self.norte, self.sur = Clinica(), Clinica(), Clinica()
+        for nombre, clinica in (("Centro", self.centro), ("Norte", self.norte), ("Sur", self.sur)):
+            self.federacion.registrar_sede(nombre, clinica)
+
+        self.centro.agregar_paciente(Paciente("Juan Pérez", "12345678", "01/01/1990"))
+        self.sur.agregar_paciente(Paciente("Juan Pérez", "12345678", "01/01/1990"))
+        self.norte.agregar_paciente(Paciente("Ana Gómez", "87654321", "02/02/1992"))
+
+        self.centro.agregar_medico(Medico("Dr. García", "100", [Especialidad("Cardiología", ["lunes"])]))
+        self.sur.agregar_medico(Medico("Dra. López", "200", [Especialidad("Cardiología", ["lunes"])]))
+        self.norte.agregar_medico(Medico("Dr. Ruiz", "300", [Especialidad("Pediatría", ["lunes"])]))
+        self.lunes = datetime(2025, 12, 8, 8, 0)
+
+    def tearDown(self):
+        self.federacion.cerrar()
+
+    def test_buscar_paciente_en_todas_las_sedes(self):
+        """Test para encontrar un paciente en las sedes donde está registrado"""
+        encontrados = self.federacion.buscar_paciente("12345678")
+        self.assertEqual([sede for sede, _ in encontrados], ["Centro", "Sur"])
+        self.assertEqual(encontrados[0][1].obtener_nombre(), "Juan Pérez")
+        self.assertEqual(self.federacion.buscar_paciente("99999999"), [])
+
+    def test_proximo_turno_mezcla_sedes(self):
+        """Test para combinar en orden los horarios libres de todas las sedes"""
+        self.centro.agendar_turno("12345678", "100", "Cardiología", self.lunes)
+        horarios = self.federacion.buscar_proximo_turno(
+            "Cardiología", self.lunes, timedelta(minutes=30), n=3)
+        self.assertEqual(horarios, [
+            (self.lunes, "Sur", "200"),
+            (self.lunes + timedelta(minutes=30), "Centro", "100"),
+            (self.lunes + timedelta(minutes=30), "Sur", "200"),
+        ])
+        self.assertEqual(self.federacion.buscar_proximo_turno(
+            "Traumatología", self.lunes, timedelta(minutes=30)), [])
+
+    def test_historia_combinada(self):
+        """Test para reunir turnos y recetas de un paciente atendido en varias sedes"""
+        self.sur.agendar_turno("12345678", "200", "Cardiología", self.lunes)
+        self.centro.agendar_turno("12345678", "100", "Cardiología", self.lunes + timedelta(days=7))
+        self.centro.emitir_receta("12345678", "100", ["Aspirina"])
+
+        historia = self.federacion.obtener_historia_clinica_por_dni("12345678")
+        self.assertEqual(historia.sedes, ["Centro", "Sur"])
+        self.assertEqual([sede for sede, _ in historia.turnos], ["Sur", "Centro"])
+        self.assertEqual([sede for sede, _ in historia.recetas], ["Centro"])
+        with self.assertRaises(PacienteNoEncontradoException):
+            self.federacion.obtener_historia_clinica_por_dni("99999999")
+
+    def test_sedes_se_consultan_en_paralelo(self):
+        """Test para verificar que las sedes se consultan a la vez y no una tras otra"""
+        barrera = threading.Barrier(3)
+        with FederacionClinicas(max_hilos=3) as federacion:
+            for nombre in ("A", "B", "C"):
+                sede = ClinicaConBarrera(barrera)
+                sede.agregar_paciente(Paciente("Juan Pérez", "12345678", "01/01/1990"))
+                federacion.registrar_sede(nombre, sede)
+            # Con consultas secuenciales la barrera vencería su plazo
+            self.assertEqual(len(federacion.buscar_paciente("12345678")), 3)
+
+    def test_registro_de_sedes(self):
+        """Test para registrar y quitar sedes"""
+        with self.assertRaises(ValueError):
+            self.federacion.registrar_sede("Centro", Clinica())
+        self.assertIs(self.federacion.quitar_sede("Sur"), self.sur)
+        self.assertEqual(self.federacion.obtener_sedes(), ["Centro", "Norte"])
+        with self.assertRaises(ValueError):
+            self.federacion.obtener_sede("Sur")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,6 @@
+import io
 import unittest
+from unittest import mock
 from datetime import datetime
 from modelos import HistoriaClinica, Paciente, Medico, Especialidad, Turno, Receta
 
@@ -29,6 +31,130 @@ class TestHistoriaClinica(unittest.TestCase):
         historia.agregar_turno(turno)
         self.assertEqual(len(historia.obtener_turnos()), 1)
     
+    def test_quitar_turno(self):
+        """Test para quitar un turno y actualizar el texto memorizado"""
+        historia = HistoriaClinica(self.paciente)
+        turno = Turno(self.paciente, self.medico, self.fecha_hora, "Pediatría")
+        historia.agregar_turno(turno)
+        str(historia)
+        
+        historia.quitar_turno(turno)
+        self.assertEqual(len(historia.obtener_turnos()), 0)
+        self.assertEqual(str(historia), f"HistoriaClinica(Paciente({self.paciente}),\n  []\n)")
+        with self.assertRaises(ValueError):
+            historia.quitar_turno(turno)
+    
+    def test_reemplazar_turno(self):
+        """Test para reemplazar un turno reprogramado sin cambiarlo de lugar"""
+        historia = HistoriaClinica(self.paciente)
+        turnos = [Turno(self.paciente, self.medico, self.fecha_hora, "Pediatría") for _ in range(2)]
+        for turno in turnos:
+            historia.agregar_turno(turno)
+        str(historia)
+        
+        nuevo = Turno(self.paciente, self.medico, self.fecha_hora.replace(hour=9), "Pediatría")
+        historia.reemplazar_turno(turnos[0], nuevo)
+        self.assertEqual(list(historia.obtener_turnos()), [nuevo, turnos[1]])
+        self.assertIn(str(nuevo), str(historia))
+        with self.assertRaises(ValueError):
+            historia.reemplazar_turno(turnos[0], nuevo)
+    
+    def test_obtener_turnos_es_de_solo_lectura(self):
+        """Test para verificar que la historia expone sus turnos sin permitir modificarlos"""
+        historia = HistoriaClinica(self.paciente)
+        turnos = historia.obtener_turnos()
+        historia.agregar_turno(Turno(self.paciente, self.medico, self.fecha_hora, "Pediatría"))
+        self.assertEqual(len(turnos), 1)
+        with self.assertRaises(AttributeError):
+            turnos.append("turno_string")
+    
+    def test_str_incremental_coincide_con_render_completo(self):
+        """Test para verificar que el texto memorizado se actualiza al agregar elementos"""
+        historia = HistoriaClinica(self.paciente)
+        self.assertEqual(str(historia), f"HistoriaClinica(Paciente({self.paciente}),\n  []\n)")
+        
+        turno = Turno(self.paciente, self.medico, self.fecha_hora, "Pediatría")
+        receta = Receta(self.paciente, self.medico, ["Paracetamol"])
+        historia.agregar_receta(receta)
+        str(historia)
+        historia.agregar_turno(turno)
+        
+        esperado = (f"HistoriaClinica(Paciente({self.paciente}),\n"
+                    f"  [\n    {turno},\n    {receta}\n  ]\n)")
+        self.assertEqual(str(historia), esperado)
+        self.assertIs(str(historia), str(historia))
+    
+    def test_str_refleja_cambios_del_medico(self):
+        """Test para verificar que el texto se regenera si el médico agrega una especialidad"""
+        historia = HistoriaClinica(self.paciente)
+        historia.agregar_turno(Turno(self.paciente, self.medico, self.fecha_hora, "Pediatría"))
+        self.assertNotIn("Cardiología", str(historia))
+        
+        self.medico.agregar_especialidad(Especialidad("Cardiología", ["martes"]))
+        self.assertIn("Cardiología", str(historia))
+    
+    def test_str_regenera_solo_las_entradas_del_medico_que_cambio(self):
+        """Test para verificar que cambiar un médico no invalida las entradas de los demás"""
+        otro = Medico("Dra. López", "11111", [Especialidad("Pediatría", ["lunes"])])
+        ajeno = Medico("Dr. Ruiz", "22222")
+        historia = HistoriaClinica(self.paciente)
+        turnos = [Turno(self.paciente, medico, self.fecha_hora, "Pediatría") for medico in (self.medico, otro)]
+        for turno in turnos:
+            historia.agregar_turno(turno)
+        historia.agregar_receta(Receta(self.paciente, otro, ["Paracetamol"]))
+        texto = str(historia)
+        
+        # Un médico sin entradas en la historia no invalida el texto memorizado
+        ajeno.agregar_especialidad(Especialidad("Cardiología", ["martes"]))
+        self.assertIs(str(historia), texto)
+        
+        renderizados = []
+        original = Turno.__str__
+        def contar(turno):
+            renderizados.append(turno)
+            return original(turno)
+        otro.agregar_especialidad(Especialidad("Cardiología", ["martes"]))
+        with mock.patch.object(Turno, "__str__", contar):
+            texto = str(historia)
+        self.assertEqual(renderizados, [turnos[1]])
+        self.assertEqual(texto.count("Cardiología"), 2)
+        
+        completa = io.StringIO()
+        historia.escribir(completa)
+        self.assertEqual(completa.getvalue(), texto)
+    
+    def test_escribir_en_archivo(self):
+        """Test para escribir la historia completa y paginada en un objeto tipo archivo"""
+        historia = HistoriaClinica(self.paciente)
+        turno = Turno(self.paciente, self.medico, self.fecha_hora, "Pediatría")
+        receta = Receta(self.paciente, self.medico, ["Paracetamol"])
+        historia.agregar_turno(turno)
+        historia.agregar_receta(receta)
+        
+        completa = io.StringIO()
+        historia.escribir(completa)
+        self.assertEqual(completa.getvalue(), str(historia))
+        
+        pagina = io.StringIO()
+        historia.escribir(pagina, offset=1, limite=5)
+        self.assertEqual(pagina.getvalue(),
+                         f"HistoriaClinica(Paciente({self.paciente}),\n  [\n    {receta}\n  ]\n)")
+        
+        vacia = io.StringIO()
+        historia.escribir(vacia, offset=2)
+        self.assertTrue(vacia.getvalue().endswith("  []\n)"))
+        
+        # Con turnos cancelados en el medio, la página se ubica entre los vigentes
+        otros = [Turno(self.paciente, self.medico, self.fecha_hora, "Pediatría") for _ in range(3)]
+        for otro in otros:
+            historia.agregar_turno(otro)
+        historia.quitar_turno(otros[0])
+        pagina = io.StringIO()
+        historia.escribir(pagina, offset=1, limite=1)
+        self.assertEqual(pagina.getvalue(),
+                         f"HistoriaClinica(Paciente({self.paciente}),\n  [\n    {otros[1]}\n  ]\n)")
+        self.assertEqual(list(historia.obtener_turnos()), [turno, otros[1], otros[2]])
+    
     def test_agregar_turno_invalido(self):
         """Test para verificar error al agregar turno inválido"""
         historia = HistoriaClinica(self.paciente)
@@ -0,0 +1,87 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+from modelos import Clinica, Paciente
+from persistencia import importar_pacientes, importar_medicos
+
+class TestImportador(unittest.TestCase):
+    
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.directorio = tempfile.TemporaryDirectory()
+        self.clinica = Clinica()
+        self.clinica.agregar_paciente(Paciente("Ana López", "11111111", "02/02/1980"))
+    
+    def tearDown(self):
+        self.directorio.cleanup()
+    
+    def escribir(self, nombre, contenido):
+        ruta = os.path.join(self.directorio.name, nombre)
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            archivo.write(contenido)
+        return ruta
+    
+    def test_importar_pacientes_csv(self):
+        """Test para importar pacientes desde CSV y rechazar filas inválidas o duplicadas"""
+        ruta = self.escribir("pacientes.csv", (
+            "nombre,dni,fecha_nacimiento\n"
+            "Juan Pérez,12345678,01/01/1990\n"
+            "Sin Fecha,22222222,1990-01-01\n"
+            "Ana López,11111111,02/02/1980\n"
+            ",33333333,01/01/1990\n"
+            "María García,87654321,15/05/1985\n"
+        ))
+        resultado = importar_pacientes(self.clinica, ruta, filas_por_bloque=2)
+        self.assertEqual((resultado.importados, resultado.rechazados), (2, 3))
+        self.assertEqual(len(self.clinica.obtener_pacientes()), 3)
+        self.assertTrue(self.clinica.validar_existencia_paciente("87654321"))
+        
+        with open(resultado.ruta_rechazos, encoding="utf-8") as archivo:
+            rechazos = list(csv.DictReader(archivo))
+        self.assertEqual([r["linea"] for r in rechazos], ["3", "4", "5"])
+        self.assertEqual(rechazos[0]["error"], "El formato de fecha debe ser dd/mm/aaaa")
+        self.assertIn("Ya existe", rechazos[1]["error"])
+        self.assertEqual(rechazos[1]["dni"], "11111111")
+    
+    def test_importar_medicos_jsonl(self):
+        """Test para importar médicos con especialidades desde JSONL"""
+        medicos = [
+            {"nombre": "Dr. García", "matricula": "54321",
+             "especialidades": [{"tipo": "Pediatría", "dias": ["lunes", "miércoles"]}]},
+            {"nombre": "Dr. Díaz", "matricula": "99999",
+             "especialidades": [{"tipo": "Cardiología", "dias": ["domingo", "feriado"]}]},
+        ]
+        ruta = self.escribir("medicos.jsonl", "\n".join(json.dumps(m) for m in medicos) + "\n{roto\n")
+        rechazos = os.path.join(self.directorio.name, "rechazados.jsonl")
+        resultado = importar_medicos(self.clinica, ruta, rechazos)
+        self.assertEqual((resultado.importados, resultado.rechazados), (1, 2))
+        self.assertEqual([m.obtener_matricula() for m in self.clinica.obtener_medicos_por_especialidad("Pediatría")],
+                         ["54321"])
+        
+        with open(rechazos, encoding="utf-8") as archivo:
+            lineas = [json.loads(linea) for linea in archivo]
+        self.assertEqual([r["linea"] for r in lineas], [2, 3])
+        self.assertEqual(lineas[0]["matricula"], "99999")
+        self.assertEqual(lineas[1]["contenido"], "{roto")
+    
+    def test_importar_medicos_csv(self):
+        """Test para importar médicos con especialidades codificadas en una columna CSV"""
+        ruta = self.escribir("medicos.csv", (
+            "nombre,matricula,especialidades\n"
+            "Dr. García,54321,Pediatría:lunes|miércoles;Cardiología:viernes\n"
+        ))
+        resultado = importar_medicos(self.clinica, ruta)
+        self.assertEqual((resultado.importados, resultado.rechazados), (1, 0))
+        self.assertFalse(os.path.exists(resultado.ruta_rechazos))
+        medico = self.clinica.obtener_medico_por_matricula("54321")
+        self.assertTrue(medico.atiende("Cardiología", 4))
+    
+    def test_formato_no_soportado(self):
+        """Test para verificar error con una extensión desconocida"""
+        with self.assertRaises(ValueError):
+            importar_pacientes(self.clinica, self.escribir("pacientes.txt", ""))
+
+if __name__ == '__main__':
+    unittest.main()
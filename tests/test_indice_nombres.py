@@ -0,0 +1,35 @@
+import unittest
+from modelos import IndiceNombres
+
+class TestIndiceNombres(unittest.TestCase):
+    
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.indice = IndiceNombres()
+        for nombre in ["Juan Pérez", "María Pereyra", "José Núñez", "Ana Pérez Núñez"]:
+            self.indice.agregar(nombre, nombre)
+    
+    def test_buscar_por_prefijo_sin_tildes(self):
+        """Test para buscar por comienzo de palabra ignorando tildes y mayúsculas"""
+        self.assertEqual(self.indice.buscar("PER"), ["Juan Pérez", "María Pereyra", "Ana Pérez Núñez"])
+        self.assertEqual(self.indice.buscar("nunez"), ["José Núñez", "Ana Pérez Núñez"])
+        self.assertEqual(self.indice.buscar("perez nu"), ["Ana Pérez Núñez"])
+        self.assertEqual(self.indice.buscar("ez"), [])
+    
+    def test_buscar_con_error_de_tipeo(self):
+        """Test para encontrar nombres a una edición de distancia"""
+        self.assertEqual(self.indice.buscar("Peres"), ["Juan Pérez", "Ana Pérez Núñez"])
+        self.assertEqual(self.indice.buscar("jaun"), ["Juan Pérez"])
+        self.assertEqual(self.indice.buscar("Pxrxz"), [])
+    
+    def test_limite(self):
+        """Test para verificar el límite de resultados"""
+        self.assertEqual(self.indice.buscar("per", limite=2), ["Juan Pérez", "María Pereyra"])
+        self.assertEqual(self.indice.buscar("per", limite=0), [])
+        self.assertEqual(self.indice.buscar("   "), [])
+        with self.assertRaises(ValueError):
+            self.indice.buscar("per", limite=-1)
+        self.assertEqual(len(self.indice), 4)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+from datetime import datetime, timedelta
+from modelos import ListaEspera, SolicitudEspera
+
+class TestListaEspera(unittest.TestCase):
+    
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.lista = ListaEspera()
+        self.fecha = datetime(2025, 12, 8, 10, 0)
+    
+    def test_asignar_por_prioridad_y_llegada(self):
+        """Test para ofrecer el horario a la solicitud más prioritaria y, a igual prioridad, a la más antigua"""
+        primera = self.lista.agregar("1", "Pediatría")
+        urgente = self.lista.agregar("2", "Pediatría", "54321", prioridad=5)
+        segunda = self.lista.agregar("3", "Pediatría")
+        ofrecidas = []
+        
+        def intentar(solicitud):
+            ofrecidas.append(solicitud.obtener_dni())
+            return "turno" if solicitud is not urgente else None
+        
+        claves = [("Pediatría", "54321"), ("Pediatría", None)]
+        self.assertIs(self.lista.asignar_mejor(claves, intentar), primera)
+        self.assertEqual(ofrecidas, ["2", "1"])
+        self.assertEqual((primera.obtener_estado(), primera.obtener_turno()), ("asignada", "turno"))
+        # La que rechazó el horario vuelve a su cola
+        self.assertEqual([s.obtener_dni() for s in self.lista.obtener_pendientes()], ["2", "3"])
+        self.assertIs(self.lista.asignar_mejor(claves, lambda s: "turno"), urgente)
+        self.assertIs(self.lista.asignar_mejor(claves, lambda s: "turno"), segunda)
+        self.assertIsNone(self.lista.asignar_mejor(claves, lambda s: "turno"))
+    
+    def test_solo_colas_indicadas(self):
+        """Test para no ofrecer el horario a solicitudes de otro médico o especialidad"""
+        self.lista.agregar("1", "Pediatría", "11111")
+        self.lista.agregar("2", "Cardiología")
+        self.assertIsNone(self.lista.asignar_mejor([("Pediatría", "54321"), ("Pediatría", None)],
+                                                   lambda s: "turno"))
+        self.assertEqual(len(self.lista), 2)
+    
+    def test_retirar(self):
+        """Test para retirar una solicitud sin recorrer la cola"""
+        retirada = self.lista.agregar("1", "Pediatría", prioridad=9)
+        otra = self.lista.agregar("2", "Pediatría")
+        self.assertIs(self.lista.retirar(retirada.obtener_id()), retirada)
+        self.assertEqual(retirada.obtener_estado(), "retirada")
+        self.assertIs(self.lista.asignar_mejor([("Pediatría", None)], lambda s: "turno"), otra)
+        with self.assertRaises(ValueError):
+            self.lista.retirar(retirada.obtener_id())
+    
+    def test_franja_de_la_solicitud(self):
+        """Test para verificar la franja en la que debe empezar el turno"""
+        solicitud = SolicitudEspera(1, "1", "Pediatría", desde=self.fecha,
+                                    hasta=self.fecha + timedelta(hours=2))
+        self.assertTrue(solicitud.admite(self.fecha))
+        self.assertFalse(solicitud.admite(self.fecha - timedelta(minutes=1)))
+        self.assertFalse(solicitud.admite(self.fecha + timedelta(hours=2)))
+        self.assertEqual(solicitud.obtener_duracion(), timedelta(minutes=30))
+    
+    def test_solicitud_invalida(self):
+        """Test para verificar las validaciones de la solicitud"""
+        with self.assertRaises(ValueError):
+            SolicitudEspera(1, "1", " ")
+        with self.assertRaises(TypeError):
+            SolicitudEspera(1, "1", "Pediatría", prioridad="alta")
+        with self.assertRaises(ValueError):
+            SolicitudEspera(1, "1", "Pediatría", duracion=timedelta(0))
+        with self.assertRaises(ValueError):
+            SolicitudEspera(1, "1", "Pediatría", desde=self.fecha, hasta=self.fecha)
+
+if __name__ == '__main__':
+    unittest.main()
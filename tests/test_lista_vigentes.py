@@ -0,0 +1,71 @@
+import random
+import unittest
+from modelos import ListaVigentes
+
+class TestListaVigentes(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.lista = ListaVigentes()
+        for clave in range(1, 6):
+            self.lista.agregar(clave, f"e{clave}")
+
+    def test_bajas_y_reemplazos_conservan_el_orden(self):
+        """Test para dar de baja y reemplazar sin mover a los demás elementos"""
+        self.lista.quitar(2)
+        self.lista.reemplazar(4, "nuevo")
+        self.lista.agregar(6, "e6")
+        self.assertEqual(list(self.lista), ["e1", "e3", "nuevo", "e5", "e6"])
+        self.assertEqual(len(self.lista), 5)
+        self.assertEqual(self.lista[1], "e3")
+        self.assertEqual(self.lista[-1], "e6")
+        self.assertEqual(self.lista[1:3], ["e3", "nuevo"])
+        self.assertEqual(list(reversed(self.lista)), ["e6", "e5", "nuevo", "e3", "e1"])
+        with self.assertRaises(IndexError):
+            self.lista[5]
+
+    def test_claves(self):
+        """Test para rechazar claves repetidas o inexistentes"""
+        with self.assertRaises(ValueError):
+            self.lista.agregar(1, "otra")
+        self.lista.quitar(1)
+        with self.assertRaises(KeyError):
+            self.lista.quitar(1)
+        self.lista.agregar(1, "otra")
+        self.assertEqual(self.lista[-1], "otra")
+        
+        # Reemplazar con otra clave: el elemento queda en su lugar bajo la clave nueva
+        self.lista.reemplazar(3, "e3'", 30)
+        with self.assertRaises(KeyError):
+            self.lista.quitar(3)
+        with self.assertRaises(ValueError):
+            self.lista.reemplazar(30, "x", 4)
+        self.lista.quitar(30)
+        self.assertEqual(list(self.lista), ["e2", "e4", "e5", "otra"])
+
+    def test_equivale_a_una_lista(self):
+        """Test para comparar operaciones al azar, con compactaciones, contra una lista común"""
+        azar = random.Random(7)
+        esperado = [(clave, f"e{clave}") for clave in range(1, 6)]
+        for clave in range(6, 600):
+            operacion = azar.random()
+            if operacion < 0.5 or not esperado:
+                self.lista.agregar(clave, f"e{clave}")
+                esperado.append((clave, f"e{clave}"))
+            elif operacion < 0.9:
+                quitada, _ = esperado.pop(azar.randrange(len(esperado)))
+                self.lista.quitar(quitada)
+            else:
+                posicion = azar.randrange(len(esperado))
+                esperado[posicion] = (esperado[posicion][0], f"r{clave}")
+                self.lista.reemplazar(esperado[posicion][0], f"r{clave}")
+            elementos = [e for _, e in esperado]
+            self.assertEqual(len(self.lista), len(elementos))
+            inicio = azar.randrange(len(elementos) + 1)
+            self.assertEqual(self.lista[inicio:inicio + 10], elementos[inicio:inicio + 10])
+            if elementos:
+                self.assertEqual(self.lista[inicio - 1], elementos[inicio - 1])
+        self.assertEqual(list(self.lista), [e for _, e in esperado])
+
+if __name__ == '__main__':
+    unittest.main()
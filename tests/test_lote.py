@@ -0,0 +1,73 @@
+import io
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+from modelos import Clinica
+from persistencia import AlmacenSQLite
+from servicio import ejecutar_lote
+
+COMANDOS = """
+# alta
+{"op": "agregar_paciente", "args": {"nombre": "Juan Pérez", "dni": "12345678", "fecha_nacimiento": "01/01/1990"}}
+{"op": "agregar_medico", "args": {"nombre": "Dr. García", "matricula": "54321", "especialidades": [{"tipo": "Pediatría", "dias": ["lunes"]}]}}
+{"id": "t1", "op": "agendar_turno", "args": {"dni": "12345678", "matricula": "54321", "especialidad": "Pediatría", "fecha_hora": "2025-12-08T14:30"}}
+{"op": "agendar_turno", "args": {"dni": "12345678", "matricula": "54321", "especialidad": "Pediatría", "fecha_hora": "2025-12-08T14:30"}}
+no es json
+{"op": "emitir_receta", "args": {"dni": "12345678", "matricula": "54321", "medicamentos": ["Paracetamol"]}}
+"""
+
+class AlmacenSinRecetas(AlmacenSQLite):
+    """Almacén que falla al guardar recetas, para simular un error inesperado"""
+
+    def guardar_receta(self, receta):
+        raise sqlite3.OperationalError("disk I/O error")
+
+class TestLote(unittest.TestCase):
+    
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.clinica = Clinica()
+        self.salida = io.StringIO()
+    
+    def respuestas(self):
+        return [json.loads(linea) for linea in self.salida.getvalue().splitlines()]
+    
+    def test_ejecutar_lote(self):
+        """Test para ejecutar todos los comandos y responder uno por línea"""
+        resultado = ejecutar_lote(self.clinica, io.StringIO(COMANDOS), self.salida, comandos_por_bloque=2)
+        self.assertEqual(resultado, (6, 2))
+        
+        respuestas = self.respuestas()
+        self.assertEqual([r["id"] for r in respuestas], [3, 4, "t1", 6, 7, 8])
+        self.assertEqual(respuestas[3]["error"], "TurnoOcupadoException")
+        self.assertEqual(respuestas[4]["error"], "JSONDecodeError")
+        self.assertTrue(respuestas[5]["ok"])
+        self.assertEqual(len(self.clinica.obtener_historia_clinica_por_dni("12345678").obtener_recetas()), 1)
+    
+    def test_detener_en_error(self):
+        """Test para detenerse en el primer comando fallido"""
+        resultado = ejecutar_lote(self.clinica, io.StringIO(COMANDOS), self.salida, detener_en_error=True)
+        self.assertEqual(resultado, (4, 1))
+        self.assertEqual(len(self.respuestas()), 4)
+        self.assertEqual(len(self.clinica.obtener_historia_clinica_por_dni("12345678").obtener_recetas()), 0)
+    
+    def test_error_inesperado_no_pierde_el_bloque(self):
+        """Test para verificar que un comando que falla de forma inesperada no corta el lote"""
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "clinica.db")
+            almacen = AlmacenSinRecetas(ruta)
+            resultado = ejecutar_lote(Clinica(almacen), io.StringIO(COMANDOS), self.salida)
+            almacen.cerrar()
+            
+            self.assertEqual(resultado, (6, 3))
+            self.assertEqual(self.respuestas()[5]["error"], "OperationalError")
+            almacen = AlmacenSQLite(ruta)
+            clinica = Clinica(almacen)
+            self.assertEqual(len(clinica.obtener_pacientes()), 1)
+            self.assertEqual(len(clinica.obtener_turnos()), 1)
+            almacen.cerrar()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -38,6 +38,15 @@ class TestMedico(unittest.TestCase):
             medico.agregar_especialidad(self.especialidad1)
         self.assertIn("ya existe", str(context.exception).lower())
     
+    def test_atiende_por_numero_de_dia(self):
+        """Test para verificar especialidad y día con datetime.weekday()"""
+        medico = Medico("Dr. Juan Pérez", "12345", [self.especialidad1])
+        self.assertTrue(medico.atiende("Pediatría", 2))      # miércoles
+        self.assertFalse(medico.atiende("Pediatría", 1))     # martes
+        medico.agregar_especialidad(self.especialidad2)
+        self.assertTrue(medico.atiende("Cardiología", 1))
+        self.assertFalse(medico.atiende("Dermatología", 0))
+    
     def test_obtener_especialidad_para_dia(self):
         """Test para obtener especialidad por día"""
         medico = Medico("Dr. Juan Pérez", "12345", [self.especialidad1, self.especialidad2])
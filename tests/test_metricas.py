@@ -0,0 +1,67 @@
+import unittest
+import tempfile
+import os
+from datetime import datetime
+from modelos import Clinica, Paciente, Medico, Especialidad, Metricas
+from persistencia import AlmacenSQLite
+from excepciones import TurnoOcupadoException
+
+class TestMetricas(unittest.TestCase):
+    
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.clinica = Clinica(metricas=True)
+        self.clinica.agregar_paciente(Paciente("Juan Pérez", "12345678", "01/01/1990"))
+        self.clinica.agregar_medico(Medico("Dr. García", "54321", [Especialidad("Pediatría", ["lunes"])]))
+        self.fecha = datetime(2025, 12, 8, 14, 30)
+    
+    def test_registrar_y_resumir(self):
+        """Test para verificar conteos, errores, percentiles e histograma"""
+        metricas = Metricas()
+        metricas.registrar("op", 0.000003)
+        metricas.registrar("op", 0.000100, ValueError("x"))
+        resumen = metricas.obtener_resumen()["op"]
+        self.assertEqual(resumen["llamadas"], 2)
+        self.assertEqual(resumen["errores"], {"ValueError": 1})
+        self.assertEqual(resumen["p50_us"], 4)
+        self.assertEqual(resumen["p99_us"], 128)
+        self.assertEqual(sum(resumen["histograma"]), 2)
+        self.assertIn("ValueError=1", str(metricas))
+        metricas.reiniciar()
+        self.assertEqual(metricas.obtener_resumen(), {})
+    
+    def test_clinica_cuenta_llamadas_y_errores(self):
+        """Test para verificar que la clínica mide llamadas y errores por tipo"""
+        self.clinica.agendar_turno("12345678", "54321", "Pediatría", self.fecha)
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_turno("12345678", "54321", "Pediatría", self.fecha)
+        
+        resumen = self.clinica.obtener_metricas().obtener_resumen()
+        self.assertEqual(resumen["agendar_turno"]["llamadas"], 2)
+        self.assertEqual(resumen["agendar_turno"]["errores"], {"TurnoOcupadoException": 1})
+        self.assertEqual(resumen["_verificar_turno"]["llamadas"], 2)
+        self.assertEqual(resumen["_registrar_turno"]["llamadas"], 1)
+        self.assertEqual(resumen["agregar_paciente"]["llamadas"], 1)
+    
+    def test_deshabilitar_quita_la_medicion(self):
+        """Test para verificar que sin métricas no quedan métodos envueltos"""
+        self.clinica.deshabilitar_metricas()
+        self.assertIsNone(self.clinica.obtener_metricas())
+        self.assertNotIn("agendar_turno", vars(self.clinica))
+        self.clinica.agendar_turno("12345678", "54321", "Pediatría", self.fecha)
+        
+        metricas = self.clinica.habilitar_metricas()
+        self.assertIs(self.clinica.habilitar_metricas(), metricas)
+        self.assertEqual(metricas.obtener_resumen(), {})
+    
+    def test_mide_escrituras_del_almacen(self):
+        """Test para verificar que se miden las escrituras al almacén"""
+        with tempfile.TemporaryDirectory() as directorio:
+            almacen = AlmacenSQLite(os.path.join(directorio, "clinica.db"))
+            clinica = Clinica(almacen, metricas=True)
+            clinica.agregar_paciente(Paciente("Juan Pérez", "12345678", "01/01/1990"))
+            self.assertEqual(clinica.obtener_metricas().obtener_resumen()["almacen.guardar_paciente"]["llamadas"], 1)
+            almacen.cerrar()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,175 @@
+import io
+import itertools
+import json
+import unittest
+from datetime import datetime
+from modelos import Clinica
+from servicio import ClinicaParticionada, ejecutar_comando, ejecutar_lote
+
+def paciente(dni, nombre):
+    return {"op": "agregar_paciente", "args": {"nombre": nombre, "dni": dni, "fecha_nacimiento": "01/01/1990"}}
+
+def medico(matricula, nombre):
+    return {"op": "agregar_medico", "args": {"nombre": nombre, "matricula": matricula,
+            "especialidades": [{"tipo": "Pediatría", "dias": ["lunes", "martes"]}]}}
+
+def turno(dni, matricula, fecha_hora):
+    return {"op": "agendar_turno", "args": {"dni": dni, "matricula": matricula,
+            "especialidad": "Pediatría", "fecha_hora": fecha_hora}}
+
+def sin_ids(respuesta):
+    """Resultado sin ids de turno: los globales difieren de los de una clínica única"""
+    return [{k: v for k, v in e.items() if k != "id_turno"} for e in respuesta["resultado"]]
+
+class TestClinicaParticionada(unittest.TestCase):
+    
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.clinica = ClinicaParticionada(3)
+        # Una matrícula por partición
+        por_particion = {}
+        for numero in itertools.count(1):
+            por_particion.setdefault(self.clinica.particion_de_matricula(str(numero)), str(numero))
+            if len(por_particion) == 3:
+                break
+        self.matriculas = [por_particion[p] for p in range(3)]
+        respuestas = self.clinica.ejecutar_varios(
+            [paciente("12345678", "Juan Pérez"), paciente("87654321", "Ana Gómez")]
+            + [medico(m, f"Dr. Médico {m}") for m in self.matriculas]
+        )
+        self.assertTrue(all(r["ok"] for r in respuestas))
+    
+    def tearDown(self):
+        self.clinica.cerrar()
+    
+    def test_agendar_en_particiones_y_combinar(self):
+        """Test para agendar en varias particiones y leer listados combinados"""
+        a, b, c = self.matriculas
+        respuestas = self.clinica.ejecutar_varios([
+            {"id": "x", **turno("12345678", a, "2025-12-08T10:00")},
+            turno("12345678", b, "2025-12-09T09:00"),
+            turno("87654321", c, "2025-12-08T09:00"),
+            turno("87654321", c, "2025-12-08T09:00"),
+            {"op": "emitir_receta", "args": {"dni": "12345678", "matricula": b, "medicamentos": ["Paracetamol"]}},
+        ])
+        self.assertEqual(respuestas[0]["id"], "x")
+        self.assertEqual([r["ok"] for r in respuestas], [True, True, True, False, True])
+        self.assertEqual(respuestas[3]["error"], "TurnoOcupadoException")
+        
+        historia = self.clinica.ejecutar({"op": "obtener_historia_clinica", "args": {"dni": "12345678"}})
+        self.assertEqual([t["matricula"] for t in historia["resultado"]["turnos"]], [a, b])
+        self.assertEqual(len(historia["resultado"]["recetas"]), 1)
+        
+        medicos = self.clinica.ejecutar({"op": "obtener_medicos"})["resultado"]
+        self.assertEqual([m["matricula"] for m in medicos], self.matriculas)
+        libres = self.clinica.ejecutar({"op": "buscar_proximo_turno", "args": {
+            "especialidad": "Pediatría", "desde": "2025-12-08T08:00", "n": 4}})["resultado"]
+        self.assertEqual(len(libres), 4)
+        self.assertEqual(libres, sorted(libres, key=lambda l: (l["fecha_hora"], l["matricula"])))
+        self.assertEqual(len(self.clinica.ejecutar({"op": "obtener_pacientes"})["resultado"]), 2)
+    
+    def test_ids_de_turno_globales(self):
+        """Test para cancelar y reprogramar turnos de cualquier partición por id global"""
+        ids = set()
+        for matricula, dia in zip(self.matriculas, ["15", "16", "22"]):
+            agendado = self.clinica.ejecutar(turno("87654321", matricula, f"2025-12-{dia}T11:00"))
+            self.assertTrue(agendado["ok"], agendado)
+            ids.add(agendado["resultado"]["id_turno"])
+        self.assertEqual(len(ids), 3)
+        
+        id_turno = ids.pop()
+        movido = self.clinica.ejecutar({"op": "reprogramar_turno", "args": {
+            "id_turno": id_turno, "fecha_hora": "2025-12-15T12:00"}})
+        self.assertEqual(movido["resultado"]["id_turno"], id_turno)
+        for id_turno in [id_turno, *ids]:
+            self.assertTrue(self.clinica.ejecutar({"op": "cancelar_turno", "args": {"id_turno": id_turno}})["ok"])
+        otra_vez = self.clinica.ejecutar({"op": "cancelar_turno", "args": {"id_turno": id_turno}})
+        self.assertEqual(otra_vez["error"], "TurnoNoEncontradoException")
+    
+    def test_superposicion_del_paciente_entre_particiones(self):
+        """Test para rechazar turnos superpuestos del mismo paciente con médicos de otras particiones"""
+        a, b, c = self.matriculas
+        respuestas = self.clinica.ejecutar_varios([
+            turno("12345678", a, "2025-12-08T10:00"),
+            turno("12345678", b, "2025-12-08T10:15"),
+            turno("87654321", b, "2025-12-08T10:15"),
+            turno("12345678", c, "2025-12-08T10:30"),
+        ])
+        self.assertEqual([r["ok"] for r in respuestas], [True, False, True, True])
+        self.assertEqual(respuestas[1]["error"], "TurnoOcupadoException")
+        primero = respuestas[0]["resultado"]["id_turno"]
+
+        # El primero falla en su partición (médico ocupado): el segundo ya no choca
+        respuestas = self.clinica.ejecutar_varios([
+            turno("87654321", c, "2025-12-08T10:45"),
+            turno("87654321", a, "2025-12-08T10:45"),
+        ])
+        self.assertEqual([r["ok"] for r in respuestas], [False, True])
+        self.assertIn("del médico", respuestas[0]["mensaje"])
+
+        id_turno = self.clinica.ejecutar(turno("12345678", c, "2025-12-09T09:00"))["resultado"]["id_turno"]
+        reprogramar = {"op": "reprogramar_turno", "args": {"id_turno": id_turno, "fecha_hora": "2025-12-08T10:00"}}
+        self.assertEqual(self.clinica.ejecutar(reprogramar)["error"], "TurnoOcupadoException")
+
+        # Cancelado el turno que chocaba, la reprogramación del mismo bloque se acepta
+        cancelar = {"op": "cancelar_turno", "args": {"id_turno": primero}}
+        self.assertEqual([r["ok"] for r in self.clinica.ejecutar_varios([cancelar, reprogramar])], [True, True])
+
+    def test_listados_en_orden_de_alta(self):
+        """Test para listar médicos y turnos en el mismo orden que una clínica única"""
+        unica = Clinica(reloj=lambda: datetime(2025, 12, 1))
+        comandos = [paciente("12345678", "Juan Pérez"), paciente("87654321", "Ana Gómez")]
+        comandos += [medico(m, f"Dr. Médico {m}") for m in self.matriculas]
+        comandos += [medico(str(m), f"Dr. Médico {m}") for m in range(100, 106)]
+        comandos += [turno("87654321", str(m), f"2025-12-{dia}T09:00")
+                     for m, dia in zip(range(105, 99, -1), ["08", "09", "15", "16", "22", "23"])]
+        comandos += [turno("12345678", str(m), "2025-12-08T11:00") for m in range(100, 103)]
+        for comando in comandos:
+            ejecutar_comando(unica, comando)
+        self.clinica.ejecutar_varios(comandos[5:])
+        
+        for consulta in ({"op": "obtener_medicos"}, {"op": "obtener_turnos"},
+                         {"op": "buscar_medicos", "args": {"texto": "medico", "limite": 5}},
+                         {"op": "obtener_pacientes"}):
+            with self.subTest(consulta=consulta):
+                self.assertEqual(sin_ids(self.clinica.ejecutar(consulta)), sin_ids(ejecutar_comando(unica, consulta)))
+    
+    def test_errores(self):
+        """Test para informar errores igual que ejecutar_comando"""
+        respuestas = self.clinica.ejecutar_varios([
+            paciente("12345678", "Repetido"),
+            {"op": "inexistente"},
+            {"op": "agendar_turno", "args": {"dni": "12345678"}},
+            {"op": "obtener_historia_clinica", "args": {"dni": "99999999"}},
+            {"op": "obtener_lista_espera"},
+            [1, 2],
+        ])
+        self.assertEqual([r["error"] for r in respuestas],
+                         ["ValueError", "ValueError", "KeyError", "PacienteNoEncontradoException",
+                          "ValueError", "ValueError"])
+    
+    def test_valores_fuera_de_rango(self):
+        """Test para informar duraciones y fechas fuera de rango sin cortar el bloque"""
+        fuera_de_rango = [dict(turno("12345678", self.matriculas[0], "2025-12-08T10:00")) for _ in range(2)]
+        fuera_de_rango[0]["args"] = {**fuera_de_rango[0]["args"], "duracion_minutos": 1e20}
+        fuera_de_rango[1]["args"] = {**fuera_de_rango[1]["args"], "duracion_minutos": 5e9}
+        respuestas = self.clinica.ejecutar_varios(
+            fuera_de_rango + [turno("12345678", self.matriculas[0], "2025-12-08T10:00")]
+        )
+        self.assertEqual([r.get("error") for r in respuestas], ["ValueError", "OverflowError", None])
+    
+    def test_ejecutar_lote(self):
+        """Test para ejecutar un archivo de comandos repartido entre las particiones"""
+        comandos = "\n".join([
+            json.dumps(paciente("11111111", "Luis Díaz")),
+            json.dumps(turno("11111111", self.matriculas[0], "2025-12-22T10:00")),
+            "no es json",
+        ])
+        salida = io.StringIO()
+        self.assertEqual(ejecutar_lote(self.clinica, io.StringIO(comandos), salida), (3, 1))
+        respuestas = [json.loads(linea) for linea in salida.getvalue().splitlines()]
+        self.assertEqual([r["id"] for r in respuestas], [1, 2, 3])
+        self.assertEqual(respuestas[2]["error"], "JSONDecodeError")
+
+if __name__ == '__main__':
+    unittest.main()
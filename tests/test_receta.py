@@ -1,4 +1,5 @@
 import unittest
+from datetime import datetime
 from modelos import Receta, Paciente, Medico, Especialidad
 
 class TestReceta(unittest.TestCase):
@@ -16,6 +17,18 @@ class TestReceta(unittest.TestCase):
         self.assertIn("Paracetamol", str(receta))
         self.assertIn("Ibuprofeno", str(receta))
     
+    def test_crear_receta_con_fecha(self):
+        """Test para crear receta con fecha de emisión explícita"""
+        fecha = datetime(2025, 12, 8, 10, 0)
+        receta = Receta(self.paciente, self.medico, [" Paracetamol ", ""], fecha)
+        self.assertEqual(receta.obtener_fecha(), fecha)
+        self.assertEqual(receta.obtener_medicamentos(), ["Paracetamol"])
+    
+    def test_receta_sin_dict_por_instancia(self):
+        """Test para verificar que la receta usa __slots__"""
+        receta = Receta(self.paciente, self.medico, self.medicamentos)
+        self.assertFalse(hasattr(receta, "__dict__"))
+    
     def test_crear_receta_paciente_invalido(self):
         """Test para verificar error con paciente inválido"""
         with self.assertRaises(TypeError):
@@ -0,0 +1,83 @@
+import asyncio
+import json
+import unittest
+from modelos import Clinica, Paciente, Medico, Especialidad
+from servicio import ServidorClinica
+
+class ClinicaConFalla(Clinica):
+    """Clínica cuyo listado de médicos falla de forma inesperada"""
+
+    def obtener_medicos(self, offset=0, limite=None):
+        raise RuntimeError("falla inesperada")
+
+class TestServidor(unittest.IsolatedAsyncioTestCase):
+    
+    CLIENTES = 20
+    
+    async def asyncSetUp(self):
+        """Configuración inicial para cada test"""
+        self.clinica = Clinica()
+        for i in range(self.CLIENTES):
+            self.clinica.agregar_paciente(Paciente(f"Paciente {i}", f"{10000000 + i}", "01/01/1990"))
+        self.clinica.agregar_medico(Medico("Dr. García", "54321", [Especialidad("Pediatría", ["lunes"])]))
+        self.servidor = ServidorClinica(self.clinica)
+        self.puerto = await self.servidor.iniciar_tcp("127.0.0.1", 0)
+    
+    async def asyncTearDown(self):
+        await self.servidor.detener()
+    
+    async def enviar(self, lineas):
+        lector, escritor = await asyncio.open_connection("127.0.0.1", self.puerto)
+        respuestas = []
+        for linea in lineas:
+            escritor.write(linea.encode("utf-8") + b"\n")
+            await escritor.drain()
+            respuestas.append(json.loads(await lector.readline()))
+        escritor.close()
+        await escritor.wait_closed()
+        return respuestas
+    
+    async def test_clientes_concurrentes_mismo_horario(self):
+        """Test para verificar que solo un cliente obtiene un horario disputado"""
+        def pedido(i):
+            return json.dumps({"id": i, "op": "agendar_turno", "args": {
+                "dni": f"{10000000 + i}", "matricula": "54321",
+                "especialidad": "Pediatría", "fecha_hora": "2025-12-08T10:00"}})
+        
+        resultados = await asyncio.gather(*(self.enviar([pedido(i)]) for i in range(self.CLIENTES)))
+        respuestas = [r[0] for r in resultados]
+        self.assertEqual(sorted(r["id"] for r in respuestas), list(range(self.CLIENTES)))
+        self.assertEqual(sum(r["ok"] for r in respuestas), 1)
+        self.assertTrue(all(r["error"] == "TurnoOcupadoException" for r in respuestas if not r["ok"]))
+    
+    async def test_json_invalido_no_corta_la_conexion(self):
+        """Test para verificar que una línea inválida recibe error y la sesión continúa"""
+        respuestas = await self.enviar(["{no es json", '{"op": "obtener_medicos"}'])
+        self.assertEqual(respuestas[0]["error"], "JSONDecodeError")
+        self.assertEqual(respuestas[1]["resultado"][0]["matricula"], "54321")
+    
+    async def test_argumentos_de_tipo_invalido_no_cortan_la_conexion(self):
+        """Test para verificar que un argumento con tipo inesperado recibe error y la sesión continúa"""
+        respuestas = await self.enviar([
+            '{"op": "agregar_paciente", "args": {"nombre": 5, "dni": "1", "fecha_nacimiento": "01/01/1990"}}',
+            '{"op": "buscar_pacientes", "args": {"texto": null}}',
+            '{"op": "obtener_medicos"}',
+        ])
+        self.assertEqual([r["error"] for r in respuestas[:2]], ["TypeError", "TypeError"])
+        self.assertEqual(respuestas[2]["resultado"][0]["matricula"], "54321")
+
+    async def test_error_inesperado_no_corta_la_conexion(self):
+        """Test para responder un error inesperado y seguir atendiendo al cliente"""
+        await self.servidor.detener()
+        self.servidor = ServidorClinica(ClinicaConFalla())
+        self.puerto = await self.servidor.iniciar_tcp("127.0.0.1", 0)
+        respuestas = await self.enviar([
+            '{"id": 1, "op": "obtener_medicos"}',
+            '{"op": "agregar_paciente", "args": {"nombre": "Ana", "dni": "1", "fecha_nacimiento": "01/01/1990"}}',
+        ])
+        self.assertEqual(respuestas[0], {"ok": False, "error": "RuntimeError",
+                                         "mensaje": "falla inesperada", "id": 1})
+        self.assertTrue(respuestas[1]["ok"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,5 @@
 import unittest
-from datetime import datetime
+from datetime import datetime, timedelta
 from modelos import Turno, Paciente, Medico, Especialidad
 
 class TestTurno(unittest.TestCase):
@@ -17,6 +17,28 @@ class TestTurno(unittest.TestCase):
         self.assertEqual(turno.obtener_medico(), self.medico)
         self.assertEqual(turno.obtener_fecha_hora(), self.fecha_hora)
     
+    def test_duracion_del_turno(self):
+        """Test para verificar la duración por defecto, una explícita y el fin del turno"""
+        turno = Turno(self.paciente, self.medico, self.fecha_hora, "Pediatría")
+        self.assertEqual(turno.obtener_duracion(), Turno.DURACION_POR_DEFECTO)
+        largo = Turno(self.paciente, self.medico, self.fecha_hora, "Pediatría", timedelta(hours=1))
+        self.assertEqual(largo.obtener_fin(), datetime(2025, 12, 10, 15, 30))
+        with self.assertRaises(ValueError):
+            Turno(self.paciente, self.medico, self.fecha_hora, "Pediatría", timedelta(0))
+    
+    def test_id_del_turno(self):
+        """Test para verificar el id opcional del turno"""
+        self.assertIsNone(Turno(self.paciente, self.medico, self.fecha_hora, "Pediatría").obtener_id())
+        turno = Turno(self.paciente, self.medico, self.fecha_hora, "Pediatría", id_turno=7)
+        self.assertEqual(turno.obtener_id(), 7)
+    
+    def test_turno_sin_dict_por_instancia(self):
+        """Test para verificar que el turno usa __slots__ y no admite atributos nuevos"""
+        turno = Turno(self.paciente, self.medico, self.fecha_hora, "Pediatría")
+        self.assertFalse(hasattr(turno, "__dict__"))
+        with self.assertRaises(AttributeError):
+            turno.atributo_nuevo = 1
+    
     def test_crear_turno_paciente_invalido(self):
         """Test para verificar error con paciente inválido"""
         with self.assertRaises(TypeError):
@@ -0,0 +1,42 @@
+import unittest
+from modelos import VistaSecuencia
+
+class TestVistaSecuencia(unittest.TestCase):
+    
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.lista = [1, 2, 3, 4, 5]
+        self.vista = VistaSecuencia(self.lista)
+    
+    def test_lectura(self):
+        """Test para leer elementos, longitud y pertenencia"""
+        self.assertEqual(len(self.vista), 5)
+        self.assertEqual(self.vista[0], 1)
+        self.assertEqual(self.vista[-1], 5)
+        self.assertEqual(self.vista[1:3], [2, 3])
+        self.assertIn(4, self.vista)
+        self.assertEqual(self.vista, [1, 2, 3, 4, 5])
+    
+    def test_refleja_cambios_sin_copiar(self):
+        """Test para verificar que la vista refleja la lista interna"""
+        self.lista.append(6)
+        self.assertEqual(len(self.vista), 6)
+        self.assertEqual(list(self.vista), [1, 2, 3, 4, 5, 6])
+    
+    def test_no_permite_modificar(self):
+        """Test para verificar que la vista es de solo lectura"""
+        with self.assertRaises(TypeError):
+            self.vista[0] = 10
+        with self.assertRaises(AttributeError):
+            self.vista.append(6)
+    
+    def test_pagina(self):
+        """Test para obtener páginas con offset y límite"""
+        self.assertEqual(self.vista.pagina(1, 2), [2, 3])
+        self.assertEqual(self.vista.pagina(4, 10), [5])
+        self.assertEqual(self.vista.pagina(2), [3, 4, 5])
+        with self.assertRaises(ValueError):
+            self.vista.pagina(-1, 2)
+
+if __name__ == '__main__':
+    unittest.main()